@@ -42,157 +42,193 @@ https://github.com/nandkapadia/streamlit-lightweight-charts-pro
 """
 
 # Standard Imports
-import warnings
-from pathlib import Path
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Import from core package (options, series, utils, validators)
-from lightweight_charts_pro.charts.options import ChartOptions
-from lightweight_charts_pro.charts.options.layout_options import (
-    LayoutOptions,
-    PaneHeightOptions,
-)
-from lightweight_charts_pro.charts.options.trade_visualization_options import (
-    TradeVisualizationOptions,
-)
-from lightweight_charts_pro.charts.options.ui_options import LegendOptions
-from lightweight_charts_pro.charts.series import (
-    AreaSeries,
-    BandSeries,
-    BarSeries,
-    BaselineSeries,
-    CandlestickSeries,
-    GradientRibbonSeries,
-    HistogramSeries,
-    LineSeries,
-    RibbonSeries,
-    Series,
-    SignalSeries,
-    TrendFillSeries,
-)
-
-# Import chart utilities and validators from core
-from lightweight_charts_pro.charts.utils import PriceScaleConfig
-from lightweight_charts_pro.charts.validators import (
-    PriceScaleValidationError,
-    PriceScaleValidator,
-)
-from lightweight_charts_pro.data.annotation import (
-    AnnotationLayer,
-    AnnotationManager,
-    create_arrow_annotation,
-    create_shape_annotation,
-    create_text_annotation,
-)
-from lightweight_charts_pro.data.trade import TradeData
-
-# Import logging configuration from core
-from lightweight_charts_pro.logging_config import get_logger, setup_logging
-
-# Third Party Imports
-# (None in this module)
-# Local Imports
-from streamlit_lightweight_charts_pro.charts import Chart, ChartManager
-from streamlit_lightweight_charts_pro.data import (
-    Annotation,
-    AreaData,
-    BarData,
-    BaselineData,
-    CandlestickData,
-    HistogramData,
-    LineData,
-    Marker,
-    OhlcvData,
-    SignalData,
-    SingleValueData,
-)
-
-# Local Imports
-from streamlit_lightweight_charts_pro.type_definitions import (
-    ChartType,
-    ColumnNames,
-    LineStyle,
-    MarkerPosition,
-    MarkerShape,
-    TradeType,
-    TradeVisualization,
-)
+if TYPE_CHECKING:
+    # Resolved lazily at runtime by __getattr__; imported here for type checkers and IDEs
+    from lightweight_charts_pro.charts.options import ChartOptions
+    from lightweight_charts_pro.charts.options.layout_options import (
+        LayoutOptions,
+        PaneHeightOptions,
+    )
+    from lightweight_charts_pro.charts.options.trade_visualization_options import (
+        TradeVisualizationOptions,
+    )
+    from lightweight_charts_pro.charts.options.ui_options import LegendOptions
+    from lightweight_charts_pro.charts.utils import PriceScaleConfig
+    from lightweight_charts_pro.charts.validators import (
+        PriceScaleValidationError,
+        PriceScaleValidator,
+    )
+    from lightweight_charts_pro.data.annotation import (
+        AnnotationLayer,
+        AnnotationManager,
+        create_arrow_annotation,
+        create_shape_annotation,
+        create_text_annotation,
+    )
+    from lightweight_charts_pro.data.trade import TradeData
+    from lightweight_charts_pro.logging_config import get_logger, setup_logging
 
-# Import distribution function for package metadata access
-# Use modern importlib.metadata for Python 3.8+ with fallback for older versions
-try:
-    from importlib.metadata import distribution
-except ImportError:
-    # Fallback for Python < 3.8 - use backported importlib_metadata
-    # This ensures compatibility with older Python versions that don't have
-    # importlib.metadata in the standard library
-    from importlib_metadata import distribution  # type: ignore[assignment,no-redef]
+    from streamlit_lightweight_charts_pro.charts import (
+        BudgetPolicy,
+        Chart,
+        ChartGrid,
+        ChartManager,
+        ParallelMode,
+        PayloadBudget,
+    )
+    from streamlit_lightweight_charts_pro.charts.series import (
+        AreaSeries,
+        BandSeries,
+        BarSeries,
+        BaselineSeries,
+        CandlestickSeries,
+        GradientRibbonSeries,
+        HistogramSeries,
+        LineSeries,
+        RibbonSeries,
+        Series,
+        SignalSeries,
+        TrendFillSeries,
+    )
+    from streamlit_lightweight_charts_pro.data import (
+        Annotation,
+        AreaData,
+        BarData,
+        BaselineData,
+        CandlestickData,
+        HistogramData,
+        LineData,
+        Marker,
+        OhlcvData,
+        SignalData,
+        SingleValueData,
+    )
+    from streamlit_lightweight_charts_pro.type_definitions import (
+        ChartType,
+        ColumnNames,
+        LineStyle,
+        MarkerPosition,
+        MarkerShape,
+        TradeType,
+        TradeVisualization,
+    )
 
 
 # Version information for the package
 # This version number is used for package distribution and compatibility checks
 __version__ = "0.3.0"
 
+# Public names and the modules providing them. Importing the package itself
+# loads none of them: each module is imported on first attribute access
+# (PEP 562), so a page that only needs a few names does not pay for pandas,
+# Streamlit and every series and option class up front
+_EXPORTS_BY_MODULE: dict[str, tuple[str, ...]] = {
+    "lightweight_charts_pro.charts.options": ("ChartOptions",),
+    "lightweight_charts_pro.charts.options.layout_options": ("LayoutOptions", "PaneHeightOptions"),
+    "lightweight_charts_pro.charts.options.trade_visualization_options": (
+        "TradeVisualizationOptions",
+    ),
+    "lightweight_charts_pro.charts.options.ui_options": ("LegendOptions",),
+    "lightweight_charts_pro.charts.utils": ("PriceScaleConfig",),
+    "lightweight_charts_pro.charts.validators": (
+        "PriceScaleValidationError",
+        "PriceScaleValidator",
+    ),
+    "lightweight_charts_pro.data.annotation": (
+        "AnnotationLayer",
+        "AnnotationManager",
+        "create_arrow_annotation",
+        "create_shape_annotation",
+        "create_text_annotation",
+    ),
+    "lightweight_charts_pro.data.trade": ("TradeData",),
+    "lightweight_charts_pro.logging_config": ("get_logger", "setup_logging"),
+    "streamlit_lightweight_charts_pro.charts": (
+        "BudgetPolicy",
+        "Chart",
+        "ChartGrid",
+        "ChartManager",
+        "ParallelMode",
+        "PayloadBudget",
+    ),
+    "streamlit_lightweight_charts_pro.charts.series": (
+        "AreaSeries",
+        "BandSeries",
+        "BarSeries",
+        "BaselineSeries",
+        "CandlestickSeries",
+        "GradientRibbonSeries",
+        "HistogramSeries",
+        "LineSeries",
+        "RibbonSeries",
+        "Series",
+        "SignalSeries",
+        "TrendFillSeries",
+    ),
+    "streamlit_lightweight_charts_pro.data": (
+        "Annotation",
+        "AreaData",
+        "BarData",
+        "BaselineData",
+        "CandlestickData",
+        "HistogramData",
+        "LineData",
+        "Marker",
+        "OhlcvData",
+        "SignalData",
+        "SingleValueData",
+    ),
+    "streamlit_lightweight_charts_pro.type_definitions": (
+        "ChartType",
+        "ColumnNames",
+        "LineStyle",
+        "MarkerPosition",
+        "MarkerShape",
+        "TradeType",
+        "TradeVisualization",
+    ),
+}
+_LAZY_EXPORTS: dict[str, str] = {
+    name: module for module, names in _EXPORTS_BY_MODULE.items() for name in names
+}
 
-# Check if frontend is built on import (for development mode)
-def _check_frontend_build():
-    """Check if frontend is built and warn if not (development mode only).
+# Subpackages reachable as attributes of the package, as with eager imports
+_SUBMODULES = frozenset(
+    {"charts", "component", "data", "exceptions", "indicators", "type_definitions", "utils"}
+)
 
-    This function verifies that the required frontend assets exist for
-    the package to work correctly. It's only active in development mode
-    where the package is installed with the `-e` flag used.
 
-    The function performs the following checks:
-        1. Determines if the package is installed in development mode
-        2. Verifies the package location matches the current module location
-        3. Checks for the existence of frontend build artifacts
-        4. Issues a warning if frontend assets are missing
+def __getattr__(name: str) -> Any:
+    """Import a public name or subpackage on first access (PEP 562).
+
+    Args:
+        name: Attribute requested from the package.
 
     Returns:
-        None: This function has no return value, it warns if frontend is missing.
+        Any: The exported object or subpackage. It is cached in the package
+            namespace, so later lookups do not come back here.
 
     Raises:
-        ImportError: If importlib.metadata is not available.
-        OSError: If file system operations fail during path checking.
+        AttributeError: If the package has no such attribute.
     """
-    # Only check in development mode (when package is installed with -e)
-    try:
-        # Use importlib.metadata instead of deprecated pkg_resources
-        # This ensures compatibility with modern Python versions and provides
-        # better performance and reliability for package metadata access
-        dist = distribution("streamlit_lightweight_charts_pro")
-
-        # Verify this is a development install by checking file paths
-        # Compare the file location against the current module location
-        # This ensures we only check frontend assets in development mode
-        if dist.locate_file("") and Path(dist.locate_file("")).samefile(
-            Path(__file__).parent.parent,
-        ):
-            # Check for frontend build assets in development mode
-            # The frontend directory contains React/TypeScript source code
-            frontend_dir = Path(__file__).parent / "frontend"
-            # The build directory contains compiled frontend assets
-            build_dir = frontend_dir / "build"
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-            # Test existence of required frontend build artifacts
-            # Check if build directory exists and contains static assets
-            if not build_dir.exists() or not (build_dir / "static").exists():
-                # Issue warning with clear instructions for fixing the issue
-                warnings.warn(
-                    "Frontend assets not found in development mode. "
-                    "Run 'streamlit-lightweight-charts-pro build-frontend' to build them.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-    except (ImportError, OSError):
-        # Skip check if importlib.metadata is not available or
-        # if not in development mode (close the security wrapper)
-        # This prevents errors in production environments where the check isn't needed
-        pass
 
+def __dir__() -> list[str]:
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
 
-# Check frontend build on import (development mode only)
-# This ensures developers are notified if frontend assets are missing
-_check_frontend_build()
 
 # Export all public components for external use
 # This list defines what is available when importing from the main package
@@ -211,10 +247,12 @@ __all__ = [
     "BarSeries",
     "BaselineData",
     "BaselineSeries",
+    "BudgetPolicy",
     "CandlestickData",
     "CandlestickSeries",
     # Core chart classes
     "Chart",
+    "ChartGrid",
     "ChartManager",
     # Options
     "ChartOptions",
@@ -234,6 +272,9 @@ __all__ = [
     "MarkerShape",
     "OhlcvData",
     "PaneHeightOptions",
+    "ParallelMode",
+    # Payload guardrails
+    "PayloadBudget",
     # Price scale utilities
     "PriceScaleConfig",
     "PriceScaleValidationError",
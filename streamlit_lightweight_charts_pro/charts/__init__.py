@@ -52,8 +52,14 @@ License: MIT
 """
 
 # Streamlit-specific chart classes
-# Re-export series from core
-from lightweight_charts_pro.charts.series import (
+from streamlit_lightweight_charts_pro.charts.chart import Chart
+from streamlit_lightweight_charts_pro.charts.chart_grid import ChartGrid
+from streamlit_lightweight_charts_pro.charts.chart_manager import ChartManager
+from streamlit_lightweight_charts_pro.charts.parallel import ParallelMode
+from streamlit_lightweight_charts_pro.charts.payload_budget import BudgetPolicy, PayloadBudget
+
+# Series classes with column-backed DataFrame ingestion
+from streamlit_lightweight_charts_pro.charts.series import (
     AreaSeries,
     BandSeries,
     BarSeries,
@@ -68,9 +74,6 @@ from lightweight_charts_pro.charts.series import (
     TrendFillSeries,
 )
 
-from streamlit_lightweight_charts_pro.charts.chart import Chart
-from streamlit_lightweight_charts_pro.charts.chart_manager import ChartManager
-
 # Note: options is available via streamlit_lightweight_charts_pro.charts.options
 # (it's a separate module file that re-exports from core)
 
@@ -79,12 +82,16 @@ __all__ = [
     "BandSeries",
     "BarSeries",
     "BaselineSeries",
+    "BudgetPolicy",
     "CandlestickSeries",
     "Chart",
+    "ChartGrid",
     "ChartManager",
     "GradientRibbonSeries",
     "HistogramSeries",
     "LineSeries",
+    "ParallelMode",
+    "PayloadBudget",
     "RibbonSeries",
     "Series",
     "SignalSeries",
@@ -8,20 +8,27 @@ import time
 import uuid
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 from lightweight_charts_pro.charts import BaseChart
 from lightweight_charts_pro.charts.options import ChartOptions
 from lightweight_charts_pro.charts.series import Series
 from lightweight_charts_pro.data import Annotation
+from lightweight_charts_pro.exceptions import ValueValidationError
 
 # Streamlit-specific imports
 from streamlit_lightweight_charts_pro.charts.managers import (
     ChartRenderer,
+    SeriesManager,
     SessionStateManager,
 )
+from streamlit_lightweight_charts_pro.charts.payload_budget import PayloadBudget
+from streamlit_lightweight_charts_pro.charts.series import CandlestickSeries, LineSeries
 
 if TYPE_CHECKING:
     from streamlit_lightweight_charts_pro.charts.chart_manager import ChartManager
+    from streamlit_lightweight_charts_pro.data.bars import BarSlice
 
 
 class Chart(BaseChart):
@@ -54,6 +61,7 @@ class Chart(BaseChart):
         annotations: Optional[list[Annotation]] = None,
         chart_group_id: int = 0,
         chart_manager: Optional["ChartManager"] = None,
+        payload_budget: Optional[PayloadBudget] = None,
     ):
         """Initialize a Streamlit chart.
 
@@ -63,6 +71,8 @@ class Chart(BaseChart):
             annotations: Optional list of annotations to add.
             chart_group_id: Group ID for synchronization.
             chart_manager: Reference to the ChartManager that owns this chart.
+            payload_budget: Optional limit on the points and bytes this chart
+                sends to the browser, with the policy applied when exceeded.
         """
         # Initialize base chart with core logic
         super().__init__(
@@ -72,6 +82,10 @@ class Chart(BaseChart):
             chart_group_id=chart_group_id,
         )
 
+        # Use the column-backed series manager for DataFrame ingestion
+        self._series_manager = SeriesManager(self._series_manager.series)
+        self.series = self._series_manager.series
+
         # Initialize Streamlit-specific managers
         self._session_state_manager = SessionStateManager()
         self._chart_renderer = ChartRenderer(chart_manager_ref=chart_manager)
@@ -79,6 +93,121 @@ class Chart(BaseChart):
         # Reference to chart manager for sync configuration
         self._chart_manager = chart_manager
 
+        # Series configurations serialized ahead of time by ChartManager
+        self._pending_series_configs: Optional[list[dict[str, Any]]] = None
+
+        # Payload guardrail enforced by the renderer
+        self.payload_budget = payload_budget
+
+    def add_price_volume_series(
+        self,
+        data: Any,
+        column_mapping: Optional[dict] = None,
+        price_type: str = "candlestick",
+        price_kwargs=None,
+        volume_kwargs=None,
+        pane_id: int = 0,
+        time_unit: str = "auto",
+        display_timezone: Optional[str] = None,
+    ) -> "Chart":
+        """Add price and volume series to the chart.
+
+        Args:
+            data: OHLCV data as a list of OhlcvData or a pandas, PyArrow or
+                Polars table.
+            column_mapping: Column name mapping for table input.
+            price_type: Type of price series ('candlestick' or 'line').
+            price_kwargs: Additional price series arguments.
+            volume_kwargs: Additional volume series arguments.
+            pane_id: Pane ID for the series.
+            time_unit: Unit of a numeric epoch time column ("s", "ms", "us",
+                "ns" or "auto").
+            display_timezone: Optional timezone the time axis is shifted to.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._price_scale_manager.configure_for_volume()
+        self._series_manager.add_price_volume_series(
+            data=data,
+            column_mapping=column_mapping,
+            price_type=price_type,
+            price_kwargs=price_kwargs,
+            volume_kwargs=volume_kwargs,
+            pane_id=pane_id,
+            price_scale_manager=self._price_scale_manager,
+            time_unit=time_unit,
+            display_timezone=display_timezone,
+        )
+        return self
+
+    def add_bars(
+        self,
+        bars: "BarSlice",
+        price_type: str = "candlestick",
+        price_kwargs=None,
+        volume_kwargs=None,
+        pane_id: int = 0,
+        display_timezone: Optional[str] = None,
+    ) -> "Chart":
+        """Add price and volume series from a bar slice.
+
+        Slices come from a bar source such as ``BarStore`` or
+        ``SQLiteBarProvider``. Without a volume column (or with volume
+        missing for every bar) only the price series is added.
+
+        Args:
+            bars: Bars to display.
+            price_type: Type of price series ('candlestick' or 'line').
+            price_kwargs: Additional price series arguments.
+            volume_kwargs: Additional volume series arguments.
+            pane_id: Pane ID for the series.
+            display_timezone: Optional timezone the time axis is shifted to.
+
+        Returns:
+            Self for method chaining.
+        """
+        frame = pd.DataFrame(dict(bars.columns), copy=False)
+        volume = bars.columns.get("volume")
+        if volume is not None and len(bars) and not np.isnan(volume).all():
+            return self.add_price_volume_series(
+                data=frame,
+                price_type=price_type,
+                price_kwargs=price_kwargs,
+                volume_kwargs=volume_kwargs,
+                pane_id=pane_id,
+                time_unit="s",
+                display_timezone=display_timezone,
+            )
+
+        price_kwargs = {
+            "time_unit": "s",
+            "display_timezone": display_timezone,
+            **(price_kwargs or {}),
+        }
+        series: Union[CandlestickSeries, LineSeries]
+        if price_type == "candlestick":
+            fields = ("time", "open", "high", "low", "close")
+            series = CandlestickSeries(
+                frame,
+                column_mapping={field: field for field in fields},
+                pane_id=pane_id,
+                price_scale_id="right",
+                **price_kwargs,
+            )
+        elif price_type == "line":
+            series = LineSeries(
+                frame,
+                column_mapping={"time": "time", "value": "close"},
+                pane_id=pane_id,
+                price_scale_id="right",
+                **price_kwargs,
+            )
+        else:
+            raise ValueValidationError("price_type", "must be 'candlestick' or 'line'")
+        series._display_name = "Price"  # pylint: disable=protected-access
+        return self.add_series(series)
+
     def get_stored_series_config(
         self,
         key: str,
@@ -106,8 +235,8 @@ class Chart(BaseChart):
         Returns:
             Complete chart configuration ready for frontend rendering.
         """
-        # Get series configurations
-        series_configs = self._series_manager.to_frontend_configs()
+        # Get series configurations, reusing any serialized by a ChartManager pool
+        series_configs = self._series_manager.to_frontend_configs(self._pending_series_configs)
 
         # Get base chart configuration
         chart_config = (
@@ -181,8 +310,18 @@ class Chart(BaseChart):
         # Generate chart configuration after configs are applied
         config = self.to_frontend_config()
 
-        # Render component using ChartRenderer
-        result = self._chart_renderer.render(config, key, self.options)
+        # A page requested by the frontend triggered this rerun: render it now
+        self._session_state_manager.apply_pending_payload_page(key, per_chart=False)
+        page = self._session_state_manager.load_payload_pages(key).get(None, 0)
+
+        # Render component using ChartRenderer, enforcing the payload budget
+        result = self._chart_renderer.render(
+            config,
+            key,
+            self.options,
+            payload_budget=self.payload_budget,
+            page=page,
+        )
 
         # Handle component return value and save series configs
         if result:
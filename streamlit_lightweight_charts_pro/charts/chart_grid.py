@@ -0,0 +1,91 @@
+"""Chart grid for Streamlit Lightweight Charts.
+
+This module provides ChartGrid, a ChartManager that renders its charts as a
+grid inside a single component instance.
+"""
+
+from typing import Any, Optional, Union
+
+from streamlit_lightweight_charts_pro.charts.chart_manager import (
+    ChartManager,
+    validate_grid_layout,
+)
+from streamlit_lightweight_charts_pro.charts.parallel import ParallelMode
+from streamlit_lightweight_charts_pro.charts.payload_budget import PayloadBudget
+
+
+class ChartGrid(ChartManager):
+    """Many independent charts rendered as a grid in one component.
+
+    Each chart keeps its own series and options, but all of them share one
+    iframe, JS runtime, resize observer and message channel. Use it for
+    screener-style pages with many small charts instead of rendering each
+    Chart separately.
+
+    Example:
+        ```python
+        from streamlit_lightweight_charts_pro import Chart, ChartGrid, LineSeries
+
+        grid = ChartGrid(cols=4)
+        for symbol, frame in frames.items():
+            grid.add_chart(Chart(series=LineSeries(frame)), symbol)
+        grid.render(key="screener")
+        ```
+    """
+
+    def __init__(
+        self,
+        cols: int = 3,
+        gap: int = 8,
+        payload_budget: Optional[PayloadBudget] = None,
+        parallel: Optional[Union[ParallelMode, str]] = None,
+        max_workers: Optional[int] = None,
+        virtualize: bool = False,
+    ) -> None:
+        """Initialize the ChartGrid.
+
+        Args:
+            cols: Number of grid columns.
+            gap: Space between grid cells in pixels.
+            payload_budget: Optional limit on the points and bytes the whole
+                grid sends to the browser.
+            parallel: Optional worker pool ("thread" or "process") used to
+                serialize the charts concurrently.
+            max_workers: Maximum number of pool workers.
+            virtualize: Mount charts only when they scroll near the viewport.
+
+        Raises:
+            ValueValidationError: If cols is not positive or gap is negative.
+        """
+        validate_grid_layout(cols, gap)
+        super().__init__(
+            payload_budget=payload_budget,
+            parallel=parallel,
+            max_workers=max_workers,
+            virtualize=virtualize,
+        )
+        self.cols = cols
+        self.gap = gap
+
+    def render(
+        self,
+        key: Optional[str] = None,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None,
+    ) -> Any:
+        """Render the charts as a grid.
+
+        Args:
+            key: Optional key for the Streamlit component.
+            symbol: Optional symbol name for change detection.
+            interval: Optional interval for change detection.
+
+        Returns:
+            The rendered component.
+
+        Raises:
+            RuntimeError: If no charts have been added.
+        """
+        return self.render_grid(
+            cols=self.cols, key=key, gap=self.gap, symbol=symbol, interval=interval
+        )
@@ -8,8 +8,9 @@ import hashlib
 import json
 import time
 import uuid
-from collections.abc import Sequence
-from typing import Any, Optional, Union
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, Union
 
 import pandas as pd
 import streamlit as st
@@ -19,9 +20,44 @@ from lightweight_charts_pro.exceptions import (
     DuplicateError,
     NotFoundError,
     TypeValidationError,
+    ValueValidationError,
 )
 
 from streamlit_lightweight_charts_pro.charts.chart import Chart
+from streamlit_lightweight_charts_pro.charts.parallel import (
+    ParallelMode,
+    build_charts,
+    get_executor,
+    serialize_series,
+)
+from streamlit_lightweight_charts_pro.charts.payload_budget import (
+    PayloadBudget,
+    apply_payload_budget,
+)
+from streamlit_lightweight_charts_pro.data.async_source import (
+    AsyncDataSource,
+    FetchRequest,
+    fetch_all,
+)
+from streamlit_lightweight_charts_pro.data.bars import BarSource
+from streamlit_lightweight_charts_pro.data.columnar import ColumnarData
+from streamlit_lightweight_charts_pro.data.interop import is_table
+
+
+def validate_grid_layout(cols: int, gap: int) -> None:
+    """Validate the column count and cell gap of a chart grid.
+
+    Args:
+        cols: Number of grid columns.
+        gap: Space between grid cells in pixels.
+
+    Raises:
+        ValueValidationError: If cols is not positive or gap is negative.
+    """
+    if cols <= 0:
+        raise ValueValidationError.positive_value("cols", cols)
+    if gap < 0:
+        raise ValueValidationError("gap", "must be non-negative")
 
 
 class ChartManager(BaseChartManager):
@@ -52,6 +88,94 @@ class ChartManager(BaseChartManager):
     # Use Streamlit Chart class for factory methods
     chart_class = Chart
 
+    def __init__(
+        self,
+        payload_budget: Optional[PayloadBudget] = None,
+        parallel: Optional[Union[ParallelMode, str]] = None,
+        max_workers: Optional[int] = None,
+        virtualize: bool = False,
+    ) -> None:
+        """Initialize the ChartManager.
+
+        Args:
+            payload_budget: Optional limit on the points and bytes the whole
+                page sends to the browser. Budgets set on individual charts
+                are enforced first.
+            parallel: Optional worker pool ("thread" or "process") used to
+                serialize the series of all charts concurrently. None
+                serializes them one after another.
+            max_workers: Maximum number of pool workers; None uses the
+                concurrent.futures default.
+            virtualize: Mount each chart in the browser only when it scrolls
+                near the viewport and dispose charts far off-screen. Useful
+                for long dashboards with many charts.
+        """
+        super().__init__()
+        self.payload_budget = payload_budget
+        self.parallel: Optional[ParallelMode] = None
+        if parallel is not None:
+            try:
+                self.parallel = ParallelMode(parallel)
+            except ValueError as exc:
+                raise ValueValidationError("parallel", str(exc)) from exc
+        if max_workers is not None and max_workers <= 0:
+            raise ValueValidationError.positive_value("max_workers", max_workers)
+        self.max_workers = max_workers
+        self.virtualize = virtualize
+
+    @classmethod
+    def build_parallel(
+        cls,
+        symbols: Iterable[Any],
+        builder_fn: Callable[[Any], Chart],
+        executor: Optional[Executor] = None,
+        chart_id_fn: Callable[[Any], str] = str,
+        **kwargs: Any,
+    ) -> "ChartManager":
+        """Build one chart per symbol concurrently and manage them together.
+
+        ``builder_fn`` runs once per symbol on the executor and does the heavy
+        preparation (loading, resampling, indicators). On a process pool the
+        numeric columns of column-backed series come back through shared
+        memory instead of the result pickle; the charts are then added to the
+        manager on the calling thread, in symbol order.
+
+        Args:
+            symbols: Symbols (or any items) to build charts for.
+            builder_fn: Function returning a Chart for one symbol. Must be a
+                module-level function when run on a process pool.
+            executor: Pool to run the builders on. Defaults to the shared
+                process pool (sized by ``max_workers``).
+            chart_id_fn: Chart id of a symbol. Defaults to ``str``.
+            **kwargs: Arguments for the ChartManager constructor.
+
+        Returns:
+            ChartManager: Manager holding one chart per symbol.
+
+        Raises:
+            TypeValidationError: If builder_fn does not return a Chart.
+
+        Example:
+            ```python
+            def build(symbol: str) -> Chart:
+                bars = load_bars(symbol)
+                return Chart(series=CandlestickSeries(bars)).add_series(SMA(20).series(bars))
+
+
+            manager = ChartManager.build_parallel(["AAPL", "MSFT", "NVDA"], build)
+            manager.render(key="watchlist")
+            ```
+        """
+        manager = cls(**kwargs)
+        items = list(symbols)
+        if executor is None:
+            executor = get_executor(ParallelMode.PROCESS, manager.max_workers)
+        for item, chart in zip(items, build_charts(builder_fn, items, executor)):
+            if not isinstance(chart, Chart):
+                raise TypeValidationError("builder_fn result", "Chart")
+            manager.add_chart(chart, chart_id_fn(item))
+        return manager
+
     def add_chart(self, chart: Chart, chart_id: Optional[str] = None) -> "ChartManager":
         """Add a chart to the manager.
 
@@ -111,24 +235,31 @@ class ChartManager(BaseChartManager):
         price_kwargs=None,
         volume_kwargs=None,
         pane_id: int = 0,
+        time_unit: str = "auto",
+        display_timezone: Optional[str] = None,
     ) -> Chart:
         """Create a chart from OHLCV data with price and volume series.
 
         Args:
-            data: OHLCV data.
-            column_mapping: Column name mapping for DataFrame.
+            data: OHLCV data as a list of OhlcvData, a pandas DataFrame, a
+                PyArrow Table/RecordBatch or a Polars DataFrame.
+            column_mapping: Column name mapping for table input.
             price_type: Type of price series.
             chart_id: ID for the created chart.
             price_kwargs: Additional price series arguments.
             volume_kwargs: Additional volume series arguments.
             pane_id: Pane ID for the series.
+            time_unit: Unit of a numeric epoch time column ("s", "ms", "us",
+                "ns" or "auto").
+            display_timezone: Optional timezone the time axis is shifted to,
+                e.g. the exchange timezone.
 
         Returns:
             The created Chart instance.
         """
         if data is None:
             raise TypeValidationError("data", "list or DataFrame")
-        if not isinstance(data, (list, pd.DataFrame)):
+        if not isinstance(data, list) and not is_table(data):
             raise TypeValidationError("data", "list or DataFrame")
 
         chart = Chart()
@@ -139,6 +270,8 @@ class ChartManager(BaseChartManager):
             price_kwargs=price_kwargs,
             volume_kwargs=volume_kwargs,
             pane_id=pane_id,
+            time_unit=time_unit,
+            display_timezone=display_timezone,
         )
 
         # Set the ChartManager reference on the chart
@@ -147,6 +280,133 @@ class ChartManager(BaseChartManager):
         self.add_chart(chart, chart_id=chart_id)
         return chart
 
+    def from_bar_source(
+        self,
+        source: BarSource,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        count: Optional[int] = None,
+        chart_id: Optional[str] = None,
+        price_type: str = "candlestick",
+        price_kwargs=None,
+        volume_kwargs=None,
+        pane_id: int = 0,
+        display_timezone: Optional[str] = None,
+    ) -> Chart:
+        """Create a chart from the bars of a bar source.
+
+        With ``count``, loads the last ``count`` bars before ``end``
+        (exclusive); pass the oldest loaded time as ``end`` to page back.
+        Otherwise loads the bars between ``start`` and ``end``. When the
+        source also stores trades (it has ``read_trades``), the trades
+        overlapping the loaded bars are added too.
+
+        Args:
+            source: Bar source, e.g. ``BarStore`` or ``SQLiteBarProvider``.
+            symbol: Symbol to load.
+            interval: Interval to load.
+            start: First time to load, for range loads.
+            end: Last time to load (exclusive with ``count``).
+            count: Number of most recent bars to load.
+            chart_id: ID for the created chart. Defaults to the symbol.
+            price_type: Type of price series ('candlestick' or 'line').
+            price_kwargs: Additional price series arguments.
+            volume_kwargs: Additional volume series arguments.
+            pane_id: Pane ID for the series.
+            display_timezone: Optional timezone the time axis is shifted to.
+
+        Returns:
+            The created Chart instance.
+
+        Raises:
+            TypeValidationError: If source is not a bar source.
+            ValueValidationError: If no bars are found.
+        """
+        if not isinstance(source, BarSource):
+            raise TypeValidationError("source", "BarSource")
+        if count is not None:
+            bars = source.tail(symbol, interval, count, end=end)
+        else:
+            bars = source.read(symbol, interval, start=start, end=end)
+        if not len(bars):
+            raise ValueValidationError("bars", f"none found for {symbol} {interval}")
+
+        chart = Chart()
+        chart.add_bars(
+            bars,
+            price_type=price_type,
+            price_kwargs=price_kwargs,
+            volume_kwargs=volume_kwargs,
+            pane_id=pane_id,
+            display_timezone=display_timezone,
+        )
+        read_trades = getattr(source, "read_trades", None)
+        if read_trades is not None:
+            trades = read_trades(symbol, bars.start, bars.end)
+            if trades:
+                chart.add_trades(trades)
+
+        self.add_chart(chart, chart_id=chart_id or symbol)
+        return chart
+
+    def fetch_data(
+        self,
+        requests: Mapping[Hashable, Union[FetchRequest, AsyncDataSource]],
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> dict[Hashable, Any]:
+        """Fetch the data of the managed charts concurrently.
+
+        Runs every load on the shared fetch event loop at once, so the page
+        waits for the slowest load rather than their sum. See ``fetch_all``.
+
+        Args:
+            requests: Loads by key, e.g. "prices", "trades", "signals".
+            timeout: Seconds each load may take, unless its request sets its
+                own. Defaults to None (no limit).
+            return_exceptions: Return the exception of a failed load as its
+                result instead of raising it. Defaults to False.
+
+        Returns:
+            dict: Results by key, in the order of ``requests``.
+
+        Raises:
+            DataFetchTimeoutError: If a load times out (and return_exceptions
+                is False).
+        """
+        return fetch_all(requests, timeout=timeout, return_exceptions=return_exceptions)
+
+    def to_frontend_config(self) -> dict[str, Any]:
+        """Convert the chart manager to frontend configuration.
+
+        When a parallel mode is set, the series of all charts are serialized
+        on the shared worker pool first. Results are collected in submission
+        order, so the configuration is identical to a sequential build.
+
+        Returns:
+            Dictionary containing the frontend configuration.
+        """
+        if self.parallel is None:
+            return super().to_frontend_config()
+
+        charts = list(self.charts.values())
+        flat_series = [series for chart in charts for series in chart.series]
+        if len(flat_series) < 2:
+            return super().to_frontend_config()
+
+        executor = get_executor(self.parallel, self.max_workers)
+        serialized = iter(executor.map(serialize_series, flat_series))
+        try:
+            for chart in charts:
+                # pylint: disable=protected-access
+                chart._pending_series_configs = [next(serialized) for _ in chart.series]
+            return super().to_frontend_config()
+        finally:
+            for chart in charts:
+                chart._pending_series_configs = None  # pylint: disable=protected-access
+
     def _auto_detect_changes(self, key: str) -> None:
         """Automatically detect changes and set force_reinit if needed.
 
@@ -172,8 +432,11 @@ class ChartManager(BaseChartManager):
                 data_hash = None
                 if hasattr(series, "data") and series.data:
                     try:
-                        data_str = str(series.data)
-                        data_hash = hashlib.md5(data_str.encode()).hexdigest()[:8]  # noqa: S324
+                        if isinstance(series.data, ColumnarData):
+                            data_hash = series.data.fingerprint()
+                        else:
+                            data_bytes = str(series.data).encode()
+                            data_hash = hashlib.md5(data_bytes).hexdigest()[:8]  # noqa: S324
                     except (ValueError, TypeError, AttributeError):
                         data_hash = None
 
@@ -227,6 +490,50 @@ class ChartManager(BaseChartManager):
         Raises:
             RuntimeError: If no charts have been added.
         """
+        return self._render(key, symbol, interval)
+
+    def render_grid(
+        self,
+        cols: int = 3,
+        key: Optional[str] = None,
+        gap: int = 8,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None,
+    ) -> Any:
+        """Render all charts as a grid inside a single component instance.
+
+        The charts stay independent (own series, scales and options) but share
+        one iframe, one JS runtime, one resize observer and one message
+        channel, so a page of many small charts loads and scales with the
+        amount of data rather than with the number of charts. Charts without
+        an explicit width fill their grid cell.
+
+        Args:
+            cols: Number of grid columns.
+            key: Optional key for the Streamlit component.
+            gap: Space between grid cells in pixels.
+            symbol: Optional symbol name for change detection.
+            interval: Optional interval for change detection.
+
+        Returns:
+            The rendered component.
+
+        Raises:
+            RuntimeError: If no charts have been added.
+            ValueValidationError: If cols is not positive or gap is negative.
+        """
+        validate_grid_layout(cols, gap)
+        layout = {"type": "grid", "cols": cols, "gap": gap}
+        return self._render(key, symbol, interval, layout=layout)
+
+    def _render(
+        self,
+        key: Optional[str],
+        symbol: Optional[str],
+        interval: Optional[str],
+        layout: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Render the charts with an optional layout (see ``render``)."""
         if not self.charts:
             raise RuntimeError("Cannot render ChartManager with no charts")
 
@@ -259,11 +566,30 @@ class ChartManager(BaseChartManager):
         # Generate frontend configuration
         config = self.to_frontend_config()
 
-        # Render using first chart's renderer
+        if self.virtualize:
+            config["virtualize"] = {}
+        if layout is not None:
+            config["layout"] = layout
+            if layout.get("type") == "grid":
+                # Grid cells size the charts unless a fixed width is set
+                for chart_obj in config["charts"]:
+                    if not chart_obj.get("chart", {}).get("width"):
+                        chart_obj["autoWidth"] = True
+
+        # A page requested by the frontend triggered this rerun: render it now
         first_chart = next(iter(self.charts.values()))
-        result = first_chart._chart_renderer.render(
-            config, key, None
-        )  # pylint: disable=protected-access
+        state = first_chart._session_state_manager  # pylint: disable=protected-access
+        state.apply_pending_payload_page(key)
+        pages = state.load_payload_pages(key)
+
+        # Enforce per-chart budgets; the page budget is enforced by the renderer
+        for chart, chart_obj in zip(self.charts.values(), config["charts"]):
+            apply_payload_budget({"charts": [chart_obj]}, chart.payload_budget, pages)
+
+        # Render using first chart's renderer
+        result = first_chart._chart_renderer.render(  # pylint: disable=protected-access
+            config, key, None, payload_budget=self.payload_budget, page=pages
+        )
 
         # Handle response for each chart
         if result:
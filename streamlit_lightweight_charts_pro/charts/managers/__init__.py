@@ -11,12 +11,12 @@ Streamlit-specific managers are defined in this package.
 # Core managers (re-exported from core)
 from lightweight_charts_pro.charts.managers import (
     PriceScaleManager,
-    SeriesManager,
     TradeManager,
 )
 
 # Streamlit-specific managers
 from streamlit_lightweight_charts_pro.charts.managers.chart_renderer import ChartRenderer
+from streamlit_lightweight_charts_pro.charts.managers.series_manager import SeriesManager
 from streamlit_lightweight_charts_pro.charts.managers.session_state_manager import (
     SessionStateManager,
 )
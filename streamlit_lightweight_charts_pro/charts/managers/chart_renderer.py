@@ -2,16 +2,32 @@
 
 This module handles the generation of frontend configuration and rendering
 of chart components in Streamlit.
+
+Series in one chart that share an identical time vector (for example a price
+series, its volume and indicators computed from the same DataFrame) have the
+vector emitted once per chart under ``timeAxes``. Each such series carries a
+``timeAxis`` id and time-less data points, and the frontend restores the
+``time`` field before creating the series.
 """
 
+import hashlib
 import html
 import json
+import logging
+from collections.abc import Mapping
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
+import numpy as np
 import streamlit.components.v1 as components
+from lightweight_charts_pro.exceptions import TimeValidationError, ValueValidationError
 from lightweight_charts_pro.logging_config import get_logger
 
+from streamlit_lightweight_charts_pro.charts.payload_budget import (
+    PayloadBudget,
+    apply_payload_budget,
+)
+from streamlit_lightweight_charts_pro.charts.payload_buffers import encode_column_buffers
 from streamlit_lightweight_charts_pro.charts.series_settings_api import (
     get_series_settings_api,
 )
@@ -19,6 +35,7 @@ from streamlit_lightweight_charts_pro.component import (
     get_component_func,
     reinitialize_component,
 )
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
 from streamlit_lightweight_charts_pro.exceptions import ComponentNotAvailableError
 
 if TYPE_CHECKING:
@@ -88,12 +105,17 @@ class ChartRenderer:
             series_configs,
         )
 
+        # Deduplicate shared time vectors after range filtering, which reads them
+        time_axes = self._share_time_axes(series_configs)
+
         chart_obj: dict[str, Any] = {
             "chartId": chart_id,
             "chart": chart_config,
             "series": series_configs,
             "annotations": annotations_config,
         }
+        if time_axes:
+            chart_obj["timeAxes"] = time_axes
 
         # Add trades configuration if present
         if trades_config:
@@ -116,6 +138,55 @@ class ChartRenderer:
 
         return config
 
+    def _share_time_axes(self, series_configs: list[dict[str, Any]]) -> dict[str, list[Any]]:
+        """Emit time vectors shared by several series once per chart.
+
+        Series whose data points carry exactly the same sequence of times are
+        grouped. For every group with at least two series, the time vector is
+        returned under a new axis id, each series config gets a ``timeAxis``
+        reference and ``time`` is removed from its data points. The configs
+        and their data points are modified in place.
+
+        Args:
+            series_configs: List of series configurations.
+
+        Returns:
+            Mapping of axis id to time vector; empty if no vector is shared.
+        """
+        groups: dict[tuple[int, bytes], list[int]] = {}
+        vectors: dict[tuple[int, bytes], list[Any]] = {}
+        for index, series_config in enumerate(series_configs):
+            data = series_config.get("data")
+            if not isinstance(data, list) or not data:
+                continue
+            try:
+                times = [point["time"] for point in data]
+            except (KeyError, TypeError):
+                continue
+            signature = (len(times), hashlib.md5(repr(times).encode()).digest())  # noqa: S324
+            groups.setdefault(signature, []).append(index)
+            vectors.setdefault(signature, times)
+
+        time_axes: dict[str, list[Any]] = {}
+        for signature, indices in groups.items():
+            if len(indices) < 2:
+                continue
+            axis_id = f"t{len(time_axes)}"
+            time_axes[axis_id] = vectors[signature]
+            for index in indices:
+                series_config = series_configs[index]
+                for point in series_config["data"]:
+                    del point["time"]
+                series_config["timeAxis"] = axis_id
+
+        if time_axes:
+            logger.debug(
+                "Shared %d time axes across %d series",
+                len(time_axes),
+                sum(len(indices) for indices in groups.values() if len(indices) > 1),
+            )
+        return time_axes
+
     def _get_sync_config(self, chart_group_id: int) -> dict[str, Any]:
         """Get synchronization configuration from ChartManager.
 
@@ -216,27 +287,34 @@ class ChartRenderer:
             if not data:
                 continue
 
-            for data_point in data:
-                time_value = None
-
-                # Extract time from various data formats
-                if isinstance(data_point, dict) and "time" in data_point:
-                    time_value = data_point["time"]
-                elif hasattr(data_point, "time"):
-                    time_value = data_point.time
-
-                if time_value is None:
-                    continue
+            # Extract time from various data formats
+            time_values = [
+                point.get("time") if isinstance(point, dict) else getattr(point, "time", None)
+                for point in data
+            ]
+            time_values = [time_value for time_value in time_values if time_value is not None]
+            if not time_values:
+                continue
 
-                # Convert time to timestamp
-                timestamp = self._convert_time_to_timestamp(time_value)
-                if timestamp is None:
+            # Convert the whole column at once; serialized times are already
+            # epoch seconds, so the unit is fixed rather than auto-detected
+            try:
+                timestamps = normalize_time_array(time_values, unit="s")
+            except (TimeValidationError, ValueValidationError):
+                timestamps = [
+                    timestamp
+                    for timestamp in map(self._convert_time_to_timestamp, time_values)
+                    if timestamp is not None
+                ]
+                if not timestamps:
                     continue
 
-                if min_time is None or timestamp < min_time:
-                    min_time = timestamp
-                if max_time is None or timestamp > max_time:
-                    max_time = timestamp
+            series_min = float(np.min(timestamps))
+            series_max = float(np.max(timestamps))
+            if min_time is None or series_min < min_time:
+                min_time = series_min
+            if max_time is None or series_max > max_time:
+                max_time = series_max
 
         if min_time is None or max_time is None:
             return None
@@ -311,6 +389,8 @@ class ChartRenderer:
         config: dict[str, Any],
         key: str,
         chart_options: Any,
+        payload_budget: Optional[PayloadBudget] = None,
+        page: Union[int, Mapping[str, int]] = 0,
     ) -> Any:
         """Render the chart in Streamlit.
 
@@ -318,21 +398,39 @@ class ChartRenderer:
             config: Complete frontend configuration.
             key: Unique key for the Streamlit component (already validated).
             chart_options: Chart options for extracting height/width.
+            payload_budget: Optional budget enforced on the configuration
+                before rendering.
+            page: Window index for the truncate budget policy, or window
+                indexes by chart id.
 
         Returns:
             The rendered Streamlit component.
 
         Raises:
             ComponentNotAvailableError: If component cannot be loaded.
+            PayloadBudgetExceededError: If the budget is exceeded and its
+                policy is "raise".
         """
+        config = apply_payload_budget(config, payload_budget, page)
+
+        # Send large numeric series as binary columns instead of JSON points
+        buffers = encode_column_buffers(config)
+        if payload_budget is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Actual encoded payload size: %d bytes (+%d bytes of column buffers)",
+                len(json.dumps(config)),
+                len(buffers or b""),
+            )
+
         # Render component with frontend configuration
-        return self._render_component(config, key, chart_options)
+        return self._render_component(config, key, chart_options, buffers)
 
     def _render_component(
         self,
         config: dict[str, Any],
         key: str,
         chart_options: Any,
+        buffers: Optional[bytes] = None,
     ) -> Any:
         """Internal method to render the Streamlit component.
 
@@ -340,6 +438,8 @@ class ChartRenderer:
             config: Complete frontend configuration.
             key: Unique key for the Streamlit component.
             chart_options: Chart options for extracting height/width.
+            buffers: Optional binary column buffers referenced by
+                ``columns`` entries of the series configurations.
 
         Returns:
             The rendered Streamlit component.
@@ -359,6 +459,8 @@ class ChartRenderer:
 
         # Build component kwargs
         kwargs: dict[str, Any] = {"config": config}
+        if buffers is not None:
+            kwargs["buffers"] = buffers
 
         # Extract height and width from chart options
         if chart_options:
@@ -0,0 +1,222 @@
+"""Series management for Chart component.
+
+This module extends the core SeriesManager so that price and volume series
+built from a table (pandas, PyArrow or Polars) use the column-backed series
+classes instead of one data object per row.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional, Union
+
+import pandas as pd
+from lightweight_charts_pro.charts.managers import SeriesManager as BaseSeriesManager
+from lightweight_charts_pro.charts.options.price_scale_options import (
+    PriceScaleMargins,
+    PriceScaleOptions,
+)
+from lightweight_charts_pro.constants import (
+    HISTOGRAM_DOWN_COLOR_DEFAULT,
+    HISTOGRAM_UP_COLOR_DEFAULT,
+)
+from lightweight_charts_pro.data import OhlcvData
+from lightweight_charts_pro.exceptions import TypeValidationError, ValueValidationError
+from lightweight_charts_pro.type_definitions.enums import ColumnNames, PriceScaleMode
+
+from streamlit_lightweight_charts_pro.charts.series import (
+    CandlestickSeries,
+    HistogramSeries,
+    LineSeries,
+)
+from streamlit_lightweight_charts_pro.data.interop import is_table, num_rows
+
+# Default column mapping for OHLCV DataFrames
+_DEFAULT_PRICE_VOLUME_MAPPING = {
+    "time": "time",
+    "open": "open",
+    "high": "high",
+    "low": "low",
+    "close": "close",
+    "volume": "volume",
+}
+
+
+class SeriesManager(BaseSeriesManager):
+    """Series manager with column-backed price and volume ingestion.
+
+    All series list operations are inherited from the core SeriesManager.
+    Table input to ``add_price_volume_series`` (pandas DataFrame, PyArrow
+    Table/RecordBatch or Polars DataFrame) is ingested column-wise; lists of
+    OhlcvData objects are handled by the core implementation.
+    """
+
+    def add_price_volume_series(
+        self,
+        data: Union[Sequence[OhlcvData], pd.DataFrame, Any],
+        column_mapping: Optional[dict],
+        price_type: str = "candlestick",
+        price_kwargs: Optional[dict] = None,
+        volume_kwargs: Optional[dict] = None,
+        pane_id: int = 0,
+        price_scale_manager: Optional[Any] = None,
+        time_unit: str = "auto",
+        display_timezone: Optional[str] = None,
+    ) -> None:
+        """Add price and volume series to the chart.
+
+        Args:
+            data: OHLCV data containing price and volume information.
+            column_mapping: Mapping of column names for DataFrame conversion.
+                Defaults to the identity mapping of the OHLCV field names.
+            price_type: Type of price series ('candlestick' or 'line').
+            price_kwargs: Additional arguments for price series configuration.
+                Sanitation options (``sanitize``, ``duplicates``) given here
+                also apply to the volume series.
+            volume_kwargs: Additional arguments for volume series configuration.
+            pane_id: Pane ID for both price and volume series.
+            price_scale_manager: Optional PriceScaleManager for price scale config.
+            time_unit: Unit of a numeric epoch time column ("s", "ms", "us",
+                "ns" or "auto"). Only used for table input.
+            display_timezone: Optional timezone the time axis is shifted to.
+                Only used for table input.
+
+        Raises:
+            TypeValidationError: If column_mapping is not a dict.
+            ValueValidationError: If price_type is invalid, pane_id is negative
+                or required column_mapping keys are missing.
+        """
+        if not is_table(data):
+            super().add_price_volume_series(
+                data=data,
+                column_mapping=column_mapping,
+                price_type=price_type,
+                price_kwargs=price_kwargs,
+                volume_kwargs=volume_kwargs,
+                pane_id=pane_id,
+                price_scale_manager=price_scale_manager,
+            )
+            return
+
+        if num_rows(data) == 0:
+            raise ValueValidationError("data", "must be a non-empty list or DataFrame")
+        if column_mapping is None:
+            column_mapping = _DEFAULT_PRICE_VOLUME_MAPPING
+        if not isinstance(column_mapping, dict):
+            raise TypeValidationError("column_mapping", "dict")
+        column_mapping = column_mapping.copy()
+
+        required_keys = {"time", "volume"}
+        if price_type == "candlestick":
+            required_keys.update({"open", "high", "low", "close"})
+        elif price_type == "line":
+            required_keys.add("close")
+        else:
+            raise ValueValidationError("price_type", "must be 'candlestick' or 'line'")
+
+        missing_keys = required_keys - column_mapping.keys()
+        if missing_keys:
+            raise ValueValidationError("column_mapping", f"missing required keys: {missing_keys}")
+        if pane_id < 0:
+            raise ValueValidationError("pane_id", "must be non-negative")
+
+        price_kwargs = {
+            "time_unit": time_unit,
+            "display_timezone": display_timezone,
+            **(price_kwargs or {}),
+        }
+        volume_kwargs = volume_kwargs or {}
+        # Volume must be sanitized like the price series so both keep the same time axis
+        sanitize_kwargs = {
+            key: price_kwargs[key] for key in ("sanitize", "duplicates") if key in price_kwargs
+        }
+
+        # Price series reads only the columns it needs from the DataFrame
+        price_series: Union[CandlestickSeries, LineSeries]
+        if price_type == "candlestick":
+            price_series = CandlestickSeries(
+                data=data,
+                column_mapping={
+                    k: v
+                    for k, v in column_mapping.items()
+                    if k in ["time", "open", "high", "low", "close"]
+                },
+                pane_id=pane_id,
+                price_scale_id="right",
+                **price_kwargs,
+            )
+        else:
+            line_mapping = {
+                "time": column_mapping["time"],
+                "value": column_mapping.get("value", column_mapping["close"]),
+            }
+            price_series = LineSeries(
+                data=data,
+                column_mapping=line_mapping,
+                pane_id=pane_id,
+                price_scale_id="right",
+                **price_kwargs,
+            )
+        price_series._display_name = "Price"  # pylint: disable=protected-access
+
+        if price_scale_manager is not None:
+            price_scale_manager.add_overlay_scale(
+                ColumnNames.VOLUME.value,
+                PriceScaleOptions(
+                    visible=False,
+                    auto_scale=True,
+                    border_visible=False,
+                    mode=PriceScaleMode.NORMAL,
+                    scale_margins=PriceScaleMargins(top=0.85, bottom=0.0),
+                ),
+            )
+
+        volume_series = HistogramSeries.create_volume_series(
+            data=data,
+            column_mapping=column_mapping,
+            up_color=volume_kwargs.get("up_color", HISTOGRAM_UP_COLOR_DEFAULT),
+            down_color=volume_kwargs.get("down_color", HISTOGRAM_DOWN_COLOR_DEFAULT),
+            pane_id=pane_id,
+            price_scale_id=ColumnNames.VOLUME.value,
+            time_unit=time_unit,
+            display_timezone=display_timezone,
+            **sanitize_kwargs,
+        )
+        volume_series.base = volume_kwargs.get("base", 0)
+        volume_series.price_format = {"type": "volume", "precision": 0}
+        volume_series._display_name = "Volume"  # pylint: disable=protected-access
+
+        self.add_series(price_series, price_scale_manager)
+        self.add_series(volume_series, price_scale_manager)
+
+    def to_frontend_configs(
+        self, series_configs: Optional[list[dict[str, Any]]] = None
+    ) -> list[dict[str, Any]]:
+        """Convert all series to frontend configuration dictionaries.
+
+        Groups series by pane and sorts by z-index for proper layering.
+
+        Args:
+            series_configs: Optional configurations already produced by
+                ``asdict()`` for each series, in ``self.series`` order (e.g.
+                serialized by a worker pool). When omitted the series are
+                serialized here.
+
+        Returns:
+            List of series configuration dictionaries.
+        """
+        if series_configs is None:
+            return super().to_frontend_configs()
+
+        series_by_pane: dict[int, list[dict[str, Any]]] = {}
+        for series_config in series_configs:
+            pane_id = 0
+            if isinstance(series_config, dict):
+                pane_id = series_config.get("options", {}).get("paneId", 0)
+            series_by_pane.setdefault(pane_id, []).append(series_config)
+
+        def z_index(config: Any) -> Any:
+            return config.get("options", {}).get("zIndex", 0) if isinstance(config, dict) else 0
+
+        ordered = []
+        for pane_id in sorted(series_by_pane):
+            ordered.extend(sorted(series_by_pane[pane_id], key=z_index))
+        return ordered
@@ -4,7 +4,7 @@ This module handles session state persistence for series configurations,
 allowing chart state to be maintained across Streamlit reruns.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 import streamlit as st
 from lightweight_charts_pro.logging_config import get_logger
@@ -169,6 +169,60 @@ class SessionStateManager:
         # Mark configs as applied for this render cycle
         self.configs_applied = True
 
+    def save_payload_page(self, key: str, page: int, chart_id: Optional[str] = None) -> None:
+        """Save the payload window page requested by the frontend.
+
+        Args:
+            key: Component key used to namespace the stored pages.
+            page: Window index for the truncate budget policy.
+            chart_id: Chart the page belongs to. None for components holding
+                a single chart.
+        """
+        if not key:
+            return
+
+        session_key = f"_chart_payload_page_{key}"
+        pages = dict(st.session_state.get(session_key, {}))
+        pages[chart_id] = max(int(page), 0)
+        st.session_state[session_key] = pages
+
+    def load_payload_pages(self, key: str) -> dict[Optional[str], int]:
+        """Load the payload window pages of a component.
+
+        Args:
+            key: Component key used to namespace the stored pages.
+
+        Returns:
+            Stored window index by chart id (None for a single chart). Charts
+            without an entry show the most recent window (page 0).
+        """
+        if not key:
+            return {}
+
+        return st.session_state.get(f"_chart_payload_page_{key}", {})
+
+    def apply_pending_payload_page(self, key: str, per_chart: bool = True) -> None:
+        """Save a page request still held in the component value.
+
+        The frontend requests a page by setting the component value, which is
+        available in ``st.session_state[key]`` at the start of the rerun it
+        triggers. Saving it before the payload budget is applied lets that
+        rerun render the requested window.
+
+        Args:
+            key: Component key used to namespace the stored pages.
+            per_chart: Save the page under the id of the requesting chart.
+                False for components holding a single chart, whose id is not
+                stable across reruns.
+        """
+        if not key:
+            return
+
+        value = st.session_state.get(key)
+        if isinstance(value, dict) and value.get("type") == "payload_page":
+            chart_id = value.get("chartId") if per_chart else None
+            self.save_payload_page(key, value.get("page", 0), chart_id)
+
     def reset_config_applied_flag(self) -> None:
         """Reset the config application flag for a new render cycle."""
         self.configs_applied = False
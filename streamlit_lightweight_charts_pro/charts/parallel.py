@@ -0,0 +1,299 @@
+"""Worker pools for parallel chart serialization.
+
+ChartManager can serialize the series of all its charts concurrently instead
+of one after another. Pools are created on first use and kept for the life
+of the process, so Streamlit reruns reuse warm workers instead of paying the
+start-up cost on every render.
+
+Two pool kinds are available:
+
+- "thread": cheap to start and shares memory with the app. It speeds up
+  series whose serialization is dominated by NumPy/pandas work that releases
+  the GIL.
+- "process": sidesteps the GIL entirely. Series are pickled to the workers
+  (column-backed series pickle as raw NumPy buffers) and the payloads are
+  pickled back, so it pays off for large series on multi-core hosts.
+
+Results are always returned in submission order, so the frontend payload is
+identical to the sequential one.
+
+``ChartManager.build_parallel`` goes one step further and builds whole charts
+in worker processes. The numeric columns of their column-backed series come
+back through one ``multiprocessing.shared_memory`` block per chart instead of
+the result pickle, so only the light chart skeleton is pickled.
+"""
+
+import atexit
+import os
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+from lightweight_charts_pro.exceptions import TypeValidationError, ValueValidationError
+
+from streamlit_lightweight_charts_pro.charts.chart import Chart
+from streamlit_lightweight_charts_pro.data.columnar import ColumnarData
+
+# Alignment of columns inside a shared memory block, in bytes
+_SHARED_ALIGNMENT = 64
+
+
+class ParallelMode(str, Enum):
+    """Worker pool kind used for parallel serialization.
+
+    Attributes:
+        THREAD: Thread pool sharing the app's memory.
+        PROCESS: Process pool; series are pickled to the workers.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+_executors: dict[tuple[ParallelMode, Optional[int]], Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(
+    mode: Union[ParallelMode, str],
+    max_workers: Optional[int] = None,
+) -> Executor:
+    """Return the shared worker pool for a mode and worker count.
+
+    Args:
+        mode: "thread" or "process".
+        max_workers: Maximum number of workers; None uses the
+            concurrent.futures default.
+
+    Returns:
+        Executor: A pool that is reused across calls and reruns.
+
+    Raises:
+        ValueValidationError: If mode is unknown or max_workers is not positive.
+    """
+    try:
+        mode = ParallelMode(mode)
+    except ValueError as exc:
+        raise ValueValidationError("parallel", str(exc)) from exc
+    if max_workers is not None and max_workers <= 0:
+        raise ValueValidationError.positive_value("max_workers", max_workers)
+
+    key = (mode, max_workers)
+    with _executors_lock:
+        executor = _executors.get(key)
+        # A process pool whose worker died cannot run anything anymore
+        if executor is not None and getattr(executor, "_broken", False):
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = None
+        if executor is None:
+            if mode == ParallelMode.THREAD:
+                executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="lwc-serialize"
+                )
+            else:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            _executors[key] = executor
+        return executor
+
+
+def shutdown_executors() -> None:
+    """Shut down all shared worker pools."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_executors)
+
+
+def serialize_series(series: Any) -> dict[str, Any]:
+    """Serialize one series to its frontend configuration.
+
+    Module-level so that process pools can pickle it by reference.
+    """
+    return series.asdict()
+
+
+@dataclass(frozen=True)
+class _SharedColumn:
+    """Location of one column inside a shared memory block."""
+
+    offset: int
+    dtype: str
+    length: int
+
+
+class _SharedColumnarData:
+    """Stand-in for ColumnarData while a chart travels from a worker.
+
+    Numeric columns are described by their location in the shared memory
+    block; columns holding Python objects travel in the pickle.
+    """
+
+    def __init__(self, data: ColumnarData, layout: dict[str, _SharedColumn]):
+        self.data_class = data.data_class
+        self.report = data.report
+        self.layout = layout
+        self.objects = {name: col for name, col in data.columns.items() if name not in layout}
+
+    def restore(self, buffer: memoryview) -> ColumnarData:
+        """Rebuild the ColumnarData, copying the columns out of the block."""
+        columns = dict(self.objects)
+        for name, spec in self.layout.items():
+            columns[name] = np.frombuffer(
+                buffer, dtype=spec.dtype, count=spec.length, offset=spec.offset
+            ).copy()
+        whitespace = columns.pop("__whitespace__", None)
+        data = ColumnarData(self.data_class, columns, whitespace)
+        data.report = self.report
+        return data
+
+
+def _export_columns(chart: Any) -> Optional[str]:
+    """Move the numeric series columns of a chart into a shared memory block.
+
+    Column-backed series data is replaced by ``_SharedColumnarData``.
+
+    Returns:
+        Optional[str]: Name of the block, or None if there was nothing to move.
+    """
+    placements = []
+    size = 0
+    for series in chart.series:
+        if not isinstance(series.data, ColumnarData):
+            continue
+        columns = dict(series.data.columns)
+        if series.data.whitespace is not None:
+            columns["__whitespace__"] = series.data.whitespace
+        layout = {}
+        for name, column in columns.items():
+            if column.dtype.hasobject:
+                continue
+            size = -(-size // _SHARED_ALIGNMENT) * _SHARED_ALIGNMENT
+            layout[name] = _SharedColumn(size, column.dtype.str, len(column))
+            placements.append((size, column))
+            size += column.nbytes
+        series.data = _SharedColumnarData(series.data, layout)
+    if not placements:
+        return None
+
+    block = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        for offset, column in placements:
+            target = np.ndarray(column.shape, column.dtype, buffer=block.buf, offset=offset)
+            target[...] = column
+            del target
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    block.close()
+    # The parent unlinks the block; keep the worker's tracker from unlinking it again
+    resource_tracker.unregister(block._name, "shared_memory")  # pylint: disable=protected-access
+    return block.name
+
+
+def _import_columns(chart: Any, name: Optional[str]) -> None:
+    """Restore the series columns of a chart and release its shared memory block."""
+    if name is None:
+        return
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        for series in chart.series:
+            if isinstance(series.data, _SharedColumnarData):
+                series.data = series.data.restore(block.buf)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def build_chart_shared(builder: Callable[[Any], Any], item: Any) -> tuple[Any, Optional[str]]:
+    """Build one chart in a worker process and export its columns.
+
+    Module-level so that process pools can pickle it by reference.
+
+    Args:
+        builder: Function building a Chart from one item.
+        item: Item to build the chart for, e.g. a symbol.
+
+    Returns:
+        tuple[Any, Optional[str]]: The chart skeleton and its shared memory
+            block name.
+    """
+    try:
+        chart = builder(item)
+        if not isinstance(chart, Chart):
+            raise TypeValidationError("builder_fn result", "Chart")
+    except Exception as exc:
+        try:
+            pickle.loads(pickle.dumps(exc))
+        except Exception:  # pylint: disable=broad-except
+            # An exception that cannot be unpickled would break the whole pool
+            raise RuntimeError(
+                f"Building the chart for {item!r} failed: {type(exc).__name__}: {exc}"
+            ) from None
+        raise
+    return chart, _export_columns(chart)
+
+
+def _release(name: str) -> None:
+    """Unlink a shared memory block that will not be imported."""
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def build_charts(
+    builder: Callable[[Any], Any],
+    items: list[Any],
+    executor: Executor,
+) -> list[Any]:
+    """Build charts concurrently, in item order.
+
+    On a POSIX process pool the series columns are returned through shared
+    memory; otherwise the builder runs directly and the charts are returned
+    as-is.
+
+    Args:
+        builder: Function building a Chart from one item. Must be picklable
+            (a module-level function) for process pools.
+        items: Items to build charts for.
+        executor: Pool to run the builder on.
+
+    Returns:
+        list[Any]: One chart per item.
+    """
+    # Windows frees a block once no process has it open, so it cannot be
+    # handed from an exiting worker call to the parent
+    if not isinstance(executor, ProcessPoolExecutor) or os.name == "nt":
+        return list(executor.map(builder, items))
+
+    futures = [executor.submit(build_chart_shared, builder, item) for item in items]
+    charts = []
+    try:
+        for future in futures:
+            chart, name = future.result()
+            _import_columns(chart, name)
+            charts.append(chart)
+    except BaseException:
+        # Release the blocks of charts built after the failing one
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        for future in futures[len(charts) + 1 :]:
+            if not future.cancelled() and future.exception() is None:
+                name = future.result()[1]
+                if name is not None:
+                    _release(name)
+        raise
+    return charts
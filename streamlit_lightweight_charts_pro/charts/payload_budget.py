@@ -0,0 +1,349 @@
+"""Payload size budgets for rendered charts.
+
+A PayloadBudget caps the number of data points and the encoded size of the
+configuration sent to the browser by one chart or one ChartManager page. When
+a render would exceed it, the configured policy is applied to the series
+data before the component is rendered:
+
+- "downsample": merge consecutive points into buckets (OHLC aggregated,
+  volume summed, other fields from the last point of the bucket).
+- "truncate": keep the most recent window of points. Older windows are
+  reached by paging; the frontend requests the next page when the user
+  scrolls past the left edge of the window.
+- "raise": raise PayloadBudgetExceededError.
+
+Series sharing a time axis (see ``ChartRenderer._share_time_axes``) are
+reduced together so they stay aligned, and palette-encoded colors are
+reduced with their points.
+"""
+
+import json
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional, Union
+
+import numpy as np
+from lightweight_charts_pro.exceptions import ValueValidationError
+from lightweight_charts_pro.logging_config import get_logger
+
+from streamlit_lightweight_charts_pro.exceptions import PayloadBudgetExceededError
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Lists longer than this are sized from an evenly spaced sample
+_SAMPLE_THRESHOLD = 256
+_SAMPLE_SIZE = 64
+
+# Bucket aggregation per data point key; keys not listed take the last value
+_BUCKET_AGGREGATIONS = {"open": "first", "high": "max", "low": "min", "close": "last"}
+
+
+class BudgetPolicy(str, Enum):
+    """What to do when a payload exceeds its budget.
+
+    Attributes:
+        DOWNSAMPLE: Aggregate consecutive points into buckets.
+        TRUNCATE: Keep the most recent window of points, with paging.
+        RAISE: Raise PayloadBudgetExceededError.
+    """
+
+    DOWNSAMPLE = "downsample"
+    TRUNCATE = "truncate"
+    RAISE = "raise"
+
+
+@dataclass
+class PayloadBudget:
+    """Limits on the data sent to the browser in one render.
+
+    Attributes:
+        max_points: Maximum total number of series data points, or None.
+        max_bytes: Maximum estimated JSON size in bytes, or None.
+        policy: BudgetPolicy applied when a limit is exceeded.
+
+    Example:
+        ```python
+        from streamlit_lightweight_charts_pro import Chart, PayloadBudget
+
+        chart = Chart(payload_budget=PayloadBudget(max_points=200_000, policy="truncate"))
+        ```
+    """
+
+    max_points: Optional[int] = None
+    max_bytes: Optional[int] = None
+    policy: Union[BudgetPolicy, str] = BudgetPolicy.DOWNSAMPLE
+
+    def __post_init__(self):
+        """Validate the limits and normalize the policy."""
+        for name in ("max_points", "max_bytes"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueValidationError.positive_value(name, value)
+        try:
+            self.policy = BudgetPolicy(self.policy)
+        except ValueError as exc:
+            raise ValueValidationError("policy", str(exc)) from exc
+
+
+@dataclass(frozen=True)
+class PayloadEstimate:
+    """Estimated size of a frontend configuration.
+
+    Attributes:
+        points: Total number of series data points.
+        bytes: Estimated size of the JSON encoding in bytes.
+    """
+
+    points: int
+    bytes: int
+
+
+def estimate_encoded_size(value: Any) -> int:
+    """Estimate the length of ``json.dumps(value)`` without encoding it all.
+
+    Long lists are sized from an evenly spaced sample of their items.
+    """
+    if isinstance(value, dict):
+        size = 2 + max(len(value) - 1, 0) * 2
+        for key, item in value.items():
+            size += len(str(key)) + 4 + estimate_encoded_size(item)
+        return size
+    if isinstance(value, (list, tuple)):
+        count = len(value)
+        size = 2 + max(count - 1, 0) * 2
+        if count > _SAMPLE_THRESHOLD:
+            step = count // _SAMPLE_SIZE
+            sample = value[::step][:_SAMPLE_SIZE]
+            sampled = sum(len(json.dumps(item, default=str)) for item in sample)
+            return size + int(sampled / len(sample) * count)
+        return size + sum(estimate_encoded_size(item) for item in value)
+    return len(json.dumps(value, default=str))
+
+
+def estimate_payload(config: dict[str, Any]) -> PayloadEstimate:
+    """Estimate the number of data points and the encoded size of a config."""
+    points = sum(
+        len(series.get("data") or ())
+        for chart in config.get("charts", [])
+        for series in chart.get("series", [])
+    )
+    return PayloadEstimate(points=points, bytes=estimate_encoded_size(config))
+
+
+def _reduction_factor(estimate: PayloadEstimate, budget: PayloadBudget) -> float:
+    """Return the fraction of points that fits the budget (1.0 if it fits)."""
+    factor = 1.0
+    if budget.max_points is not None and estimate.points > budget.max_points:
+        factor = min(factor, budget.max_points / estimate.points)
+    if budget.max_bytes is not None and estimate.bytes > budget.max_bytes:
+        factor = min(factor, budget.max_bytes / estimate.bytes)
+    return factor
+
+
+def _time_groups(chart: dict[str, Any]) -> list[tuple[Optional[str], list[dict[str, Any]]]]:
+    """Group the series of a chart by shared time axis id (None if unshared)."""
+    groups: dict[str, list[dict[str, Any]]] = {}
+    result: list[tuple[Optional[str], list[dict[str, Any]]]] = []
+    for series in chart.get("series", []):
+        if not isinstance(series.get("data"), list):
+            continue
+        axis_id = series.get("timeAxis")
+        if axis_id is None:
+            result.append((None, [series]))
+        elif axis_id not in groups:
+            groups[axis_id] = [series]
+            result.append((axis_id, groups[axis_id]))
+        else:
+            groups[axis_id].append(series)
+    return result
+
+
+def _palette_codes(palette: dict[str, Any], length: int) -> np.ndarray:
+    """Return the per-point palette indices of an encoded color field."""
+    if "index" in palette:
+        return np.asarray(palette["index"], dtype=np.int64)
+    codes = np.full(length, -1, dtype=np.int64)
+    runs = palette.get("runs") or []
+    for position, (start, code) in enumerate(runs):
+        end = runs[position + 1][0] if position + 1 < len(runs) else length
+        codes[start:end] = code
+    return codes
+
+
+def _select_palettes(series: dict[str, Any], length: int, selection: Any) -> None:
+    """Apply an index selection or slice to the color palettes of a series."""
+    for palette in series.get("colorPalettes", {}).values():
+        codes = _palette_codes(palette, length)[selection]
+        palette.pop("runs", None)
+        palette["index"] = codes.tolist()
+
+
+def _bucket_series(series: dict[str, Any], starts: np.ndarray, length: int) -> list[dict]:
+    """Aggregate the data points of one series into the given buckets."""
+    data = series["data"]
+    ends = np.append(starts[1:], length) - 1
+    volume = (series.get("options", {}).get("priceFormat") or {}).get("type") == "volume"
+    keys = set().union(*data)
+    buckets: list[dict[str, Any]] = [{} for _ in range(len(starts))]
+
+    for key in keys:
+        values = [point.get(key) for point in data]
+        how = "sum" if volume and key == "value" else _BUCKET_AGGREGATIONS.get(key, "last")
+        if key == "time":
+            how = "first"
+        numeric = how in ("max", "min", "sum")
+        if numeric:
+            column = np.array(
+                [np.nan if value is None else value for value in values], dtype=np.float64
+            )
+            reducer = {"max": np.fmax, "min": np.fmin, "sum": np.add}[how]
+            if how == "sum":
+                column = np.nan_to_num(column)
+            reduced = reducer.reduceat(column, starts).tolist()
+            present = np.logical_or.reduceat([value is not None for value in values], starts)
+        else:
+            # First or last present value of each bucket
+            reduced, present_list = [], []
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                span = values[start : end + 1]
+                found = next(
+                    (v for v in (span if how == "first" else reversed(span)) if v is not None),
+                    None,
+                )
+                reduced.append(found)
+                present_list.append(found is not None)
+            present = present_list
+        for bucket, value, has_value in zip(buckets, reduced, present):
+            if has_value:
+                bucket[key] = value
+    _select_palettes(series, len(data), ends)
+    return buckets
+
+
+def _downsample_chart(chart: dict[str, Any], factor: float) -> None:
+    """Reduce every time group of a chart to about ``factor`` of its points."""
+    time_axes = chart.get("timeAxes", {})
+    for axis_id, group in _time_groups(chart):
+        length = len(time_axes[axis_id]) if axis_id else len(group[0]["data"])
+        target = max(int(length * factor), 1)
+        if length <= target:
+            continue
+        bucket = math.ceil(length / target)
+        starts = np.arange(0, length, bucket)
+        for series in group:
+            series["data"] = _bucket_series(series, starts, length)
+        if axis_id:
+            time_axes[axis_id] = [time_axes[axis_id][start] for start in starts.tolist()]
+
+
+def _series_times(series: dict[str, Any], time_axes: dict[str, list[Any]]) -> list[Any]:
+    """Return the time vector of a series, from its points or shared axis."""
+    axis_id = series.get("timeAxis")
+    if axis_id:
+        return time_axes[axis_id]
+    return [point.get("time") for point in series["data"]]
+
+
+def _truncate_chart(chart: dict[str, Any], factor: float, page: int) -> dict[str, Any]:
+    """Keep a window of about ``factor`` of the points, ``page`` windows back.
+
+    Returns:
+        Dict[str, Any]: Paging metadata for the frontend.
+    """
+    time_axes = chart.get("timeAxes", {})
+    groups = _time_groups(chart)
+    if not groups:
+        return {}
+    times_by_group = [_series_times(group[0], time_axes) for _, group in groups]
+    longest = max(times_by_group, key=len)
+    length = len(longest)
+    window = max(int(length * factor), 1)
+    stride = max(window // 2, 1)
+    pages = max(math.ceil((length - window) / stride), 0) + 1
+    page = min(max(page, 0), pages - 1)
+    end = max(length - page * stride, window)
+    start = end - window
+    low, high = longest[start], longest[end - 1]
+
+    for (axis_id, group), times in zip(groups, times_by_group):
+        try:
+            lo, hi = bisect_left(times, low), bisect_right(times, high)
+        except TypeError:
+            # Unsortable (mixed) time values; keep the series as-is
+            continue
+        for series in group:
+            _select_palettes(series, len(series["data"]), slice(lo, hi))
+            series["data"] = series["data"][lo:hi]
+        if axis_id:
+            time_axes[axis_id] = times[lo:hi]
+
+    return {
+        "page": page,
+        "pages": pages,
+        "from": low,
+        "to": high,
+        "totalPoints": length,
+    }
+
+
+def apply_payload_budget(
+    config: dict[str, Any],
+    budget: Optional[PayloadBudget],
+    page: Union[int, Mapping[str, int]] = 0,
+) -> dict[str, Any]:
+    """Enforce a payload budget on a frontend configuration in place.
+
+    Args:
+        config: Frontend configuration with a ``charts`` list.
+        budget: Budget to enforce; None disables enforcement.
+        page: Window index for the truncate policy (0 is the most recent),
+            or window indexes by chart id; charts without one get 0.
+
+    Returns:
+        Dict[str, Any]: The configuration, reduced if it exceeded the budget.
+
+    Raises:
+        PayloadBudgetExceededError: If the policy is "raise" and the budget
+            is exceeded.
+    """
+    if budget is None:
+        return config
+
+    estimate = estimate_payload(config)
+    factor = _reduction_factor(estimate, budget)
+    logger.debug(
+        "Estimated payload: %d points, %d bytes (budget: %s points, %s bytes)",
+        estimate.points,
+        estimate.bytes,
+        budget.max_points,
+        budget.max_bytes,
+    )
+    if factor >= 1.0:
+        return config
+
+    if budget.policy == BudgetPolicy.RAISE:
+        raise PayloadBudgetExceededError(
+            estimate.points, estimate.bytes, budget.max_points, budget.max_bytes
+        )
+
+    for chart in config.get("charts", []):
+        if budget.policy == BudgetPolicy.DOWNSAMPLE:
+            _downsample_chart(chart, factor)
+        else:
+            chart_page = page.get(chart.get("chartId"), 0) if isinstance(page, Mapping) else page
+            chart["payloadWindow"] = _truncate_chart(chart, factor, chart_page)
+
+    reduced = estimate_payload(config)
+    logger.info(
+        "Payload budget exceeded (%d points, ~%d bytes); applied %s: %d points, ~%d bytes",
+        estimate.points,
+        estimate.bytes,
+        budget.policy.value,
+        reduced.points,
+        reduced.bytes,
+    )
+    return config
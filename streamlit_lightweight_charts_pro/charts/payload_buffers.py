@@ -0,0 +1,98 @@
+"""Binary column buffers for large series payloads.
+
+Large series are cheaper to send as raw numeric columns than as JSON lists of
+point objects: there is no per-point JSON encoding in Python and no parsing
+on the browser's main thread. Series with at least ``COLUMN_BUFFER_MIN_POINTS``
+points whose fields are all numeric are moved out of the JSON configuration
+into one ``bytes`` component argument:
+
+- each field becomes a little-endian float64 column (None/NaN marks a point
+  without that field, e.g. a whitespace point);
+- the series gets ``columns`` ({field: {"offset": ..., "length": ...}}) and
+  ``length`` instead of ``data``.
+
+Shared time axes (``ChartConfig.timeAxes``) of the same size are moved to
+``timeAxisColumns`` the same way.
+
+The frontend decodes the buffer in a Web Worker, transfers the columns back
+and rebuilds the point objects before any chart reads them.
+"""
+
+from numbers import Real
+from typing import Any, Optional
+
+import numpy as np
+
+# Series shorter than this stay in the JSON payload
+COLUMN_BUFFER_MIN_POINTS = 10_000
+
+
+def _numeric_column(values: list[Any]) -> Optional[np.ndarray]:
+    """Return values as a float64 column, or None if any value is not numeric."""
+    value_types = set(map(type, values))
+    value_types.discard(type(None))
+    if any(issubclass(t, bool) or not issubclass(t, Real) for t in value_types):
+        return None
+    return np.array(values, dtype="<f8")
+
+
+def _numeric_columns(data: list[dict[str, Any]]) -> Optional[dict[str, np.ndarray]]:
+    """Return float64 columns of the points, or None if a field is not numeric."""
+    columns = {}
+    for key in sorted(set().union(*data)):
+        column = _numeric_column([point.get(key) for point in data])
+        if column is None:
+            return None
+        columns[key] = column
+    return columns
+
+
+def encode_column_buffers(
+    config: dict[str, Any],
+    min_points: int = COLUMN_BUFFER_MIN_POINTS,
+) -> Optional[bytes]:
+    """Move large numeric series of a configuration into one binary buffer.
+
+    Modifies the configuration in place.
+
+    Args:
+        config: Frontend configuration with a ``charts`` list.
+        min_points: Smallest series length that is encoded.
+
+    Returns:
+        Optional[bytes]: The concatenated column buffer, or None if no series
+            was encoded.
+    """
+    chunks: list[bytes] = []
+    size = 0
+
+    def append(column: np.ndarray) -> dict[str, int]:
+        nonlocal size
+        spec = {"offset": size, "length": len(column)}
+        chunks.append(column.tobytes())
+        size += column.nbytes
+        return spec
+
+    for chart in config.get("charts", []):
+        time_axes = chart.get("timeAxes") or {}
+        for axis_id, times in list(time_axes.items()):
+            column = _numeric_column(times) if len(times) >= min_points else None
+            if column is not None:
+                chart.setdefault("timeAxisColumns", {})[axis_id] = append(column)
+                del time_axes[axis_id]
+
+        for series in chart.get("series", []):
+            data = series.get("data")
+            if not isinstance(data, list) or len(data) < min_points:
+                continue
+            if not all(isinstance(point, dict) for point in data):
+                continue
+            columns = _numeric_columns(data)
+            if not columns:
+                continue
+
+            series["columns"] = {name: append(column) for name, column in columns.items()}
+            series["length"] = len(data)
+            del series["data"]
+
+    return b"".join(chunks) if chunks else None
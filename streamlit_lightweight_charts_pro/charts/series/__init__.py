@@ -0,0 +1,41 @@
+"""Series classes for Streamlit Lightweight Charts Pro.
+
+The concrete series classes extend their lightweight_charts_pro counterparts
+with column-backed DataFrame ingestion. The abstract Series base class is
+re-exported from core.
+"""
+
+# Abstract base class (re-exported from core)
+from lightweight_charts_pro.charts.series import Series
+
+# Column-backed series classes
+from streamlit_lightweight_charts_pro.charts.series.columnar import (
+    AreaSeries,
+    BandSeries,
+    BarSeries,
+    BaselineSeries,
+    CandlestickSeries,
+    ColumnarSeriesMixin,
+    GradientRibbonSeries,
+    HistogramSeries,
+    LineSeries,
+    RibbonSeries,
+    SignalSeries,
+    TrendFillSeries,
+)
+
+__all__ = [
+    "AreaSeries",
+    "BandSeries",
+    "BarSeries",
+    "BaselineSeries",
+    "CandlestickSeries",
+    "ColumnarSeriesMixin",
+    "GradientRibbonSeries",
+    "HistogramSeries",
+    "LineSeries",
+    "RibbonSeries",
+    "Series",
+    "SignalSeries",
+    "TrendFillSeries",
+]
@@ -0,0 +1,387 @@
+"""Column-backed series classes for Streamlit Lightweight Charts Pro.
+
+This module extends the core series classes with a DataFrame ingestion path
+that keeps the data as NumPy columns (see ColumnarData) instead of building
+one data object per row. Serialization reads the columns directly, and data
+objects are only materialized when user code iterates ``series.data``.
+Column-backed data is sanitized on ingestion (sorted by time, duplicate
+timestamps resolved, NaN rows turned into whitespace) according to the
+series' ``sanitize`` and ``duplicates`` options. Per-point colors that repeat
+are sent palette-encoded under ``colorPalettes`` (see ``data.palette``).
+
+The classes are drop-in subclasses of their lightweight_charts_pro
+counterparts, so list-of-data input and all series options behave exactly
+as before.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.charts import series as core_series
+from lightweight_charts_pro.constants import (
+    HISTOGRAM_DOWN_COLOR_DEFAULT,
+    HISTOGRAM_UP_COLOR_DEFAULT,
+)
+from lightweight_charts_pro.exceptions import (
+    ColumnMappingRequiredError,
+    DataFrameValidationError,
+    NotFoundError,
+    ValueValidationError,
+)
+from lightweight_charts_pro.utils import snake_to_camel
+
+from streamlit_lightweight_charts_pro.data.columnar import ColumnarData
+from streamlit_lightweight_charts_pro.data.interop import (
+    column_names,
+    get_column,
+    is_arrow_table,
+    is_polars_frame,
+    is_table,
+)
+from streamlit_lightweight_charts_pro.data.palette import encode_palette, is_color_field
+from streamlit_lightweight_charts_pro.data.sanitize import (
+    DuplicatePolicy,
+    SanitizeMode,
+)
+
+
+def _normalize_key(key: str) -> str:
+    """Convert snake_case to camelCase for column mapping comparison."""
+    if "_" in key:
+        parts = key.split("_")
+        return parts[0] + "".join(part.capitalize() for part in parts[1:])
+    return key
+
+
+class ColumnarSeriesMixin:
+    """Mixin adding column-backed DataFrame ingestion to a series class.
+
+    DataFrame and pandas Series input, whether passed to the constructor or
+    to ``from_dataframe``, is converted into a ColumnarData instance. PyArrow
+    Tables/RecordBatches and Polars DataFrames are accepted in the same
+    places and read without a pandas round trip. A ColumnarData instance can
+    also be passed directly as ``data`` and is used as-is.
+
+    Table input is sanitized before validation. With the default "repair"
+    mode, unsorted rows, duplicate timestamps and NaN rows are fixed and
+    reported in ``series.data.report``; "strict" raises instead and "fast"
+    skips the checks.
+    """
+
+    # Fields left out of data_dict while asdict() sends them palette-encoded
+    _palette_fields: frozenset = frozenset()
+
+    def __init__(
+        self,
+        data: Any = None,
+        *args,
+        time_unit: str = "auto",
+        display_timezone: Optional[str] = None,
+        sanitize: Union[SanitizeMode, str] = SanitizeMode.REPAIR,
+        duplicates: Union[DuplicatePolicy, str] = DuplicatePolicy.LAST,
+        **kwargs,
+    ):
+        """Initialize the series, accepting ColumnarData and Arrow/Polars tables.
+
+        Args:
+            data: Series data; see the core series class for list input.
+            *args: Positional arguments for the core series constructor.
+            time_unit: Unit of numeric epoch time columns ("s", "ms", "us",
+                "ns" or "auto"). Only used for table input.
+            display_timezone: Optional timezone the time axis is shifted to.
+                Only used for table input.
+            sanitize: Sanitation mode for table input ("strict", "repair"
+                or "fast").
+            duplicates: How repair mode resolves duplicate timestamps
+                ("first", "last" or "aggregate").
+            **kwargs: Keyword arguments for the core series constructor.
+        """
+        self._time_unit = time_unit
+        self._display_timezone = display_timezone
+        self._sanitize = sanitize
+        self._duplicates = duplicates
+        if is_arrow_table(data) or is_polars_frame(data):
+            column_mapping = args[0] if args else kwargs.pop("column_mapping", None)
+            args = args[1:]
+            if column_mapping is None:
+                raise ColumnMappingRequiredError()
+            data = self._columnar_from_frame(
+                data, column_mapping, time_unit, display_timezone, sanitize, duplicates
+            )
+        columnar = isinstance(data, ColumnarData)
+        super().__init__([] if columnar else data, *args, **kwargs)
+        if columnar:
+            self.data = data
+
+    @classmethod
+    def _columnar_from_frame(
+        cls,
+        data: Any,
+        column_mapping: Mapping[str, str],
+        time_unit: str = "auto",
+        display_timezone: Optional[str] = None,
+        sanitize: Union[SanitizeMode, str] = SanitizeMode.REPAIR,
+        duplicates: Union[DuplicatePolicy, str] = DuplicatePolicy.LAST,
+    ) -> ColumnarData:
+        """Validate a column mapping and build ColumnarData from a table.
+
+        Args:
+            data: pandas DataFrame or Series, PyArrow Table/RecordBatch or
+                Polars DataFrame to ingest.
+            column_mapping: Mapping of data class fields to column names.
+                Keys may be given in snake_case or camelCase.
+            time_unit: Unit of numeric epoch time columns.
+            display_timezone: Optional timezone the time axis is shifted to.
+            sanitize: Sanitation mode applied to the columns.
+            duplicates: Duplicate timestamp policy for repair mode.
+
+        Returns:
+            ColumnarData: Column-backed data for this series type.
+
+        Raises:
+            ValueValidationError: If a required field is not mapped.
+            NotFoundError: If a mapped column does not exist.
+            DataFrameValidationError: If data is not a supported table type.
+        """
+        data_frame = data.to_frame() if isinstance(data, pd.Series) else data
+        if not is_table(data_frame):
+            raise DataFrameValidationError.invalid_data_type(type(data))
+        data_class = cls.data_class
+        fields = data_class.required_columns | data_class.optional_columns
+
+        mapped_keys = {_normalize_key(key) for key in column_mapping}
+        missing = {
+            key for key in data_class.required_columns if _normalize_key(key) not in mapped_keys
+        }
+        if missing:
+            raise ValueValidationError(
+                "DataFrame",
+                f"is missing required column mapping: {missing}",
+            )
+
+        # Only reset the index (which copies the frame) when a mapped column
+        # lives in the index; otherwise read the caller's columns directly.
+        # Arrow and Polars tables have no index and are never copied.
+        if isinstance(data_frame, pd.DataFrame) and not set(column_mapping.values()) <= set(
+            data_frame.columns
+        ):
+            data_frame, column_mapping = cls.prepare_index(data_frame, dict(column_mapping))
+        available = set(column_names(data_frame))
+
+        field_to_column = {}
+        for field in fields:
+            for mapping_key, column_name in column_mapping.items():
+                if _normalize_key(mapping_key) == _normalize_key(field):
+                    if column_name not in available:
+                        raise NotFoundError("Column", column_name)
+                    field_to_column[field] = column_name
+                    break
+
+        return ColumnarData.from_dataframe(
+            data_class,
+            data_frame,
+            field_to_column,
+            time_unit=time_unit,
+            display_timezone=display_timezone,
+            sanitize=sanitize,
+            duplicates=duplicates,
+        )
+
+    def _process_dataframe_input(
+        self,
+        data: Union[pd.DataFrame, pd.Series],
+        column_mapping: dict[str, str],
+    ) -> ColumnarData:
+        """Process DataFrame or Series constructor input into ColumnarData."""
+        return self._columnar_from_frame(
+            data,
+            column_mapping,
+            self._time_unit,
+            self._display_timezone,
+            self._sanitize,
+            self._duplicates,
+        )
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: Any,
+        column_mapping: dict[str, str],
+        price_scale_id: str = "",
+        **kwargs,
+    ):
+        """Create a column-backed series from a table.
+
+        Args:
+            df: The input pandas DataFrame or Series, PyArrow Table/RecordBatch
+                or Polars DataFrame.
+            column_mapping: Mapping of required fields to column names.
+            price_scale_id: Price scale ID (default '').
+            **kwargs: Additional arguments for the series constructor,
+                including ``time_unit``, ``display_timezone``, ``sanitize``
+                and ``duplicates``.
+
+        Returns:
+            Series: An instance of the series backed by ColumnarData.
+        """
+        data = cls._columnar_from_frame(
+            df,
+            column_mapping,
+            kwargs.get("time_unit", "auto"),
+            kwargs.get("display_timezone"),
+            kwargs.get("sanitize", SanitizeMode.REPAIR),
+            kwargs.get("duplicates", DuplicatePolicy.LAST),
+        )
+        return cls(data=data, price_scale_id=price_scale_id, **kwargs)
+
+    @property
+    def data_dict(self) -> list[dict[str, Any]]:
+        """Get the data in dictionary format, serializing columns directly."""
+        if isinstance(self.data, ColumnarData):
+            return self.data.to_records(exclude=self._palette_fields)
+        return super().data_dict
+
+    def asdict(self) -> dict[str, Any]:
+        """Convert the series to its frontend configuration.
+
+        Per-point color fields that repeat a few colors are moved out of the
+        data points into ``colorPalettes`` (a color table plus an index or
+        run-length segments per point). Column-backed data is encoded from
+        the columns without building the color strings per point.
+
+        Returns:
+            Dict[str, Any]: Series configuration for the frontend.
+        """
+        palettes = self.data.color_palettes() if isinstance(self.data, ColumnarData) else {}
+        self._palette_fields = frozenset(palettes)
+        try:
+            config = super().asdict()
+        finally:
+            self._palette_fields = frozenset()
+
+        records = config.get("data")
+        if not palettes and isinstance(records, list) and records:
+            for field_name in self.data_class.optional_columns:
+                if not is_color_field(field_name):
+                    continue
+                key = snake_to_camel(field_name)
+                encoded = encode_palette([record.get(key) for record in records])
+                if encoded is not None:
+                    palettes[field_name] = encoded
+                    for record in records:
+                        record.pop(key, None)
+
+        if palettes:
+            config["colorPalettes"] = {
+                snake_to_camel(field_name): encoded for field_name, encoded in palettes.items()
+            }
+        return config
+
+
+class AreaSeries(ColumnarSeriesMixin, core_series.AreaSeries):
+    """Area series with column-backed DataFrame ingestion."""
+
+
+class BandSeries(ColumnarSeriesMixin, core_series.BandSeries):
+    """Band series with column-backed DataFrame ingestion."""
+
+
+class BarSeries(ColumnarSeriesMixin, core_series.BarSeries):
+    """Bar series with column-backed DataFrame ingestion."""
+
+
+class BaselineSeries(ColumnarSeriesMixin, core_series.BaselineSeries):
+    """Baseline series with column-backed DataFrame ingestion."""
+
+
+class CandlestickSeries(ColumnarSeriesMixin, core_series.CandlestickSeries):
+    """Candlestick series with column-backed DataFrame ingestion."""
+
+
+class GradientRibbonSeries(ColumnarSeriesMixin, core_series.GradientRibbonSeries):
+    """Gradient ribbon series with column-backed DataFrame ingestion."""
+
+
+class HistogramSeries(ColumnarSeriesMixin, core_series.HistogramSeries):
+    """Histogram series with column-backed DataFrame ingestion."""
+
+    @classmethod
+    def create_volume_series(
+        cls,
+        data: Any,
+        column_mapping: dict,
+        up_color: str = HISTOGRAM_UP_COLOR_DEFAULT,
+        down_color: str = HISTOGRAM_DOWN_COLOR_DEFAULT,
+        **kwargs,
+    ) -> "HistogramSeries":
+        """Create a volume histogram colored by price movement.
+
+        Table input (pandas, PyArrow or Polars) is read column-wise: the bar
+        colors are computed as a single array instead of copying the table to
+        add a color column, and sanitation runs after the colors are attached
+        so they stay aligned with their rows. When duplicate timestamps are
+        aggregated, the volumes of the merged rows are summed. Other input is
+        handled by the core implementation.
+
+        Args:
+            data: OHLCV data as a table or sequence of OhlcvData objects.
+            column_mapping: Mapping of fields to column names. Must include
+                "close" and "volume"; with "open" colors follow candle
+                direction, otherwise the close-to-close change.
+            up_color: Color for rising bars.
+            down_color: Color for falling bars.
+            **kwargs: Additional arguments for the HistogramSeries constructor,
+                including ``time_unit``, ``display_timezone``, ``sanitize``
+                and ``duplicates``.
+
+        Returns:
+            HistogramSeries: Column-backed volume series.
+        """
+        if not is_table(data):
+            return super().create_volume_series(
+                data, column_mapping, up_color=up_color, down_color=down_color, **kwargs
+            )
+
+        volume = cls._columnar_from_frame(
+            data,
+            {"time": column_mapping["time"], "value": column_mapping.get("volume", "volume")},
+            kwargs.get("time_unit", "auto"),
+            kwargs.get("display_timezone"),
+            SanitizeMode.FAST,
+        )
+
+        open_col = column_mapping.get("open")
+        close_col = column_mapping.get("close", "close")
+        close = np.asarray(get_column(data, close_col), dtype=np.float64)
+        if open_col and open_col in column_names(data):
+            rising = close >= np.asarray(get_column(data, open_col), dtype=np.float64)
+        else:
+            rising = np.diff(close, prepend=close[:1]) >= 0
+            rising[:1] = True
+        colors = np.where(rising, up_color, down_color).astype(object)
+
+        columnar = ColumnarData(cls.data_class, {**volume.columns, "color": colors}).sanitized(
+            kwargs.get("sanitize", SanitizeMode.REPAIR),
+            kwargs.get("duplicates", DuplicatePolicy.LAST),
+            aggregations={"value": "sum"},
+        )
+        columnar.validate()
+        return cls(data=columnar, **kwargs)
+
+
+class LineSeries(ColumnarSeriesMixin, core_series.LineSeries):
+    """Line series with column-backed DataFrame ingestion."""
+
+
+class RibbonSeries(ColumnarSeriesMixin, core_series.RibbonSeries):
+    """Ribbon series with column-backed DataFrame ingestion."""
+
+
+class SignalSeries(ColumnarSeriesMixin, core_series.SignalSeries):
+    """Signal series with column-backed DataFrame ingestion."""
+
+
+class TrendFillSeries(ColumnarSeriesMixin, core_series.TrendFillSeries):
+    """Trend fill series with column-backed DataFrame ingestion."""
@@ -31,6 +31,10 @@ Example:
 
         $ python -m streamlit_lightweight_charts_pro version
 
+    Benchmark package import time, failing above a budget::
+
+        $ python -m streamlit_lightweight_charts_pro.cli bench-import --max-ms 50
+
 Note:
     This module requires Node.js and NPM to be installed for
     frontend build operations.
@@ -39,14 +43,23 @@ Note:
 # Standard Imports
 import os
 import shutil
+import statistics
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Local Imports
 from streamlit_lightweight_charts_pro import __version__
 from streamlit_lightweight_charts_pro.exceptions import NpmNotFoundError
 
+# Statements timed by the import benchmark: the bare package import every
+# page pays, and the first use of the chart API
+IMPORT_BENCHMARKS = {
+    "import": "import streamlit_lightweight_charts_pro",
+    "import + Chart": "from streamlit_lightweight_charts_pro import Chart",
+}
+
 
 def check_frontend_build():
     """Check if frontend is built and trigger build if necessary.
@@ -190,6 +203,57 @@ def build_frontend():
         os.chdir(original_dir)
 
 
+def _time_statement(statement: str) -> float:
+    """Time one statement in a fresh interpreter, in milliseconds."""
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1]) * 1000
+
+
+def benchmark_import_time(runs: int = 7, max_ms: Optional[float] = None) -> bool:
+    """Measure the package import time and check it against a budget.
+
+    Each statement in IMPORT_BENCHMARKS runs ``runs`` times, each in a fresh
+    interpreter so nothing is cached in ``sys.modules``; the median is
+    reported. Use ``max_ms`` in CI to catch changes that make the bare
+    import eager again.
+
+    Args:
+        runs: Number of interpreters started per statement.
+        max_ms: Budget for the median bare import, in milliseconds.
+            Defaults to None (report only).
+
+    Returns:
+        bool: False if the bare import exceeded the budget, True otherwise.
+
+    Example:
+        >>> benchmark_import_time(runs=5, max_ms=50)
+        import               median    12.1 ms  (min 11.4 ms)
+        import + Chart       median   912.8 ms  (min 880.2 ms)
+        True
+    """
+    medians = {}
+    for label, statement in IMPORT_BENCHMARKS.items():
+        timings = [_time_statement(statement) for _ in range(runs)]
+        medians[label] = statistics.median(timings)
+        print(f"{label:<20} median {medians[label]:>7.1f} ms  (min {min(timings):.1f} ms)")
+
+    if max_ms is not None and medians["import"] > max_ms:
+        print(f"❌ Import time {medians['import']:.1f} ms exceeds the budget of {max_ms:g} ms")
+        return False
+    return True
+
+
 def main():
     """Main CLI entry point for command-line interface.
 
@@ -198,6 +262,7 @@ def main():
         - build-frontend: Build the frontend assets
         - check: Check if frontend is built
         - version: Show version information
+        - bench-import: Benchmark the package import time
 
     Returns:
         int: Exit code (0 for success, 1 for failure).
@@ -217,6 +282,7 @@ def main():
         print("  build-frontend  Build the frontend assets")
         print("  check          Check if frontend is built")
         print("  version        Show version information")
+        print("  bench-import   Benchmark import time [--runs N] [--max-ms MS]")
         # Return 1 to indicate error (missing command)
         return 1
 
@@ -244,6 +310,17 @@ def main():
         # Return 0 to indicate success
         return 0
 
+    # Handle 'bench-import' command
+    if command == "bench-import":
+        # Optional flags: --runs N and --max-ms MS
+        options = dict(zip(sys.argv[2::2], sys.argv[3::2]))
+        success = benchmark_import_time(
+            runs=int(options.get("--runs", 7)),
+            max_ms=float(options["--max-ms"]) if "--max-ms" in options else None,
+        )
+        # Return 1 if the import time exceeded the budget
+        return 0 if success else 1
+
     # Unknown command provided
     print(f"Unknown command: {command}")
     # Return 1 to indicate error (invalid command)
@@ -14,15 +14,17 @@ between Python (backend) and React/JavaScript (frontend). This bridge allows:
 
 Key Features:
     - Automatic mode detection (development vs production)
-    - Lazy component initialization to avoid import cycles
+    - Lazy component initialization on first use, keeping imports cheap
     - Comprehensive error handling and logging
     - Debug utilities for troubleshooting
     - Support for component reinitialization
 
 Architecture:
     The component follows a singleton pattern where _component_func is
-    initialized once at module import time. This ensures consistent behavior
-    across the application and avoids redundant initialization overhead.
+    initialized once, on the first call to get_component_func() (normally
+    the first chart render). Importing the package therefore neither
+    declares the component nor touches the filesystem; pages that never
+    render a chart never pay for it.
 
     Component Modes:
         - Production (_RELEASE=True): Uses pre-built static files from
@@ -61,7 +63,7 @@ Example:
             print(f"Reinitialization {'succeeded' if success else 'failed'}")
 
 Note:
-    The module initializes the component automatically at import time.
+    The module initializes the component automatically on first use.
     Component initialization failures are logged but don't raise exceptions,
     allowing the application to start even if charts can't be rendered.
 
@@ -71,6 +73,8 @@ Raises:
 """
 
 # Standard Imports
+import threading
+import warnings
 from pathlib import Path
 from typing import Any, Callable, Optional
 
@@ -80,11 +84,16 @@ import streamlit.components.v1 as components
 # Local Imports
 from lightweight_charts_pro.logging_config import get_logger
 
-# Component function for Streamlit integration - initialized once at module load
+# Component function for Streamlit integration - initialized once on first use
 # This is a module-level singleton that holds the Streamlit component function
 # None indicates the component hasn't been initialized or initialization failed
 _component_func: Optional[Callable[..., Any]] = None
 
+# Whether initialization has run; guarded by _init_lock so concurrent sessions
+# declare the component only once
+_initialized = False
+_init_lock = threading.Lock()
+
 # Initialize logger for this module
 # Uses hierarchical naming: streamlit_lightweight_charts_pro.component
 logger = get_logger("component")
@@ -148,6 +157,9 @@ def get_component_func() -> Optional[Callable[..., Any]]:
             - Import errors
             - Permission issues
     """
+    # Declare the component on first use rather than at import time
+    _ensure_initialized()
+
     # Check if component function was successfully initialized
     if _component_func is None:
         # Log warning to help diagnose why component is unavailable
@@ -209,6 +221,9 @@ def debug_component_status() -> dict[str, Any]:
         This function only checks production mode files. Development mode
         status depends on the dev server running at localhost:3001.
     """
+    # Report the state after initialization, which may not have happened yet
+    _ensure_initialized()
+
     # Initialize status dictionary with basic component information
     # This will be populated with detailed information below
     status: dict[str, Any] = {
@@ -315,7 +330,10 @@ def reinitialize_component() -> bool:
     """
     # Declare _component_func as global so we can modify it
     # Without this, we'd create a new local variable instead
-    global _component_func  # pylint: disable=global-statement  # noqa: PLW0603
+    global _component_func, _initialized  # pylint: disable=global-statement  # noqa: PLW0603
+
+    # An explicit reinitialization replaces the lazy first-use one
+    _initialized = True
 
     # Log the reinitialization attempt for debugging
     logger.info("Attempting to reinitialize component...")
@@ -373,8 +391,8 @@ def reinitialize_component() -> bool:
 def _initialize_component() -> None:
     """Initialize the component function based on environment.
 
-    This is an internal function called automatically at module import time
-    to set up the Streamlit component. It detects the current mode
+    This is an internal function called automatically on first use (see
+    _ensure_initialized) to set up the Streamlit component. It detects the current mode
     (production vs development) and initializes the component accordingly.
 
     The function is idempotent - calling it multiple times is safe, though
@@ -406,7 +424,8 @@ def _initialize_component() -> None:
         - May attempt filesystem operations in production mode
 
     Note:
-        This function is called automatically when the module is imported.
+        This function is called automatically the first time the component
+        function is requested.
         Manual calls to this function are unnecessary and may cause
         duplicate logging. Use reinitialize_component() instead for
         manual reinitialization.
@@ -514,7 +533,49 @@ def _initialize_component() -> None:
             _component_func = None
 
 
-# Initialize component function automatically at module import time
-# This ensures the component is ready to use as soon as the module is imported
-# Any initialization errors are logged but don't prevent import
-_initialize_component()
+def _check_frontend_build() -> None:
+    """Warn if the frontend is not built (development installs only).
+
+    Only active when the package is installed in development mode (with
+    ``pip install -e``), where the frontend must be built by hand. Called on
+    first component use instead of at import, since resolving the
+    distribution and comparing paths costs milliseconds on every import.
+
+    Returns:
+        None: This function has no return value, it warns if frontend is missing.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from importlib.metadata import distribution
+
+    try:
+        dist = distribution("streamlit_lightweight_charts_pro")
+
+        # Verify this is a development install by checking file paths
+        if dist.locate_file("") and Path(dist.locate_file("")).samefile(
+            Path(__file__).parent.parent,
+        ):
+            # The build directory contains compiled frontend assets
+            build_dir = Path(__file__).parent / "frontend" / "build"
+            if not build_dir.exists() or not (build_dir / "static").exists():
+                warnings.warn(
+                    "Frontend assets not found in development mode. "
+                    "Run 'streamlit-lightweight-charts-pro build-frontend' to build them.",
+                    UserWarning,
+                    stacklevel=3,
+                )
+    except (ImportError, OSError):
+        # Not installed as a distribution, or not in development mode
+        pass
+
+
+def _ensure_initialized() -> None:
+    """Run the frontend check and component declaration once, on first use."""
+    global _initialized  # pylint: disable=global-statement  # noqa: PLW0603
+
+    if _initialized:
+        return
+    with _init_lock:
+        if not _initialized:
+            _check_frontend_build()
+            _initialize_component()
+            _initialized = True
@@ -0,0 +1,330 @@
+"""Async data sources resolved concurrently for a page of charts.
+
+A chart typically needs several independent loads (prices, trades, signals,
+annotations). Sources implementing ``AsyncDataSource`` are awaited together
+by ``fetch_all`` (or ``ChartManager.fetch_data``), so a page waits for the
+slowest load instead of the sum of all of them.
+
+All fetches run on one event loop owned by a background thread and kept for
+the life of the process. The Streamlit script thread blocks only on the
+combined result, and clients bound to that loop (HTTP sessions, database
+pools) stay valid across reruns and sessions.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro import ChartManager
+    from streamlit_lightweight_charts_pro.data.async_source import (
+        CachedSource,
+        FetchRequest,
+        TimeRange,
+    )
+
+    prices = CachedSource(PriceApi(), ttl=60)  # create once, e.g. st.cache_resource
+    window = TimeRange("2024-06-03", "2024-06-08")
+
+    manager = ChartManager()
+    data = manager.fetch_data(
+        {
+            "prices": FetchRequest(prices, window, "1m"),
+            "trades": FetchRequest(trades_api, window),
+            "signals": FetchRequest(signals_api, window, "1m", timeout=2.0),
+        },
+        timeout=5.0,
+    )
+    manager.from_price_volume_dataframe(data["prices"])
+    ```
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional, Protocol, Union, runtime_checkable
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.exceptions import TypeValidationError, ValueValidationError
+from lightweight_charts_pro.logging_config import get_logger
+
+from streamlit_lightweight_charts_pro.data.bars import BarSlice
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+from streamlit_lightweight_charts_pro.exceptions import DataFetchTimeoutError
+
+logger = get_logger(__name__)
+
+# Default size of a CachedSource
+DEFAULT_CACHE_ENTRIES = 128
+
+
+class TimeRange(NamedTuple):
+    """Time window of a fetch; None leaves a side unbounded.
+
+    Attributes:
+        start: First time to include.
+        end: Last time to include.
+    """
+
+    start: Any = None
+    end: Any = None
+
+    def seconds(self) -> tuple[Optional[int], Optional[int]]:
+        """Return the bounds as UNIX seconds."""
+        return tuple(  # type: ignore[return-value]
+            None if bound is None else int(normalize_time_array([bound])[0]) for bound in self
+        )
+
+
+@runtime_checkable
+class AsyncDataSource(Protocol):
+    """Source of chart data fetched asynchronously for a time window."""
+
+    async def fetch(self, time_range: TimeRange, interval: Optional[str] = None) -> Any:
+        """Return the data of a time window, e.g. a DataFrame or a list of trades."""
+
+
+@dataclass(frozen=True)
+class FetchRequest:
+    """One load of a page.
+
+    Attributes:
+        source: Source to fetch from.
+        time_range: Time window. Defaults to unbounded.
+        interval: Interval passed to the source, e.g. "1m".
+        timeout: Seconds before the load fails. Defaults to the timeout of
+            the whole fetch.
+    """
+
+    source: AsyncDataSource
+    time_range: TimeRange = TimeRange()
+    interval: Optional[str] = None
+    timeout: Optional[float] = None
+
+
+class CachedSource:
+    """Caching wrapper of an async source.
+
+    Results are kept per ``(time range, interval)`` for ``ttl`` seconds, the
+    least recently used dropped beyond ``max_entries``. Concurrent fetches
+    of the same key share one call to the wrapped source. Results are
+    shared between callers, so treat them as read-only.
+
+    The cache belongs to the wrapper: keep the wrapper for the life of the
+    app (e.g. with ``st.cache_resource``) to share results across reruns.
+    """
+
+    def __init__(
+        self,
+        source: AsyncDataSource,
+        ttl: Optional[float] = None,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+    ):
+        """Wrap a source.
+
+        Args:
+            source: Source to cache.
+            ttl: Seconds a result stays valid. Defaults to None (until evicted).
+            max_entries: Largest number of cached results.
+
+        Raises:
+            ValueValidationError: If ttl or max_entries is not positive.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueValidationError.positive_value("ttl", ttl)
+        if max_entries <= 0:
+            raise ValueValidationError.positive_value("max_entries", max_entries)
+        self.source = source
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Future] = {}
+
+    async def fetch(self, time_range: TimeRange, interval: Optional[str] = None) -> Any:
+        """Return the cached result of a window, fetching it on a miss."""
+        key = (TimeRange(*time_range).seconds(), interval)
+        entry = self._entries.get(key)
+        if entry is not None and (self.ttl is None or time.monotonic() < entry[0]):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        pending = self._pending.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._load(key, time_range, interval))
+            self._pending[key] = pending
+        # A waiter timing out must not cancel the load shared with others
+        return await asyncio.shield(pending)
+
+    async def _load(self, key: Hashable, time_range: TimeRange, interval: Optional[str]) -> Any:
+        try:
+            result = await self.source.fetch(time_range, interval)
+        finally:
+            del self._pending[key]
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (expires, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
+class InMemorySource:
+    """Async source serving data held in memory, for tests and demos.
+
+    Serves a pandas DataFrame (filtered on its time column), a ``BarSlice``
+    (filtered on its times) or any other value (returned as is). A mapping
+    of interval to such data serves each interval separately. ``delay``
+    simulates network latency and ``calls`` counts fetches.
+    """
+
+    def __init__(self, data: Any, time_column: str = "time", delay: float = 0.0):
+        """Initialize the source.
+
+        Args:
+            data: Data to serve, or a mapping of interval to data.
+            time_column: Time column of DataFrame data.
+            delay: Seconds each fetch waits before returning. Defaults to 0.
+        """
+        self.data = data
+        self.time_column = time_column
+        self.delay = delay
+        self.calls = 0
+
+    async def fetch(self, time_range: TimeRange, interval: Optional[str] = None) -> Any:
+        """Return the data within a time window."""
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        data = self.data
+        if isinstance(data, Mapping):
+            data = data[interval]
+        start, end = TimeRange(*time_range).seconds()
+        if isinstance(data, BarSlice):
+            times = data.times
+        elif isinstance(data, pd.DataFrame):
+            times = normalize_time_array(data[self.time_column])
+        else:
+            return data
+        mask = np.ones(times.shape[0], dtype=bool)
+        if start is not None:
+            mask &= times >= start
+        if end is not None:
+            mask &= times <= end
+        if isinstance(data, BarSlice):
+            return BarSlice(
+                data.symbol,
+                data.interval,
+                {name: column[mask] for name, column in data.columns.items()},
+            )
+        return data.loc[mask].reset_index(drop=True)
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared fetch event loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="lightweight-charts-fetch", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+async def _fetch_one(key: Hashable, request: FetchRequest, timeout: Optional[float]) -> Any:
+    limit = request.timeout if request.timeout is not None else timeout
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            request.source.fetch(request.time_range, request.interval), limit
+        )
+    except asyncio.TimeoutError as exc:
+        raise DataFetchTimeoutError(key, limit) from exc
+    logger.debug("Fetched %r in %.1f ms", key, (time.perf_counter() - started) * 1e3)
+    return result
+
+
+async def _fetch_all(
+    requests: Mapping[Hashable, FetchRequest],
+    timeout: Optional[float],
+    return_exceptions: bool,
+) -> dict[Hashable, Any]:
+    tasks = [
+        asyncio.ensure_future(_fetch_one(key, request, timeout))
+        for key, request in requests.items()
+    ]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        # One load failed: the page cannot be built, stop the others
+        for task in tasks:
+            task.cancel()
+        raise
+    return dict(zip(requests, results))
+
+
+def fetch_all(
+    requests: Mapping[Hashable, Union[FetchRequest, AsyncDataSource]],
+    timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> dict[Hashable, Any]:
+    """Fetch several loads concurrently and wait for all of them.
+
+    Args:
+        requests: Loads by key. A bare source is fetched unbounded.
+        timeout: Seconds each load may take, unless its request sets its
+            own. Defaults to None (no limit).
+        return_exceptions: Return the exception of a failed load as its
+            result instead of raising it. Defaults to False.
+
+    Returns:
+        dict: Results by key, in the order of ``requests``.
+
+    Raises:
+        TypeValidationError: If a request has no async source.
+        DataFetchTimeoutError: If a load times out (and return_exceptions
+            is False).
+        RuntimeError: If called from a coroutine running on the fetch loop.
+    """
+    normalized: dict[Hashable, FetchRequest] = {}
+    for key, request in requests.items():
+        if not isinstance(request, FetchRequest):
+            request = FetchRequest(request)
+        if not isinstance(request.source, AsyncDataSource):
+            raise TypeValidationError(f"requests[{key!r}].source", "AsyncDataSource")
+        normalized[key] = request
+    if not normalized:
+        return {}
+
+    loop = get_event_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("fetch_all cannot block the fetch loop; await the sources instead")
+
+    started = time.perf_counter()
+    future = asyncio.run_coroutine_threadsafe(
+        _fetch_all(normalized, timeout, return_exceptions), loop
+    )
+    results = future.result()
+    logger.debug(
+        "Fetched %d loads concurrently in %.1f ms",
+        len(normalized),
+        (time.perf_counter() - started) * 1e3,
+    )
+    return results
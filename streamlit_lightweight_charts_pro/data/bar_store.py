@@ -0,0 +1,459 @@
+"""Memory-mapped, append-only columnar bar store.
+
+Bars are kept on local disk, one directory per symbol and interval, with one
+raw little-endian file per column and a small ``meta.json`` holding the
+schema and the committed row count::
+
+    root/
+        AAPL/
+            1m/
+                meta.json
+                time.bin      int64 UNIX seconds, strictly ascending
+                open.bin      float64
+                ...
+
+The sorted time column is the index: a time-range query is two binary
+searches over a memory-mapped array, and the returned ``BarSlice`` holds
+views into the mapped files. Only the pages of the requested range are ever
+read from disk, and a series built from a slice shares those views.
+
+Appends write the new rows first and then replace ``meta.json`` atomically,
+so readers in other sessions or processes always see a consistent prefix.
+Coarser intervals (an interval pyramid, e.g. 1m → 5m → 1h → 1d) are built
+with ``build_pyramid``; ``best_interval`` picks the finest level that fits a
+point budget for the visible range.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro import CandlestickSeries
+    from streamlit_lightweight_charts_pro.data.bar_store import BarStore
+
+    store = BarStore("/data/bars")
+    store.append("AAPL", "1m", minute_bars_df)
+    store.build_pyramid("AAPL", "1m", ["5m", "1h", "1d"])
+
+    interval = store.best_interval("AAPL", start, end, max_points=5_000)
+    series = store.read("AAPL", interval, start, end).to_series(CandlestickSeries)
+    ```
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from lightweight_charts_pro.exceptions import ValueValidationError
+from lightweight_charts_pro.logging_config import get_logger
+from lightweight_charts_pro.type_definitions import ColumnNames
+
+from streamlit_lightweight_charts_pro.data.bars import BAR_AGGREGATIONS, BarSlice
+from streamlit_lightweight_charts_pro.data.interop import column_names, get_column, is_table
+from streamlit_lightweight_charts_pro.data.sanitize import reduce_runs
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+
+logger = get_logger(__name__)
+
+_META_FILE = "meta.json"
+_TIME = ColumnNames.TIME.value
+
+# Interval suffixes and their length in seconds
+_INTERVAL_UNITS = {"s": 1, "m": 60, "min": 60, "h": 3_600, "d": 86_400, "w": 604_800}
+_INTERVAL_PATTERN = re.compile(r"^(\d+)(s|min|m|h|d|w)$")
+
+# Staging (".1h-k3j9x2") and retired (".1h-retired-k3j9x2") level directories
+# left in a symbol directory by build_pyramid
+_LEFTOVER_PATTERN = re.compile(r"^\.\w+-(retired-)?")
+
+# Age after which a staging directory is taken as left by a crashed rebuild
+_STALE_STAGING_SECONDS = 3_600
+
+
+def interval_seconds(interval: str) -> int:
+    """Return the length of an interval such as "5m", "1h" or "1d" in seconds.
+
+    Raises:
+        ValueValidationError: If the interval is not recognized.
+    """
+    match = _INTERVAL_PATTERN.match(interval)
+    if not match or int(match.group(1)) == 0:
+        raise ValueValidationError(
+            "interval", f"must look like '1m', '5m', '1h' or '1d', got {interval!r}"
+        )
+    return int(match.group(1)) * _INTERVAL_UNITS[match.group(2)]
+
+
+def _is_interval(name: str) -> bool:
+    """Return whether a name is an interval accepted by ``interval_seconds``."""
+    match = _INTERVAL_PATTERN.match(name)
+    return match is not None and int(match.group(1)) > 0
+
+
+def _check_name(kind: str, name: str) -> str:
+    """Reject symbol and interval names that are not a single path component."""
+    if not name or name in (".", "..") or Path(name).name != name or "\\" in name:
+        raise ValueValidationError(kind, f"is not a valid directory name: {name!r}")
+    return name
+
+
+def _to_seconds(value: Any) -> Optional[int]:
+    """Convert a time bound to UNIX seconds (None stays None)."""
+    if value is None:
+        return None
+    return int(normalize_time_array([value])[0])
+
+
+class BarStore:
+    """Append-only columnar bar store backed by memory-mapped files.
+
+    Safe for concurrent readers; appends to one symbol and interval should
+    come from one writer at a time (appends within a process are serialized).
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """Open (or create) a store.
+
+        Args:
+            root: Directory holding the store.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        self._clean_leftovers()
+
+    def _clean_leftovers(self) -> None:
+        """Remove level directories left behind by interrupted pyramid rebuilds.
+
+        Retired levels are no longer referenced and go right away. Staging
+        directories are only removed once stale, since another process may
+        still be writing one; a level lost to a crash mid-swap comes back
+        with the next ``build_pyramid``.
+        """
+        now = time.time()
+        for symbol_dir in self.root.iterdir():
+            if not symbol_dir.is_dir():
+                continue
+            for entry in symbol_dir.iterdir():
+                match = _LEFTOVER_PATTERN.match(entry.name)
+                if not match:
+                    continue
+                try:
+                    if not match.group(1) and now - entry.stat().st_mtime < _STALE_STAGING_SECONDS:
+                        continue
+                except OSError:
+                    # Swapped in or removed concurrently
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def _path(self, symbol: str, interval: str) -> Path:
+        return self.root / _check_name("symbol", symbol) / _check_name("interval", interval)
+
+    @staticmethod
+    def _read_meta(path: Path) -> Optional[dict[str, Any]]:
+        try:
+            return json.loads((path / _META_FILE).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write_meta(path: Path, meta: dict[str, Any]) -> None:
+        staging = path / f".{_META_FILE}.{os.getpid()}.{threading.get_ident()}"
+        staging.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(staging, path / _META_FILE)
+
+    def symbols(self) -> list[str]:
+        """Return the stored symbols."""
+        return sorted(path.name for path in self.root.iterdir() if path.is_dir())
+
+    def intervals(self, symbol: str) -> list[str]:
+        """Return the stored intervals of a symbol, finest first."""
+        path = self.root / _check_name("symbol", symbol)
+        if not path.is_dir():
+            return []
+        names = [
+            entry.name
+            for entry in path.iterdir()
+            if _is_interval(entry.name) and (entry / _META_FILE).exists()
+        ]
+        return sorted(names, key=interval_seconds)
+
+    def length(self, symbol: str, interval: str) -> int:
+        """Return the number of stored bars."""
+        meta = self._read_meta(self._path(symbol, interval))
+        return meta["length"] if meta else 0
+
+    def append(
+        self,
+        symbol: str,
+        interval: str,
+        data: Any,
+        column_mapping: Optional[dict[str, str]] = None,
+    ) -> int:
+        """Append bars from a table.
+
+        The first append defines the stored columns: the time column plus
+        every other (numeric) column of the table. Rows are sorted by time,
+        later rows win for repeated times, and rows at or before the last
+        stored bar are skipped, so overlapping downloads can be appended
+        as-is.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars, e.g. "1m".
+            data: pandas DataFrame, PyArrow Table or Polars DataFrame.
+            column_mapping: Maps store column names (``time``, ``open``, ...)
+                to table column names. Unmapped columns keep their name.
+
+        Returns:
+            int: Number of bars appended.
+
+        Raises:
+            ValueValidationError: If the table has no time column, its
+                columns differ from the stored ones or are not numeric.
+        """
+        if not is_table(data):
+            raise ValueValidationError("data", "must be a DataFrame, Arrow table or Polars frame")
+        to_table = {_TIME: _TIME, **(column_mapping or {})}
+        mapped = set(to_table.values())
+        to_table.update({name: name for name in column_names(data) if name not in mapped})
+        if to_table[_TIME] not in column_names(data):
+            raise ValueValidationError("data", f"has no '{to_table[_TIME]}' column")
+
+        times = normalize_time_array(get_column(data, to_table[_TIME]))
+        columns = {_TIME: times}
+        for name, column in to_table.items():
+            if name == _TIME:
+                continue
+            try:
+                columns[name] = np.asarray(get_column(data, column), dtype="<f8")
+            except (TypeError, ValueError) as exc:
+                raise ValueValidationError(name, "must be numeric") from exc
+
+        # Sort by time and keep the last row of each repeated time
+        order = np.argsort(times, kind="stable")
+        times = times[order]
+        keep = np.append(times[1:] != times[:-1], True) if len(times) else times.astype(bool)
+        rows = order[keep]
+
+        path = self._path(symbol, interval)
+        with self._write_lock:
+            path.mkdir(parents=True, exist_ok=True)
+            meta = self._read_meta(path)
+            if meta is None:
+                meta = {
+                    "columns": {name: "<i8" if name == _TIME else "<f8" for name in columns},
+                    "length": 0,
+                    "last_time": None,
+                }
+            elif set(meta["columns"]) != set(columns):
+                raise ValueValidationError(
+                    "data",
+                    f"columns {sorted(columns)} differ from stored {sorted(meta['columns'])}",
+                )
+            if meta["last_time"] is not None:
+                newer = rows[columns[_TIME][rows] > meta["last_time"]]
+                if len(newer) < len(rows):
+                    skipped = len(rows) - len(newer)
+                    logger.debug("Skipped %d stored %s %s bars", skipped, symbol, interval)
+                rows = newer
+            if len(rows) == 0:
+                return 0
+
+            for name, dtype in meta["columns"].items():
+                file_path = path / f"{name}.bin"
+                with open(file_path, "ab") as handle:
+                    # Drop rows of an append interrupted before its commit
+                    handle.truncate(meta["length"] * np.dtype(dtype).itemsize)
+                    handle.write(np.asarray(columns[name][rows], dtype=dtype).tobytes())
+            meta["length"] += len(rows)
+            meta["last_time"] = int(columns[_TIME][rows[-1]])
+            self._write_meta(path, meta)
+        return len(rows)
+
+    def _columns(
+        self, symbol: str, interval: str, columns: Optional[Sequence[str]]
+    ) -> dict[str, np.ndarray]:
+        """Map the committed rows of the requested columns."""
+        path = self._path(symbol, interval)
+        meta = self._read_meta(path)
+        if meta is None:
+            raise ValueValidationError("symbol", f"{symbol!r} has no {interval!r} bars")
+        requested = meta["columns"] if columns is None else columns
+        names = [_TIME, *(name for name in requested if name != _TIME)]
+        unknown = set(names) - set(meta["columns"])
+        if unknown:
+            raise ValueValidationError("columns", f"not stored: {sorted(unknown)}")
+        length = meta["length"]
+        mapped = {}
+        for name in names:
+            dtype = meta["columns"][name]
+            mapped[name] = (
+                np.memmap(path / f"{name}.bin", dtype=dtype, mode="r", shape=(length,))
+                if length
+                else np.empty(0, dtype=dtype)
+            )
+        return mapped
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> BarSlice:
+        """Return the bars with ``start <= time <= end`` as memory-mapped views.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars.
+            start: First time to include (any time ``normalize_time_array``
+                accepts). Defaults to the first bar.
+            end: Last time to include. Defaults to the last bar.
+            columns: Columns to read besides time. Defaults to all.
+
+        Returns:
+            BarSlice: The bars in range.
+
+        Raises:
+            ValueValidationError: If the symbol has no bars for the interval
+                or a column is not stored.
+        """
+        mapped = self._columns(symbol, interval, columns)
+        times = mapped[_TIME]
+        first, last = 0, len(times)
+        if start is not None:
+            first = int(np.searchsorted(times, _to_seconds(start), "left"))
+        if end is not None:
+            last = int(np.searchsorted(times, _to_seconds(end), "right"))
+        return BarSlice(symbol, interval, {name: mapped[name][first:last] for name in mapped})
+
+    def tail(
+        self,
+        symbol: str,
+        interval: str,
+        count: int,
+        end: Any = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> BarSlice:
+        """Return the last ``count`` bars before ``end`` as memory-mapped views.
+
+        Pages back through history: pass the time of the oldest loaded bar
+        as ``end`` to get the page before it.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars.
+            count: Number of bars.
+            end: Exclusive upper time bound. Defaults to after the last bar.
+            columns: Columns to read besides time. Defaults to all.
+
+        Returns:
+            BarSlice: Up to ``count`` bars.
+        """
+        if count < 0:
+            raise ValueValidationError.positive_value("count", count)
+        mapped = self._columns(symbol, interval, columns)
+        times = mapped[_TIME]
+        last = len(times) if end is None else int(np.searchsorted(times, _to_seconds(end), "left"))
+        first = max(last - count, 0)
+        return BarSlice(symbol, interval, {name: mapped[name][first:last] for name in mapped})
+
+    def build_pyramid(self, symbol: str, interval: str, targets: Sequence[str]) -> None:
+        """Aggregate bars into coarser intervals stored next to them.
+
+        Each target level is rebuilt from ``interval`` and replaces the
+        previous level atomically. Open takes the first bar of a bucket,
+        high the max, low the min, close the last and volume the sum; other
+        columns the last bar.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Source interval, e.g. "1m".
+            targets: Coarser intervals, e.g. ["5m", "1h", "1d"].
+
+        Raises:
+            ValueValidationError: If a target is not coarser than the source.
+        """
+        source = self.read(symbol, interval)
+        base = interval_seconds(interval)
+        for target in targets:
+            seconds = interval_seconds(target)
+            if seconds <= base:
+                raise ValueValidationError(
+                    "targets", f"{target!r} is not coarser than {interval!r}"
+                )
+            buckets = source.times // seconds * seconds
+            starts = np.flatnonzero(np.append(True, buckets[1:] != buckets[:-1]))
+            if len(source) == 0:
+                starts = starts[:0]
+            ends = np.append(starts[1:] - 1, len(source) - 1).astype(np.intp)
+            columns = {_TIME: buckets[starts]}
+            for name, column in source.columns.items():
+                if name != _TIME:
+                    columns[name] = reduce_runs(
+                        np.asarray(column), BAR_AGGREGATIONS.get(name, "last"), starts, ends
+                    )
+            self._replace_level(symbol, target, columns)
+
+    def _replace_level(self, symbol: str, interval: str, columns: dict[str, np.ndarray]) -> None:
+        """Write a whole level to a staging directory and swap it in."""
+        path = self._path(symbol, interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{interval}-", dir=path.parent))
+        dtypes = {name: "<i8" if name == _TIME else "<f8" for name in columns}
+        for name, column in columns.items():
+            np.ascontiguousarray(column, dtype=dtypes[name]).tofile(staging / f"{name}.bin")
+        length = len(columns[_TIME])
+        self._write_meta(
+            staging,
+            {
+                "columns": dtypes,
+                "length": length,
+                "last_time": int(columns[_TIME][-1]) if length else None,
+            },
+        )
+        with self._write_lock:
+            retired = None
+            if path.exists():
+                retired = Path(tempfile.mkdtemp(prefix=f".{interval}-retired-", dir=path.parent))
+                os.replace(path, retired)
+            os.replace(staging, path)
+        if retired is not None:
+            # Open memory maps keep the old files alive until they are closed
+            shutil.rmtree(retired, ignore_errors=True)
+
+    def best_interval(
+        self,
+        symbol: str,
+        start: Any = None,
+        end: Any = None,
+        max_points: int = 5_000,
+    ) -> str:
+        """Return the finest stored interval with at most ``max_points`` bars in range.
+
+        Args:
+            symbol: Symbol of the bars.
+            start: First time of the visible range. Defaults to the first bar.
+            end: Last time of the visible range. Defaults to the last bar.
+            max_points: Largest number of bars to load.
+
+        Returns:
+            str: The interval, or the coarsest one if none fits.
+
+        Raises:
+            ValueValidationError: If the symbol has no bars.
+        """
+        intervals = self.intervals(symbol)
+        if not intervals:
+            raise ValueValidationError("symbol", f"{symbol!r} has no bars")
+        for interval in intervals:
+            if len(self.read(symbol, interval, start, end, columns=[])) <= max_points:
+                return interval
+        return intervals[-1]
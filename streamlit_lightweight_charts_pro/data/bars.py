@@ -0,0 +1,155 @@
+"""Time-range slices of bar data and the interface of bar sources.
+
+A ``BarSlice`` is a set of aligned columns for one symbol and interval:
+``time`` as int64 UNIX seconds, sorted ascending, and one array per field
+(open, high, low, close, volume, ...). Bar sources such as ``BarStore``
+answer time-range and last-N queries with slices, and a slice turns into a
+column-backed series without building per-bar objects.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro import CandlestickSeries, HistogramSeries
+
+    bars = store.read("AAPL", "1m", start="2024-06-03", end="2024-06-08")
+    price = bars.to_series(CandlestickSeries)
+    volume = bars.to_series(HistogramSeries, {"value": "volume"}, pane_id=1)
+    ```
+"""
+
+import dataclasses
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol, runtime_checkable
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.exceptions import RequiredFieldError
+from lightweight_charts_pro.type_definitions import ColumnNames
+
+from streamlit_lightweight_charts_pro.data.columnar import ColumnarData
+
+# Fields aggregated when bars are combined into coarser intervals; fields not
+# listed take the value of the last bar
+BAR_AGGREGATIONS: Mapping[str, str] = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+
+@dataclass(frozen=True)
+class BarSlice:
+    """Aligned bar columns for one symbol and interval.
+
+    Columns may be views into memory-mapped files; treat them as read-only.
+
+    Attributes:
+        symbol: Symbol of the bars.
+        interval: Interval of the bars, e.g. "1m".
+        columns: ``time`` (int64 UNIX seconds, ascending) and one array per field.
+    """
+
+    symbol: str
+    interval: str
+    columns: Mapping[str, np.ndarray]
+
+    def __len__(self) -> int:
+        """Return the number of bars."""
+        return len(self.columns[ColumnNames.TIME.value])
+
+    @property
+    def times(self) -> np.ndarray:
+        """Bar times as int64 UNIX seconds."""
+        return self.columns[ColumnNames.TIME.value]
+
+    @property
+    def start(self) -> Optional[int]:
+        """Time of the first bar, or None if the slice is empty."""
+        return int(self.times[0]) if len(self) else None
+
+    @property
+    def end(self) -> Optional[int]:
+        """Time of the last bar, or None if the slice is empty."""
+        return int(self.times[-1]) if len(self) else None
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the bars as a DataFrame (copies the columns)."""
+        return pd.DataFrame({name: np.array(column) for name, column in self.columns.items()})
+
+    def to_columnar(
+        self,
+        data_class: type,
+        field_to_column: Optional[Mapping[str, str]] = None,
+    ) -> ColumnarData:
+        """Return the bars as column-backed data, without copying.
+
+        Args:
+            data_class: Data class of the points, e.g. ``CandlestickData``.
+            field_to_column: Mapping of data class fields to slice columns.
+                Fields of the data class found among the columns are mapped
+                by name.
+
+        Returns:
+            ColumnarData: Data sharing the slice's arrays.
+
+        Raises:
+            RequiredFieldError: If a required field has no column.
+        """
+        mapping = {
+            field.name: field.name
+            for field in dataclasses.fields(data_class)
+            if field.init and field.name in self.columns
+        }
+        mapping.update(field_to_column or {})
+        missing = data_class.required_columns - set(mapping)
+        if missing:
+            raise RequiredFieldError(sorted(missing)[0])
+        return ColumnarData(
+            data_class, {field: self.columns[column] for field, column in mapping.items()}
+        )
+
+    def to_series(
+        self,
+        series_class: type,
+        field_to_column: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Build a series from the bars, without copying.
+
+        Args:
+            series_class: Column-backed series class, e.g. ``CandlestickSeries``.
+            field_to_column: Mapping of data class fields to slice columns,
+                see ``to_columnar``.
+            **kwargs: Arguments for the series constructor.
+
+        Returns:
+            Series: The series.
+        """
+        return series_class(self.to_columnar(series_class.data_class, field_to_column), **kwargs)
+
+
+@runtime_checkable
+class BarSource(Protocol):
+    """Source answering time-range and last-N queries with bar slices."""
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        columns: Optional[list[str]] = None,
+    ) -> BarSlice:
+        """Return the bars with ``start <= time <= end``."""
+
+    def tail(
+        self,
+        symbol: str,
+        interval: str,
+        count: int,
+        end: Any = None,
+        columns: Optional[list[str]] = None,
+    ) -> BarSlice:
+        """Return the last ``count`` bars before ``end`` (exclusive)."""
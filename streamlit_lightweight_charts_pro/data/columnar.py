@@ -0,0 +1,454 @@
+"""Column-backed series data for Streamlit Lightweight Charts Pro.
+
+This module provides ColumnarData, a read-only sequence that stores series
+data as one NumPy array per data class field instead of one Python object
+per row. Ingestion from pandas, PyArrow or Polars tables validates,
+normalizes and sanitizes (see ``data.sanitize``) whole columns at once, and
+serialization builds the frontend records straight from the arrays.
+
+Per-point data objects (LineData, OhlcvData, ...) are only created when user
+code indexes or iterates the sequence, so existing code that walks
+``series.data`` keeps working unchanged.
+"""
+
+import dataclasses
+import hashlib
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.data import (
+    Data,
+    GradientRibbonData,
+    OhlcData,
+    OhlcvData,
+    RibbonData,
+    TrendFillData,
+)
+from lightweight_charts_pro.exceptions import (
+    ColorValidationError,
+    RequiredFieldError,
+    ValueValidationError,
+)
+from lightweight_charts_pro.logging_config import get_logger
+from lightweight_charts_pro.type_definitions import ColumnNames
+from lightweight_charts_pro.utils import is_valid_color, snake_to_camel
+
+from streamlit_lightweight_charts_pro.data.interop import get_column
+from streamlit_lightweight_charts_pro.data.palette import encode_palette, is_color_field
+from streamlit_lightweight_charts_pro.data.sanitize import (
+    DuplicatePolicy,
+    SanitationReport,
+    SanitizeMode,
+    sanitize_columns,
+)
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# NaN handling per data class field, mirroring the per-row __post_init__ rules.
+# "raise": NaN is rejected, "none": NaN is omitted from the serialized point.
+# Numeric fields not listed here serialize NaN as 0.0 like SerializableMixin.
+_NAN_POLICIES: tuple[tuple[type, tuple[str, ...], str], ...] = (
+    (OhlcData, ("open", "high", "low", "close"), "raise"),
+    (OhlcvData, ("volume",), "raise"),
+    (RibbonData, ("upper", "lower"), "none"),
+    (GradientRibbonData, ("gradient",), "raise"),
+    (TrendFillData, ("trend_line", "base_line"), "none"),
+)
+
+
+def _field_kind(field_type: Any) -> str:
+    """Classify a dataclass field annotation as "float", "int" or "object"."""
+    type_name = field_type if isinstance(field_type, str) else repr(field_type)
+    if field_type is float or "float" in type_name:
+        return "float"
+    if field_type is int or type_name == "int":
+        return "int"
+    return "object"
+
+
+class ColumnarData(Sequence):
+    """Read-only sequence of data points backed by NumPy column arrays.
+
+    Each data class field is stored as a single array and the time column is
+    kept as int64 UNIX seconds. Indexing with an integer materializes one data
+    object on demand; slicing returns another ColumnarData sharing the same
+    underlying buffers. Rows flagged as whitespace serialize as time-only
+    points and materialize as plain ``Data`` objects.
+
+    Attributes:
+        data_class: Data class used to materialize individual points.
+        report: SanitationReport of the last sanitation pass, or None.
+
+    Example:
+        ```python
+        from streamlit_lightweight_charts_pro.data import LineData
+        from streamlit_lightweight_charts_pro.data.columnar import ColumnarData
+
+        data = ColumnarData.from_dataframe(
+            LineData, df, {"time": "datetime", "value": "close"}
+        )
+        records = data.to_records()  # No LineData objects are created
+        first = data[0]  # LineData(time=..., value=...)
+        ```
+    """
+
+    def __init__(
+        self,
+        data_class: type[Data],
+        columns: Mapping[str, np.ndarray],
+        whitespace: Optional[np.ndarray] = None,
+    ):
+        """Initialize column-backed data.
+
+        Args:
+            data_class: Data class describing the fields of each point.
+            columns: Mapping of data class field name to column array. All
+                arrays must have the same length and ``time`` must be present.
+            whitespace: Optional boolean mask of rows to serialize as
+                whitespace (time-only) points.
+
+        Raises:
+            ValueValidationError: If the time column is missing or the column
+                lengths differ.
+        """
+        if ColumnNames.TIME.value not in columns:
+            raise ValueValidationError("columns", "must include a time column")
+        lengths = {len(column) for column in columns.values()}
+        if whitespace is not None:
+            lengths.add(len(whitespace))
+        if len(lengths) > 1:
+            raise ValueValidationError("columns", "must all have the same length")
+
+        self.data_class = data_class
+        self.report: Optional[SanitationReport] = None
+        self._columns = dict(columns)
+        self._whitespace = whitespace if whitespace is not None and whitespace.any() else None
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        data_class: type[Data],
+        data_frame: Any,
+        field_to_column: Mapping[str, str],
+        time_unit: str = "auto",
+        display_timezone: Optional[str] = None,
+        sanitize: Union[SanitizeMode, str] = SanitizeMode.REPAIR,
+        duplicates: Union[DuplicatePolicy, str] = DuplicatePolicy.LAST,
+    ) -> "ColumnarData":
+        """Build column-backed data from a prepared table.
+
+        Args:
+            data_class: Data class describing the fields of each point.
+            data_frame: pandas DataFrame whose index has already been prepared
+                with ``Series.prepare_index``, PyArrow Table/RecordBatch or
+                Polars DataFrame.
+            field_to_column: Mapping of data class field name to column name.
+            time_unit: Unit of numeric epoch time columns, or "auto" to detect
+                it. See ``normalize_time_array``.
+            display_timezone: Optional timezone the time axis is shifted to.
+            sanitize: Sanitation mode applied before validation, see
+                ``sanitized``.
+            duplicates: Duplicate timestamp policy for repair mode.
+
+        Returns:
+            ColumnarData: Sanitized and validated column-backed data.
+
+        Raises:
+            RequiredFieldError: If a required field is not mapped.
+            TimeValidationError: If the time column cannot be normalized.
+            ValueValidationError: If a numeric column fails validation, or
+                strict sanitation finds unsorted, duplicate or NaN rows.
+            ColorValidationError: If a color column holds an invalid color.
+        """
+        missing = data_class.required_columns - set(field_to_column)
+        if missing:
+            raise RequiredFieldError(sorted(missing)[0])
+
+        kinds = {
+            field.name: _field_kind(field.type)
+            for field in dataclasses.fields(data_class)
+            if field.init
+        }
+        columns: dict[str, np.ndarray] = {}
+        for field_name, column_name in field_to_column.items():
+            if field_name not in kinds:
+                continue
+            values = get_column(data_frame, column_name)
+            if field_name == ColumnNames.TIME.value:
+                columns[field_name] = normalize_time_array(
+                    values, unit=time_unit, display_timezone=display_timezone
+                )
+            elif kinds[field_name] == "float":
+                columns[field_name] = cls._to_numeric(field_name, values, np.float64)
+            elif kinds[field_name] == "int":
+                columns[field_name] = cls._to_numeric(field_name, values, np.int64)
+            else:
+                columns[field_name] = np.asarray(values, dtype=object)
+
+        data = cls(data_class, columns).sanitized(sanitize, duplicates)
+        data.validate()
+        return data
+
+    @staticmethod
+    def _to_numeric(
+        field_name: str, values: Union[pd.Series, np.ndarray], dtype: type
+    ) -> np.ndarray:
+        """Convert a column to a NumPy array of the given numeric dtype."""
+        try:
+            array = np.asarray(pd.to_numeric(values), dtype=np.float64)
+        except (ValueError, TypeError) as exc:
+            raise ValueValidationError(field_name, "must be numeric") from exc
+        if dtype is np.float64:
+            return array
+        if np.isnan(array).any() or not np.array_equal(array, np.trunc(array)):
+            raise ValueValidationError(field_name, "must contain integers")
+        return array.astype(np.int64)
+
+    def _nan_policy(self, field_name: str) -> str:
+        """Return how NaN values of a numeric field are handled."""
+        for data_class, field_names, policy in _NAN_POLICIES:
+            if issubclass(self.data_class, data_class) and field_name in field_names:
+                return policy
+        return "zero"
+
+    def _value_fields(self) -> tuple[str, ...]:
+        """Return the float fields whose NaN makes a row a whitespace point."""
+        required = self.data_class.required_columns
+        return tuple(
+            name
+            for name, column in self._columns.items()
+            if column.dtype == np.float64
+            and (
+                self._nan_policy(name) == "raise"
+                or (name in required and self._nan_policy(name) != "none")
+            )
+        )
+
+    def sanitized(
+        self,
+        mode: Union[SanitizeMode, str] = SanitizeMode.REPAIR,
+        duplicates: Union[DuplicatePolicy, str] = DuplicatePolicy.LAST,
+        aggregations: Optional[Mapping[str, str]] = None,
+    ) -> "ColumnarData":
+        """Return a copy that is safe to hand to lightweight-charts.
+
+        In repair mode rows are sorted by time, duplicate timestamps are
+        resolved according to ``duplicates`` and rows with NaN in a value
+        field become whitespace points. Strict mode raises instead of fixing,
+        and fast mode returns the data unchanged. Repairs are logged and
+        recorded in ``report``.
+
+        Args:
+            mode: Sanitation mode ("strict", "repair" or "fast").
+            duplicates: Duplicate timestamp policy ("first", "last" or
+                "aggregate").
+            aggregations: Per-field aggregation overrides for "aggregate".
+
+        Returns:
+            ColumnarData: Sanitized data; ``self`` in fast mode.
+
+        Raises:
+            ValueValidationError: In strict mode, if the data would need
+                repairs.
+        """
+        columns, whitespace, report = sanitize_columns(
+            self._columns,
+            self._value_fields(),
+            mode=mode,
+            duplicates=duplicates,
+            aggregations=aggregations,
+            whitespace=self._whitespace,
+        )
+        if report is None:
+            return self
+        data = ColumnarData(self.data_class, columns, whitespace)
+        data.report = report
+        if report is not None and report.changed:
+            logger.warning("Sanitized %s data: %s", self.data_class.__name__, report)
+        return data
+
+    def validate(self) -> None:
+        """Validate all columns with vectorized checks.
+
+        Applies the same rules the per-row data classes enforce in
+        ``__post_init__``: NaN restrictions, OHLC relationships, non-negative
+        volume, trend direction values and color formats.
+
+        Raises:
+            ValueValidationError: If a column violates a data class rule.
+            ColorValidationError: If a color column holds an invalid color.
+        """
+        columns = self._columns
+        if self._whitespace is not None:
+            # Whitespace rows carry no values and are exempt from the rules
+            keep = ~self._whitespace
+            columns = {name: column[keep] for name, column in columns.items()}
+        for field_name, column in columns.items():
+            if column.dtype == np.float64 and self._nan_policy(field_name) == "raise":
+                if np.isnan(column).any():
+                    raise ValueValidationError(
+                        field_name,
+                        "NaN is not allowed. Missing data must be handled upstream "
+                        "(filter, forward-fill, or drop) before creating chart data.",
+                    )
+
+        if issubclass(self.data_class, OhlcData):
+            open_, high, low, close = (columns[name] for name in ("open", "high", "low", "close"))
+            if (open_ < 0).any() or (high < 0).any() or (low < 0).any() or (close < 0).any():
+                raise ValueValidationError.non_negative_value("all OHLC values")
+            if (high < low).any():
+                raise ValueValidationError("high", "must be greater than or equal to low")
+            if (open_ > high).any() or (open_ < low).any():
+                raise ValueValidationError("open", "must be between low and high")
+            if (close > high).any() or (close < low).any():
+                raise ValueValidationError("close", "must be between low and high")
+        if issubclass(self.data_class, OhlcvData) and (columns["volume"] < 0).any():
+            raise ValueValidationError("volume", "must be non-negative")
+        if issubclass(self.data_class, TrendFillData):
+            if not np.isin(columns["trend_direction"], (-1, 0, 1)).all():
+                raise ValueValidationError("trend_direction", "must be -1, 0, or 1")
+
+        for field_name, column in columns.items():
+            if column.dtype != object or not is_color_field(field_name):
+                continue
+            for color in pd.unique(column):
+                if isinstance(color, str) and color and not is_valid_color(color):
+                    raise ColorValidationError(field_name, color)
+
+    @property
+    def columns(self) -> Mapping[str, np.ndarray]:
+        """Mapping of data class field name to column array."""
+        return self._columns
+
+    @property
+    def whitespace(self) -> Optional[np.ndarray]:
+        """Boolean mask of whitespace rows, or None if there are none."""
+        return self._whitespace
+
+    @property
+    def times(self) -> np.ndarray:
+        """int64 array of UNIX timestamps in seconds."""
+        return self._columns[ColumnNames.TIME.value]
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return self._length
+
+    def __getitem__(self, index):
+        """Materialize one data point, or slice into a new ColumnarData view."""
+        if isinstance(index, slice):
+            return ColumnarData(
+                self.data_class,
+                {name: column[index] for name, column in self._columns.items()},
+                self._whitespace[index] if self._whitespace is not None else None,
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarData index out of range")
+        if self._whitespace is not None and self._whitespace[index]:
+            return Data(time=int(self.times[index]))
+        kwargs = {}
+        for name, column in self._columns.items():
+            value = column[index]
+            kwargs[name] = value.item() if isinstance(value, np.generic) else value
+        return self.data_class(**kwargs)
+
+    def __iter__(self) -> Iterator[Data]:
+        """Iterate over materialized data points."""
+        for index in range(self._length):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Return a compact representation that does not materialize points."""
+        return f"ColumnarData({self.data_class.__name__}, rows={self._length})"
+
+    def fingerprint(self) -> str:
+        """Return a short digest of the column contents for change detection."""
+        digest = hashlib.md5()  # noqa: S324
+        for name in sorted(self._columns):
+            column = self._columns[name]
+            digest.update(name.encode())
+            if column.dtype == object:
+                digest.update(repr(column.tolist()).encode())
+            else:
+                digest.update(np.ascontiguousarray(column).tobytes())
+        if self._whitespace is not None:
+            digest.update(np.packbits(self._whitespace).tobytes())
+        return digest.hexdigest()[:8]
+
+    def color_palettes(self) -> dict[str, dict[str, Any]]:
+        """Palette-encode the per-point color columns that repeat colors.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of data class field name to its
+            encoding (see ``data.palette.encode_palette``). Columns with too
+            many distinct colors are left out.
+        """
+        palettes = {}
+        for field_name, column in self._columns.items():
+            if column.dtype != object or not is_color_field(field_name):
+                continue
+            encoded = encode_palette(column, self._whitespace)
+            if encoded is not None:
+                palettes[field_name] = encoded
+        return palettes
+
+    def to_records(self, exclude: Collection[str] = ()) -> list[dict[str, Any]]:
+        """Serialize all points to frontend dictionaries without data objects.
+
+        The output matches ``[point.asdict() for point in data]``: camelCase
+        keys, int time in seconds, NaN handled per data class and None or
+        empty optional values omitted. Whitespace rows contain only time.
+
+        Args:
+            exclude: Data class field names to leave out, such as fields sent
+                palette-encoded.
+
+        Returns:
+            List[Dict[str, Any]]: Serialized data points.
+        """
+        if self._length == 0:
+            return []
+
+        dense_keys: list[str] = []
+        dense_values: list[list[Any]] = []
+        sparse: list[tuple[str, list[Any]]] = []
+        for field in dataclasses.fields(self.data_class):
+            column = self._columns.get(field.name)
+            if column is None or field.name in exclude:
+                continue
+            key = snake_to_camel(field.name)
+            if column.dtype == object:
+                sparse.append((key, column.tolist()))
+                continue
+            if column.dtype == np.float64:
+                policy = self._nan_policy(field.name)
+                nan_mask = np.isnan(column)
+                if policy == "none" and nan_mask.any():
+                    values: list[Any] = column.tolist()
+                    sparse.append(
+                        (key, [None if is_nan else v for v, is_nan in zip(values, nan_mask)])
+                    )
+                    continue
+                if nan_mask.any():
+                    column = np.where(nan_mask, 0.0, column)
+            dense_keys.append(key)
+            dense_values.append(column.tolist())
+
+        records = [dict(zip(dense_keys, row)) for row in zip(*dense_values)]
+        for key, values in sparse:
+            for record, value in zip(records, values):
+                if value is None or value == "" or (isinstance(value, float) and value != value):
+                    continue
+                record[key] = value.value if hasattr(value, "value") else value
+        if self._whitespace is not None:
+            times = self.times
+            for index in np.flatnonzero(self._whitespace).tolist():
+                records[index] = {"time": int(times[index])}
+        return records
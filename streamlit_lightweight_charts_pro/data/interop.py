@@ -0,0 +1,82 @@
+"""Table interoperability helpers for Streamlit Lightweight Charts Pro.
+
+This module lets the ingestion code read columns from pandas DataFrames,
+PyArrow Tables/RecordBatches and Polars DataFrames through one small
+interface, without converting Arrow or Polars input to pandas first.
+
+PyArrow and Polars are optional dependencies. Inputs are recognized by their
+type's module name, so neither library is imported unless the caller
+already passed one of its objects.
+"""
+
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+
+def is_arrow_table(data: Any) -> bool:
+    """Return True if data is a pyarrow.Table or pyarrow.RecordBatch."""
+    data_type = type(data)
+    return data_type.__module__.startswith("pyarrow") and data_type.__name__ in (
+        "Table",
+        "RecordBatch",
+    )
+
+
+def is_polars_frame(data: Any) -> bool:
+    """Return True if data is a polars.DataFrame."""
+    data_type = type(data)
+    return data_type.__module__.startswith("polars") and data_type.__name__ == "DataFrame"
+
+
+def is_table(data: Any) -> bool:
+    """Return True if data is a supported tabular input.
+
+    Supported inputs are pandas DataFrames, PyArrow Tables/RecordBatches and
+    Polars DataFrames.
+    """
+    return isinstance(data, pd.DataFrame) or is_arrow_table(data) or is_polars_frame(data)
+
+
+def column_names(data: Any) -> list[str]:
+    """Return the column names of a supported tabular input."""
+    if isinstance(data, pd.DataFrame):
+        return data.columns.tolist()
+    if is_arrow_table(data):
+        return list(data.schema.names)
+    return list(data.columns)
+
+
+def num_rows(data: Any) -> int:
+    """Return the number of rows of a supported tabular input."""
+    if is_arrow_table(data):
+        return data.num_rows
+    if is_polars_frame(data):
+        return data.height
+    return len(data)
+
+
+def get_column(data: Any, name: str) -> Union[pd.Series, np.ndarray]:
+    """Read one column of a supported tabular input.
+
+    Arrow and Polars columns are returned as NumPy arrays. Numeric and
+    temporal columns without nulls are exposed without copying; columns with
+    nulls or string data are converted (nulls become NaN, NaT or None).
+
+    Args:
+        data: pandas DataFrame, PyArrow Table/RecordBatch or Polars DataFrame.
+        name: Column name.
+
+    Returns:
+        Union[pd.Series, np.ndarray]: The column values.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data[name]
+    if is_arrow_table(data):
+        column = data.column(name)
+        if hasattr(column, "combine_chunks"):
+            # ChunkedArray from a Table; single-chunk columns are not copied
+            column = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+        return column.to_numpy(zero_copy_only=False)
+    return data.get_column(name).to_numpy()
@@ -0,0 +1,65 @@
+"""Palette encoding of per-point colors for the frontend payload.
+
+Per-point styled series (colored volume bars, ribbons and bands with
+per-point fills) repeat a handful of color strings on every data point. This
+module replaces such a column with a small color table plus one integer per
+point, or with run-length segments when the colors come in long runs:
+
+    {"colors": ["#26a69a", "#ef5350"], "index": [0, 0, 1, -1, 0]}
+    {"colors": ["#26a69a", "#ef5350"], "runs": [[0, 0], [120, 1], [310, 0]]}
+
+An index of -1 means the point has no value for the field. Each run is a
+``[start, index]`` pair that lasts until the next run starts. The frontend
+expands the encoding back into per-point fields before creating the series.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+def is_color_field(field_name: str) -> bool:
+    """Return True if a data class field holds a per-point color."""
+    return "color" in field_name or field_name == "fill"
+
+
+def encode_palette(
+    values: Union[np.ndarray, Sequence[Any]],
+    mask: Optional[np.ndarray] = None,
+) -> Optional[dict[str, Any]]:
+    """Encode a column of color strings as a palette.
+
+    Args:
+        values: Per-point color values; None, NaN and "" mean no color.
+        mask: Optional boolean mask of points whose color must be dropped,
+            such as whitespace points.
+
+    Returns:
+        The palette encoding, or None if the column has no colors or too
+        many distinct colors for the encoding to pay off.
+    """
+    length = len(values)
+    if length == 0:
+        return None
+    codes, colors = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=True)
+    if len(colors) == 0 or len(colors) * 2 > length:
+        return None
+
+    colors = colors.tolist()
+    if "" in colors:
+        empty = colors.index("")
+        codes = np.where(codes == empty, -1, codes)
+        codes = np.where(codes > empty, codes - 1, codes)
+        del colors[empty]
+        if not colors:
+            return None
+    if mask is not None:
+        codes = np.where(mask, -1, codes)
+
+    starts = np.flatnonzero(np.diff(codes, prepend=codes[0] - 1))
+    if len(starts) * 4 <= length:
+        runs = np.column_stack((starts, codes[starts]))
+        return {"colors": colors, "runs": runs.tolist()}
+    return {"colors": colors, "index": codes.tolist()}
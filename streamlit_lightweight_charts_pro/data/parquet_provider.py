@@ -0,0 +1,304 @@
+"""Bar provider over a (partitioned) Parquet dataset.
+
+Reads only what a chart window needs: the time predicate and the symbol and
+interval filters are pushed down into the dataset scan, so partitions and
+row groups whose statistics fall outside the window are never read, and
+only the requested columns are decoded. Last-N queries walk row groups from
+the newest down and stop once the requested number of bars is certain, so
+opening a chart on the most recent bars of a very large dataset reads a
+handful of row groups.
+
+Requires the ``arrow`` extra (``pip install streamlit-lightweight-charts-pro[arrow]``).
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro import ChartManager
+    from streamlit_lightweight_charts_pro.data.parquet_provider import ParquetBarProvider
+
+    # history/symbol=AAPL/interval=1m/part-0.parquet, ...
+    provider = ParquetBarProvider("history/")
+
+    manager = ChartManager()
+    chart = manager.from_bar_source(provider, "AAPL", "1m", count=5_000)
+
+    # Zoom refinement: reload the visible window only
+    bars = provider.read("AAPL", "1m", start="2024-06-03 14:00", end="2024-06-03 16:00")
+    ```
+"""
+
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from lightweight_charts_pro.exceptions import ValueValidationError
+
+from streamlit_lightweight_charts_pro.data.bars import BarSlice
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+
+# Bar fields read by default, when present in the dataset
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Epoch units of integer time columns, per second
+_UNITS_PER_SECOND = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+
+
+def _require_pyarrow() -> tuple[Any, Any]:
+    """Import pyarrow and pyarrow.dataset, with an installation hint if missing."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as exc:
+        raise ImportError(
+            "ParquetBarProvider requires pyarrow: "
+            "pip install streamlit-lightweight-charts-pro[arrow]"
+        ) from exc
+    return pa, ds
+
+
+class ParquetBarProvider:
+    """Bar provider reading time windows from a Parquet dataset.
+
+    The dataset may be a single file or a directory of files, optionally
+    hive-partitioned (``symbol=AAPL/interval=1m/...``). Symbol and interval
+    are filtered on ``symbol_column`` and ``interval_column`` when those
+    exist in the dataset, as partition keys or as regular columns; a dataset
+    without them is taken to hold one symbol or one interval. The time
+    column may be a timestamp or an integer epoch in ``time_unit``.
+
+    Implements ``BarSource``, so it can feed ``Chart.add_bars`` and
+    ``ChartManager.from_bar_source``. Create it once per dataset (e.g. with
+    ``st.cache_resource``): file discovery happens in the constructor.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, Sequence[Union[str, Path]]],
+        time_column: str = "time",
+        symbol_column: str = "symbol",
+        interval_column: str = "interval",
+        column_mapping: Optional[Mapping[str, str]] = None,
+        time_unit: str = "s",
+        partitioning: Optional[str] = "hive",
+    ):
+        """Open a dataset.
+
+        Args:
+            path: Parquet file, directory, or list of files.
+            time_column: Name of the time column.
+            symbol_column: Name of the symbol column or partition key.
+            interval_column: Name of the interval column or partition key.
+            column_mapping: Maps bar fields (open, high, ...) to dataset
+                column names. Unmapped fields use their own name.
+            time_unit: Unit of an integer time column ("s", "ms", "us" or
+                "ns"). Defaults to "s".
+            partitioning: Partitioning flavor of directory datasets.
+                Defaults to "hive".
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ValueValidationError: If time_unit is not supported or the
+                dataset has no time column.
+        """
+        pa, ds = _require_pyarrow()
+        if time_unit not in _UNITS_PER_SECOND:
+            raise ValueValidationError("time_unit", f"must be one of {list(_UNITS_PER_SECOND)}")
+        paths = [str(p) for p in path] if isinstance(path, (list, tuple)) else str(path)
+        self._pa = pa
+        self._ds = ds
+        self.dataset = ds.dataset(paths, format="parquet", partitioning=partitioning)
+        self.time_column = time_column
+        self.symbol_column = symbol_column
+        self.interval_column = interval_column
+        self.column_mapping = dict(column_mapping or {})
+        self.time_unit = time_unit
+
+        schema = self.dataset.schema
+        if time_column not in schema.names:
+            raise ValueValidationError("dataset", f"has no '{time_column}' column")
+        self._time_type = schema.field(time_column).type
+
+    def _column(self, field: str) -> str:
+        return self.column_mapping.get(field, field)
+
+    def _time_scalar(self, seconds: int) -> Any:
+        """Return a scalar of the time column's type for a UNIX time in seconds."""
+        pa = self._pa
+        if pa.types.is_timestamp(self._time_type):
+            nanos = seconds * _UNITS_PER_SECOND["ns"]
+            return pa.scalar(nanos, pa.timestamp("ns", self._time_type.tz)).cast(self._time_type)
+        if pa.types.is_integer(self._time_type):
+            return pa.scalar(seconds * _UNITS_PER_SECOND[self.time_unit], self._time_type)
+        raise ValueValidationError(
+            self.time_column, f"must be a timestamp or integer column, not {self._time_type}"
+        )
+
+    def _to_seconds(self, values: Any) -> np.ndarray:
+        """Convert an Arrow array of dataset times to int64 UNIX seconds."""
+        pa = self._pa
+        if pa.types.is_timestamp(values.type):
+            # Cast in Arrow: timestamps are UTC instants whatever their zone
+            seconds = values.cast(pa.timestamp("s", values.type.tz), safe=False)
+            return seconds.cast(pa.int64()).to_numpy()
+        if pa.types.is_integer(values.type):
+            return values.to_numpy().astype(np.int64) // _UNITS_PER_SECOND[self.time_unit]
+        return normalize_time_array(values.to_numpy(zero_copy_only=False))
+
+    def _filter(
+        self,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        end_inclusive: bool = True,
+    ) -> Any:
+        """Build the pushed-down filter expression of a query."""
+        ds = self._ds
+        names = self.dataset.schema.names
+        condition = None
+
+        def both(left: Any, right: Any) -> Any:
+            return right if left is None else left & right
+
+        if self.symbol_column in names:
+            condition = both(condition, ds.field(self.symbol_column) == symbol)
+        if self.interval_column in names:
+            condition = both(condition, ds.field(self.interval_column) == interval)
+        time = ds.field(self.time_column)
+        if start is not None:
+            condition = both(condition, time >= self._time_scalar(self._bound(start)))
+        if end is not None:
+            bound = self._time_scalar(self._bound(end))
+            condition = both(condition, time <= bound if end_inclusive else time < bound)
+        return condition
+
+    @staticmethod
+    def _bound(value: Any) -> int:
+        return int(normalize_time_array([value])[0])
+
+    def _fields(self, columns: Optional[Sequence[str]]) -> list[str]:
+        names = self.dataset.schema.names
+        if columns is None:
+            return [field for field in BAR_FIELDS if self._column(field) in names]
+        fields = [column for column in columns if column != "time"]
+        missing = [field for field in fields if self._column(field) not in names]
+        if missing:
+            raise ValueValidationError("columns", f"not in the dataset: {missing}")
+        return fields
+
+    def _slice(self, symbol: str, interval: str, fields: list[str], table: Any) -> BarSlice:
+        """Convert a scanned table to a BarSlice sorted by time."""
+        times = self._to_seconds(table.column(self.time_column))
+        order = np.argsort(times, kind="stable")
+        columns = {"time": times[order]}
+        for field in fields:
+            values = table.column(self._column(field)).to_numpy(zero_copy_only=False)
+            columns[field] = np.asarray(values, dtype=np.float64)[order]
+        return BarSlice(symbol, interval, columns)
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> BarSlice:
+        """Return the bars with ``start <= time <= end``.
+
+        Only partitions and row groups overlapping the window are read, and
+        only the requested columns are decoded.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars.
+            start: First time to include. Defaults to the first bar.
+            end: Last time to include. Defaults to the last bar.
+            columns: Bar fields to read besides time. Defaults to the bar
+                fields present in the dataset.
+
+        Returns:
+            BarSlice: The bars in range.
+        """
+        fields = self._fields(columns)
+        table = self.dataset.to_table(
+            columns=[self.time_column, *(self._column(field) for field in fields)],
+            filter=self._filter(symbol, interval, start, end),
+        )
+        return self._slice(symbol, interval, fields, table)
+
+    def tail(
+        self,
+        symbol: str,
+        interval: str,
+        count: int,
+        end: Any = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> BarSlice:
+        """Return the last ``count`` bars before ``end``.
+
+        Row groups are visited from the newest (by their time statistics)
+        down; reading stops once no remaining row group can hold a bar newer
+        than the ``count``-th newest bar found so far.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars.
+            count: Number of bars.
+            end: Exclusive upper time bound. Defaults to after the last bar.
+            columns: Bar fields to read besides time. Defaults to the bar
+                fields present in the dataset.
+
+        Returns:
+            BarSlice: Up to ``count`` bars, oldest first.
+        """
+        if count < 0:
+            raise ValueValidationError.positive_value("count", count)
+        fields = self._fields(columns)
+        names = [self.time_column, *(self._column(field) for field in fields)]
+        condition = self._filter(symbol, interval, end=end, end_inclusive=False)
+
+        # Row groups surviving partition and statistics pruning, newest first
+        groups = [
+            group
+            for fragment in self.dataset.get_fragments(filter=condition)
+            for group in fragment.split_by_row_group(condition, schema=self.dataset.schema)
+        ]
+        newest = self._group_maxima(groups)
+
+        tables = []
+        times = np.empty(0, dtype=np.int64)
+        for index in np.argsort(-newest, kind="stable"):
+            if count == 0 or (times.size >= count and newest[index] < times[-count]):
+                break
+            table = groups[index].to_table(
+                columns=names, filter=condition, schema=self.dataset.schema
+            )
+            tables.append(table)
+            found = self._to_seconds(table.column(self.time_column))
+            times = np.sort(np.concatenate([times, found]))
+
+        if not tables:
+            table = self.dataset.schema.empty_table().select(names)
+        else:
+            table = self._pa.concat_tables(tables)
+        bars = self._slice(symbol, interval, fields, table)
+        keep = min(count, len(bars))
+        return BarSlice(
+            symbol,
+            interval,
+            {name: column[len(bars) - keep :] for name, column in bars.columns.items()},
+        )
+
+    def _group_maxima(self, groups: list) -> np.ndarray:
+        """Return the largest time of each row group in seconds (+inf if unknown)."""
+        maxima: list[Any] = []
+        for group in groups:
+            try:
+                maxima.append(group.row_groups[0].statistics[self.time_column]["max"])
+            except (IndexError, KeyError, TypeError):
+                maxima.append(None)
+        values = self._pa.array(maxima, type=self._time_type)
+        seconds = self._to_seconds(values.fill_null(self._pa.scalar(0, values.type)))
+        return np.where(values.is_null().to_numpy(zero_copy_only=False), np.inf, seconds)
@@ -0,0 +1,255 @@
+"""Vectorized sanitation of column-backed series data.
+
+lightweight-charts requires strictly ascending, unique times and cannot draw
+NaN values. This module checks and repairs whole columns at once before a
+series is serialized:
+
+1. Rows are stably sorted by time.
+2. Duplicate timestamps are dropped (keeping the first or last row) or
+   merged with per-field aggregations.
+3. Rows with NaN in a value field become whitespace points, which the
+   frontend renders as gaps.
+
+Three modes control the behavior: "repair" applies the fixes above and
+records them in a SanitationReport, "strict" raises on the first problem
+instead of fixing it, and "fast" skips all checks for data that is known to
+be clean.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Union
+
+import numpy as np
+from lightweight_charts_pro.exceptions import ValueValidationError
+from lightweight_charts_pro.type_definitions import ColumnNames
+
+
+class SanitizeMode(str, Enum):
+    """How series data is checked before serialization.
+
+    Attributes:
+        STRICT: Raise on unsorted times, duplicate times or NaN rows.
+        REPAIR: Sort, deduplicate and convert NaN rows to whitespace.
+        FAST: Skip all checks; the data is trusted as-is.
+    """
+
+    STRICT = "strict"
+    REPAIR = "repair"
+    FAST = "fast"
+
+
+class DuplicatePolicy(str, Enum):
+    """How rows sharing a timestamp are resolved in repair mode.
+
+    Attributes:
+        FIRST: Keep the first row of each timestamp.
+        LAST: Keep the last row of each timestamp.
+        AGGREGATE: Merge the rows using per-field aggregations.
+    """
+
+    FIRST = "first"
+    LAST = "last"
+    AGGREGATE = "aggregate"
+
+
+# Aggregations used by DuplicatePolicy.AGGREGATE, keyed by data class field.
+# Fields not listed keep the value of the last row.
+DEFAULT_AGGREGATIONS: Mapping[str, str] = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+
+@dataclass(frozen=True)
+class SanitationReport:
+    """Summary of the problems found (and fixed) by a sanitation pass.
+
+    Attributes:
+        rows_in: Number of rows before sanitation.
+        rows_out: Number of rows after sanitation.
+        unsorted: Number of rows whose time was lower than the previous row.
+        duplicates: Number of rows removed or merged for a repeated time.
+        whitespace: Number of rows converted to whitespace points.
+    """
+
+    rows_in: int
+    rows_out: int
+    unsorted: int = 0
+    duplicates: int = 0
+    whitespace: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """Whether any row was reordered, removed or blanked."""
+        return bool(self.unsorted or self.duplicates or self.whitespace)
+
+    def __str__(self) -> str:
+        """Return a one-line summary suitable for logging."""
+        if not self.changed:
+            return f"{self.rows_in} rows, no changes"
+        fixes = []
+        if self.unsorted:
+            fixes.append(f"sorted {self.unsorted} out-of-order rows")
+        if self.duplicates:
+            fixes.append(f"resolved {self.duplicates} duplicate times")
+        if self.whitespace:
+            fixes.append(f"converted {self.whitespace} NaN rows to whitespace")
+        return f"{self.rows_in} -> {self.rows_out} rows: " + ", ".join(fixes)
+
+
+def reduce_runs(column: np.ndarray, how: str, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Reduce each run ``column[starts[i]:ends[i] + 1]`` to one value.
+
+    Args:
+        column: Values, grouped in consecutive runs.
+        how: "first", "last", "max", "min" or "sum". Object columns always
+            take the last value.
+        starts: Index of the first value of each run.
+        ends: Index of the last value of each run.
+
+    Returns:
+        np.ndarray: One value per run.
+
+    Raises:
+        ValueValidationError: If the aggregation is unknown.
+    """
+    if how == "first":
+        return column[starts]
+    if how == "last" or column.dtype == object:
+        return column[ends]
+    if how == "max":
+        return np.fmax.reduceat(column, starts)
+    if how == "min":
+        return np.fmin.reduceat(column, starts)
+    if how == "sum":
+        return np.add.reduceat(column, starts)
+    raise ValueValidationError("aggregations", f"unknown aggregation '{how}'")
+
+
+def _nan_rows(columns: Mapping[str, np.ndarray], value_fields: tuple[str, ...]) -> np.ndarray:
+    """Return a mask of rows holding NaN in any of the value fields."""
+    mask = np.zeros(len(columns[ColumnNames.TIME.value]), dtype=bool)
+    for field_name in value_fields:
+        column = columns.get(field_name)
+        if column is not None and column.dtype == np.float64:
+            mask |= np.isnan(column)
+    return mask
+
+
+def _describe_first(mask: np.ndarray, times: np.ndarray) -> str:
+    """Describe the first flagged row as 'index N, time T'."""
+    index = int(np.argmax(mask))
+    return f"index {index}, time {int(times[index])}"
+
+
+def sanitize_columns(
+    columns: Mapping[str, np.ndarray],
+    value_fields: tuple[str, ...],
+    mode: Union[SanitizeMode, str] = SanitizeMode.REPAIR,
+    duplicates: Union[DuplicatePolicy, str] = DuplicatePolicy.LAST,
+    aggregations: Optional[Mapping[str, str]] = None,
+    whitespace: Optional[np.ndarray] = None,
+) -> tuple[dict[str, np.ndarray], Optional[np.ndarray], Optional[SanitationReport]]:
+    """Check or repair series columns so they are safe to serialize.
+
+    Args:
+        columns: Mapping of data class field name to column array; must
+            include the int64 ``time`` column.
+        value_fields: Float fields whose NaN turns a row into whitespace.
+        mode: Sanitation mode, see SanitizeMode.
+        duplicates: Duplicate timestamp handling, see DuplicatePolicy.
+        aggregations: Per-field overrides of DEFAULT_AGGREGATIONS ("first",
+            "last", "max", "min" or "sum") for DuplicatePolicy.AGGREGATE.
+        whitespace: Existing whitespace mask to carry through, if any.
+
+    Returns:
+        Tuple of the sanitized columns, the boolean whitespace mask (None
+        when no row is whitespace) and the report (None in fast mode).
+
+    Raises:
+        ValueValidationError: In strict mode, if the times are not strictly
+            ascending or a row holds NaN; in any mode, for an unknown mode,
+            duplicate policy or aggregation.
+    """
+    try:
+        mode = SanitizeMode(mode)
+        duplicates = DuplicatePolicy(duplicates)
+    except ValueError as exc:
+        raise ValueValidationError("sanitize", str(exc)) from exc
+
+    columns = dict(columns)
+    if mode == SanitizeMode.FAST:
+        return columns, whitespace, None
+
+    times = columns[ColumnNames.TIME.value]
+    rows_in = len(times)
+    steps = np.diff(times)
+    descending = steps < 0
+    repeated = steps == 0
+
+    if mode == SanitizeMode.STRICT:
+        if descending.any():
+            raise ValueValidationError(
+                "time",
+                f"must be ascending; {int(descending.sum())} rows are out of order "
+                f"(first at {_describe_first(np.append(False, descending), times)})",
+            )
+        if repeated.any():
+            raise ValueValidationError(
+                "time",
+                f"must be unique; {int(repeated.sum())} rows repeat a timestamp "
+                f"(first at {_describe_first(np.append(False, repeated), times)})",
+            )
+        nan_rows = _nan_rows(columns, value_fields)
+        if whitespace is not None:
+            nan_rows &= ~whitespace
+        if nan_rows.any():
+            raise ValueValidationError(
+                "data",
+                f"contains NaN in {int(nan_rows.sum())} rows "
+                f"(first at {_describe_first(nan_rows, times)})",
+            )
+        return columns, whitespace, SanitationReport(rows_in, rows_in)
+
+    unsorted = int(descending.sum())
+    if unsorted:
+        order = np.argsort(times, kind="stable")
+        columns = {name: column[order] for name, column in columns.items()}
+        whitespace = whitespace[order] if whitespace is not None else None
+        times = columns[ColumnNames.TIME.value]
+        repeated = np.diff(times) == 0
+
+    removed = int(repeated.sum())
+    if removed:
+        is_start = np.append(True, ~repeated)
+        is_end = np.append(~repeated, True)
+        if duplicates == DuplicatePolicy.AGGREGATE:
+            starts = np.flatnonzero(is_start)
+            ends = np.flatnonzero(is_end)
+            rules = {**DEFAULT_AGGREGATIONS, **(aggregations or {})}
+            columns = {
+                name: reduce_runs(column, rules.get(name, "last"), starts, ends)
+                for name, column in columns.items()
+            }
+            if whitespace is not None:
+                whitespace = np.logical_and.reduceat(whitespace, starts)
+        else:
+            keep = is_start if duplicates == DuplicatePolicy.FIRST else is_end
+            columns = {name: column[keep] for name, column in columns.items()}
+            whitespace = whitespace[keep] if whitespace is not None else None
+
+    nan_rows = _nan_rows(columns, value_fields)
+    if whitespace is not None:
+        nan_rows &= ~whitespace
+    blanked = int(nan_rows.sum())
+    if blanked:
+        whitespace = nan_rows if whitespace is None else whitespace | nan_rows
+
+    rows_out = len(columns[ColumnNames.TIME.value])
+    report = SanitationReport(rows_in, rows_out, unsorted, removed, blanked)
+    return columns, whitespace, report
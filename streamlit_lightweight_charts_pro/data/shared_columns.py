@@ -0,0 +1,395 @@
+"""Series columns in named shared memory blocks, for zero-copy handoff.
+
+An ingestion process writes bar or indicator columns into a named
+``multiprocessing.shared_memory`` block; the Streamlit process attaches to
+it by name and builds series whose ``ColumnarData`` columns are read-only
+views into the block. Nothing is pickled or copied: serialization reads the
+values straight from shared memory.
+
+A block is self-describing. It starts with a small header holding the
+column layout, the capacity and the current row count, so an attaching
+process needs nothing but the name. The producer may reserve spare capacity
+and ``append`` rows later; consumers see the rows present when they build
+their series, so a live ingestion daemon can feed charts that pick up new
+bars on every rerun.
+
+Within a process, attachments to one block share a single mapping and are
+reference counted: every handle and every ``ColumnarData`` built from it
+holds a reference, and the mapping is closed once the last one is released.
+The producer removes the block with ``unlink``; processes still attached
+keep their mapping until they release it.
+
+Example:
+    ```python
+    # Ingestion process
+    block = SharedColumns.create(
+        {"time": times, "open": o, "high": h, "low": l, "close": c},
+        capacity=1_000_000,
+        name="bars-AAPL-1m",
+    )
+    block.append(new_rows)  # later, as bars arrive
+
+    # Streamlit process
+    with SharedColumns.attach("bars-AAPL-1m") as block:
+        chart = Chart(series=block.to_series(CandlestickSeries))
+    chart.render(key="aapl")
+    ```
+"""
+
+import dataclasses
+import json
+import threading
+import weakref
+from collections.abc import Mapping
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Optional
+
+import numpy as np
+from lightweight_charts_pro.exceptions import (
+    RequiredFieldError,
+    ValueValidationError,
+)
+from lightweight_charts_pro.logging_config import get_logger
+from lightweight_charts_pro.type_definitions import ColumnNames
+
+from streamlit_lightweight_charts_pro.data.columnar import ColumnarData
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+
+logger = get_logger(__name__)
+
+# Alignment of columns inside a block, in bytes
+_ALIGNMENT = 64
+
+# Header: header size (uint64), row count (int64), then the JSON layout
+_PREFIX = 16
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block without handing it to this process's resource tracker."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        block = shared_memory.SharedMemory(name=name)
+        # Otherwise the tracker would unlink the producer's block when we exit
+        # pylint: disable-next=protected-access
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def _data_start(header_size: int) -> int:
+    """Return the offset of the first column for a header of the given size."""
+    return -(-(_PREFIX + header_size) // _ALIGNMENT) * _ALIGNMENT
+
+
+class _Memory:
+    """Array interface over part of a mapping, keeping the mapping alive.
+
+    Arrays built on it reference the mapping through their ``base``, so the
+    block is only unmapped once no array over it is left.
+    """
+
+    def __init__(self, mapping: "_Mapping", offset: int, dtype: str, count: int, readonly: bool):
+        self.mapping = mapping
+        self.__array_interface__ = {
+            "data": (mapping.address + offset, readonly),
+            "shape": (count,),
+            "typestr": dtype,
+            "version": 3,
+        }
+
+
+class _Mapping:
+    """One process-local mapping of a block, shared by all its handles.
+
+    The block is closed when the mapping is garbage collected, that is once
+    the registry, every handle and every array over it have let go.
+    """
+
+    def __init__(self, block: shared_memory.SharedMemory):
+        self.block = block
+        self.refs = 0
+        probe = np.frombuffer(block.buf, dtype=np.uint8, count=1)
+        self.address: int = probe.ctypes.data
+        del probe
+        self.length = self.array(8, "<i8", 1, readonly=False)
+        header_size = int(self.array(0, "<i8", 1)[0])
+        layout = json.loads(bytes(block.buf[_PREFIX : _PREFIX + header_size]).decode("utf-8"))
+        self.capacity: int = layout["capacity"]
+        start = _data_start(header_size)
+        self.layout: dict[str, tuple[str, int]] = {
+            name: (dtype, start + offset) for name, dtype, offset in layout["columns"]
+        }
+        self.views = {
+            name: self.array(offset, dtype, self.capacity)
+            for name, (dtype, offset) in self.layout.items()
+        }
+
+    def array(self, offset: int, dtype: str, count: int, readonly: bool = True) -> np.ndarray:
+        """Return an array over ``count`` values at ``offset`` of the block."""
+        return np.asarray(_Memory(self, offset, dtype, count, readonly))
+
+
+_mappings: dict[str, _Mapping] = {}
+_mappings_lock = threading.Lock()
+
+
+def _acquire(name: str, block: Optional[shared_memory.SharedMemory] = None) -> _Mapping:
+    """Return the mapping of a block, taking one reference."""
+    with _mappings_lock:
+        mapping = _mappings.get(name)
+        if mapping is None:
+            mapping = _Mapping(block if block is not None else _open_block(name))
+            _mappings[name] = mapping
+            logger.debug("Mapped shared block %s (%d rows capacity)", name, mapping.capacity)
+        mapping.refs += 1
+        return mapping
+
+
+def _release(name: str) -> None:
+    """Drop one reference to a block, closing the mapping after the last one."""
+    with _mappings_lock:
+        mapping = _mappings.get(name)
+        if mapping is None:
+            return
+        mapping.refs -= 1
+        if mapping.refs <= 0:
+            # Unmapped once the arrays still using it are gone
+            del _mappings[name]
+
+
+def attached_blocks() -> dict[str, int]:
+    """Return the reference count of each block mapped in this process."""
+    with _mappings_lock:
+        return {name: mapping.refs for name, mapping in _mappings.items()}
+
+
+class SharedColumns:
+    """Handle of a named shared memory block holding aligned columns.
+
+    Create blocks with ``create`` (producer) and open them with ``attach``
+    (consumer). Each handle holds one reference to the process-local
+    mapping until ``close``; use it as a context manager.
+    """
+
+    def __init__(self, name: str, mapping: _Mapping, owner: bool = False):
+        """Wrap an acquired mapping; use ``create`` or ``attach`` instead."""
+        self.name = name
+        self.owner = owner
+        self._mapping: Optional[_Mapping] = mapping
+
+    @classmethod
+    def create(
+        cls,
+        columns: Mapping[str, Any],
+        capacity: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> "SharedColumns":
+        """Create a block holding columns.
+
+        Args:
+            columns: Arrays by name, all of the same length. A ``time``
+                column is stored as int64 UNIX seconds; other columns keep
+                their dtype, which must not hold Python objects.
+            capacity: Rows reserved for later ``append`` calls. Defaults to
+                the current length.
+            name: Name of the block. Defaults to a random name.
+
+        Returns:
+            SharedColumns: Owning handle of the new block.
+
+        Raises:
+            ValueValidationError: If columns are empty, differ in length,
+                hold objects, or exceed the capacity.
+        """
+        arrays = {}
+        for column_name, values in columns.items():
+            if column_name == ColumnNames.TIME.value:
+                values = normalize_time_array(values)
+            array = np.ascontiguousarray(values)
+            if array.dtype.hasobject:
+                raise ValueValidationError(column_name, "must not hold Python objects")
+            arrays[column_name] = array
+        lengths = {array.shape[0] for array in arrays.values()}
+        if not arrays or len(lengths) > 1:
+            raise ValueValidationError("columns", "must be non-empty and of the same length")
+        length = lengths.pop()
+        capacity = length if capacity is None else capacity
+        if capacity < length or capacity <= 0:
+            raise ValueValidationError("capacity", f"must be positive and at least {length}")
+
+        # Column offsets are relative to the first aligned byte after the header
+        layout = []
+        offset = 0
+        for column_name, array in arrays.items():
+            offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+            layout.append([column_name, array.dtype.str, offset])
+            offset += array.dtype.itemsize * capacity
+        header = json.dumps({"capacity": capacity, "columns": layout}).encode("utf-8")
+        size = _data_start(len(header)) + offset
+
+        block = shared_memory.SharedMemory(name=name, create=True, size=size)
+        try:
+            block.buf[:_PREFIX] = np.array([len(header), 0], dtype="<i8").tobytes()
+            block.buf[_PREFIX : _PREFIX + len(header)] = header
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+        handle = cls(block.name, _acquire(block.name, block), owner=True)
+        handle.append(arrays)
+        return handle
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedColumns":
+        """Open an existing block by name.
+
+        Args:
+            name: Name of the block.
+
+        Returns:
+            SharedColumns: Handle sharing this process's mapping of the block.
+
+        Raises:
+            FileNotFoundError: If no block has that name.
+        """
+        return cls(name, _acquire(name))
+
+    @property
+    def _live(self) -> _Mapping:
+        if self._mapping is None:
+            raise ValueValidationError("SharedColumns", f"handle of {self.name} is closed")
+        return self._mapping
+
+    @property
+    def capacity(self) -> int:
+        """Rows the block can hold."""
+        return self._live.capacity
+
+    def __len__(self) -> int:
+        """Return the number of rows written so far."""
+        return int(self._live.length[0])
+
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        """Read-only views of the rows written so far, by column name."""
+        mapping = self._live
+        length = int(mapping.length[0])
+        return {name: view[:length] for name, view in mapping.views.items()}
+
+    def append(self, columns: Mapping[str, Any]) -> int:
+        """Write rows after the existing ones and publish them.
+
+        The row count is updated after the values are written, so consumers
+        never see a partially written row.
+
+        Args:
+            columns: Arrays for every column of the block, of equal length.
+
+        Returns:
+            int: The new number of rows.
+
+        Raises:
+            ValueValidationError: If columns are missing or the rows do not
+                fit in the capacity.
+        """
+        mapping = self._live
+        missing = set(mapping.layout) - set(columns)
+        if missing:
+            raise ValueValidationError("columns", f"missing: {sorted(missing)}")
+        start = int(mapping.length[0])
+        count = len(columns[next(iter(mapping.layout))])
+        if start + count > mapping.capacity:
+            raise ValueValidationError(
+                "columns", f"{count} rows do not fit: {start} of {mapping.capacity} used"
+            )
+        for column_name, (dtype, offset) in mapping.layout.items():
+            values = columns[column_name]
+            if column_name == ColumnNames.TIME.value:
+                values = normalize_time_array(values)
+            position = offset + start * np.dtype(dtype).itemsize
+            mapping.array(position, dtype, count, readonly=False)[:] = values
+        mapping.length[0] = start + count
+        return start + count
+
+    def to_columnar(
+        self,
+        data_class: type,
+        field_to_column: Optional[Mapping[str, str]] = None,
+    ) -> ColumnarData:
+        """Return the rows written so far as column-backed data, without copying.
+
+        The data holds a reference to the block until it is garbage collected.
+
+        Args:
+            data_class: Data class of the points, e.g. ``CandlestickData``.
+            field_to_column: Mapping of data class fields to block columns.
+                Fields of the data class found among the columns are mapped
+                by name.
+
+        Returns:
+            ColumnarData: Data whose columns are views into the block.
+
+        Raises:
+            RequiredFieldError: If a required field has no column.
+        """
+        columns = self.columns
+        mapping = {
+            field.name: field.name
+            for field in dataclasses.fields(data_class)
+            if field.init and field.name in columns
+        }
+        mapping.update(field_to_column or {})
+        missing = data_class.required_columns - set(mapping)
+        if missing:
+            raise RequiredFieldError(sorted(missing)[0])
+        data = ColumnarData(
+            data_class, {field: columns[column] for field, column in mapping.items()}
+        )
+        _acquire(self.name)
+        weakref.finalize(data, _release, self.name)
+        return data
+
+    def to_series(
+        self,
+        series_class: type,
+        field_to_column: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Build a series over the rows written so far, without copying.
+
+        Args:
+            series_class: Column-backed series class, e.g. ``CandlestickSeries``.
+            field_to_column: Mapping of data class fields to block columns,
+                see ``to_columnar``.
+            **kwargs: Arguments for the series constructor.
+
+        Returns:
+            Series: The series.
+        """
+        return series_class(self.to_columnar(series_class.data_class, field_to_column), **kwargs)
+
+    def close(self) -> None:
+        """Release this handle's reference to the block."""
+        if self._mapping is not None:
+            self._mapping = None
+            _release(self.name)
+
+    def unlink(self) -> None:
+        """Remove the block's name; attached processes keep their mappings."""
+        try:
+            # A tracked handle: unlink() unregisters what this registers
+            block = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        block.close()
+        block.unlink()
+
+    def __enter__(self) -> "SharedColumns":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        state = "closed" if self._mapping is None else f"{len(self)}/{self.capacity} rows"
+        return f"SharedColumns({self.name!r}, {state})"
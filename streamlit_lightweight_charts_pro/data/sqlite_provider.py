@@ -0,0 +1,392 @@
+"""SQLite-backed bar and trade provider.
+
+Stores OHLCV bars and trades per symbol in one SQLite database using only
+the standard library. Bars are keyed by ``(symbol, interval, time)`` in a
+``WITHOUT ROWID`` table, so a time-range or last-N query is a single index
+range scan; trades are indexed by entry and exit time. Query results are
+fetched in bulk and returned as NumPy columns in a ``BarSlice``.
+
+Connections come from a process-wide pool per database file, shared by all
+Streamlit sessions of the server. The database runs in WAL mode, so
+sessions keep reading while a feed appends new bars.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro import ChartManager
+    from streamlit_lightweight_charts_pro.data.sqlite_provider import SQLiteBarProvider
+
+    provider = SQLiteBarProvider("bars.db")
+    provider.append_bars("AAPL", "1m", minute_bars_df)
+
+    manager = ChartManager()
+    manager.from_bar_source(provider, "AAPL", "1m", count=5_000)
+    ```
+"""
+
+import json
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from lightweight_charts_pro.data.trade import TradeData
+from lightweight_charts_pro.exceptions import ValueValidationError
+
+from streamlit_lightweight_charts_pro.data.bars import BarSlice
+from streamlit_lightweight_charts_pro.data.interop import column_names, get_column, is_table
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+
+# Stored bar columns besides time
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Connections per database file in the shared pool
+DEFAULT_POOL_SIZE = 4
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume REAL,
+    PRIMARY KEY (symbol, interval, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trades (
+    symbol TEXT NOT NULL,
+    id TEXT NOT NULL,
+    entry_time INTEGER NOT NULL,
+    entry_price REAL NOT NULL,
+    exit_time INTEGER NOT NULL,
+    exit_price REAL NOT NULL,
+    is_profitable INTEGER NOT NULL,
+    additional_data TEXT,
+    PRIMARY KEY (symbol, id)
+);
+CREATE INDEX IF NOT EXISTS trades_entry ON trades (symbol, entry_time);
+CREATE INDEX IF NOT EXISTS trades_exit ON trades (symbol, exit_time);
+"""
+
+
+def _to_seconds(value: Any, default: int) -> int:
+    """Convert a time bound to UNIX seconds, or return the default for None."""
+    if value is None:
+        return default
+    return int(normalize_time_array([value])[0])
+
+
+class _ConnectionPool:
+    """Fixed-size pool of connections to one database file."""
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        with self.connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections move between session threads, but only one uses each at a time
+        connection = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, waiting for one if all are in use."""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            try:
+                connection = self._connect() if create else self._idle.get()
+            except BaseException:
+                if create:
+                    with self._lock:
+                        self._created -= 1
+                raise
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+
+_pools: dict[str, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(path: str, size: int) -> _ConnectionPool:
+    """Return the process-wide pool of a database file."""
+    key = str(Path(path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _ConnectionPool(key, size)
+            _pools[key] = pool
+        return pool
+
+
+class SQLiteBarProvider:
+    """Bar and trade provider backed by an SQLite database file.
+
+    Implements ``BarSource``, so it can feed ``Chart.add_bars`` and
+    ``ChartManager.from_bar_source``. Instances are cheap: all providers of
+    one file share a connection pool, so a provider can be created on every
+    Streamlit rerun.
+    """
+
+    def __init__(self, path: Union[str, Path], pool_size: int = DEFAULT_POOL_SIZE):
+        """Open (or create) a database.
+
+        Args:
+            path: Database file.
+            pool_size: Connections in the shared pool, used when this is the
+                first provider of the file in the process.
+
+        Raises:
+            ValueValidationError: If pool_size is not positive or path is
+                ":memory:" (in-memory databases cannot be pooled).
+        """
+        if pool_size <= 0:
+            raise ValueValidationError.positive_value("pool_size", pool_size)
+        if str(path) == ":memory:":
+            raise ValueValidationError("path", "must be a file, not an in-memory database")
+        self._pool = _get_pool(str(path), pool_size)
+
+    @property
+    def path(self) -> str:
+        """Resolved path of the database file."""
+        return self._pool.path
+
+    def symbols(self) -> list[str]:
+        """Return the symbols with stored bars."""
+        with self._pool.connection() as connection:
+            cursor = connection.execute("SELECT DISTINCT symbol FROM bars ORDER BY symbol")
+            rows = cursor.fetchall()
+        return [row[0] for row in rows]
+
+    def intervals(self, symbol: str) -> list[str]:
+        """Return the stored intervals of a symbol."""
+        with self._pool.connection() as connection:
+            rows = connection.execute(
+                "SELECT DISTINCT interval FROM bars WHERE symbol = ?", (symbol,)
+            ).fetchall()
+        return sorted(row[0] for row in rows)
+
+    def append_bars(
+        self,
+        symbol: str,
+        interval: str,
+        data: Any,
+        column_mapping: Optional[dict[str, str]] = None,
+    ) -> int:
+        """Insert bars from a table, replacing bars with the same time.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars, e.g. "1m".
+            data: pandas DataFrame, PyArrow Table or Polars DataFrame with a
+                time column and any of open, high, low, close and volume.
+            column_mapping: Maps ``time`` and the bar fields to table column
+                names. Unmapped fields use their own name.
+
+        Returns:
+            int: Number of bars written.
+
+        Raises:
+            ValueValidationError: If the table has no time column or a bar
+                field is not numeric.
+        """
+        if not is_table(data):
+            raise ValueValidationError("data", "must be a DataFrame, Arrow table or Polars frame")
+        mapping = {name: name for name in ("time", *BAR_FIELDS)}
+        mapping.update(column_mapping or {})
+        available = set(column_names(data))
+        if mapping["time"] not in available:
+            raise ValueValidationError("data", f"has no '{mapping['time']}' column")
+
+        times = normalize_time_array(get_column(data, mapping["time"]))
+        columns: list[list[Any]] = [times.tolist()]
+        for field in BAR_FIELDS:
+            if mapping[field] not in available:
+                columns.append([None] * len(columns[0]))
+                continue
+            try:
+                values = np.asarray(get_column(data, mapping[field]), dtype=np.float64)
+            except (TypeError, ValueError) as exc:
+                raise ValueValidationError(field, "must be numeric") from exc
+            # NaN is stored as NULL
+            columns.append(np.where(np.isnan(values), None, values).tolist())
+
+        rows = [(symbol, interval, *row) for row in zip(*columns)]
+        with self._pool.connection() as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO bars (symbol, interval, time, open, high, low, close, "
+                "volume) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    @staticmethod
+    def _fields(columns: Optional[Sequence[str]]) -> list[str]:
+        fields = list(BAR_FIELDS) if columns is None else [c for c in columns if c != "time"]
+        unknown = set(fields) - set(BAR_FIELDS)
+        if unknown:
+            raise ValueValidationError("columns", f"not stored: {sorted(unknown)}")
+        return fields
+
+    @staticmethod
+    def _slice(symbol: str, interval: str, fields: list[str], rows: list[tuple]) -> BarSlice:
+        """Convert fetched (time, *fields) rows to a BarSlice; NULL becomes NaN."""
+        table = np.array(rows, dtype=np.float64).reshape(len(rows), len(fields) + 1)
+        columns = {"time": np.array([row[0] for row in rows], dtype=np.int64)}
+        for index, field in enumerate(fields, start=1):
+            columns[field] = np.ascontiguousarray(table[:, index])
+        return BarSlice(symbol, interval, columns)
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Any = None,
+        end: Any = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> BarSlice:
+        """Return the bars with ``start <= time <= end``.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars.
+            start: First time to include. Defaults to the first bar.
+            end: Last time to include. Defaults to the last bar.
+            columns: Bar fields to read besides time. Defaults to all.
+
+        Returns:
+            BarSlice: The bars in range; missing values are NaN.
+        """
+        fields = self._fields(columns)
+        query = (
+            f"SELECT {', '.join(['time', *fields])} FROM bars "
+            "WHERE symbol = ? AND interval = ? AND time BETWEEN ? AND ? ORDER BY time"
+        )
+        bounds = (_to_seconds(start, _INT64_MIN), _to_seconds(end, _INT64_MAX))
+        with self._pool.connection() as connection:
+            rows = connection.execute(query, (symbol, interval, *bounds)).fetchall()
+        return self._slice(symbol, interval, fields, rows)
+
+    def tail(
+        self,
+        symbol: str,
+        interval: str,
+        count: int,
+        end: Any = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> BarSlice:
+        """Return the last ``count`` bars before ``end``.
+
+        Pages back through history: pass the time of the oldest loaded bar
+        as ``end`` to get the page before it.
+
+        Args:
+            symbol: Symbol of the bars.
+            interval: Interval of the bars.
+            count: Number of bars.
+            end: Exclusive upper time bound. Defaults to after the last bar.
+            columns: Bar fields to read besides time. Defaults to all.
+
+        Returns:
+            BarSlice: Up to ``count`` bars, oldest first.
+        """
+        if count < 0:
+            raise ValueValidationError.positive_value("count", count)
+        fields = self._fields(columns)
+        query = (
+            f"SELECT {', '.join(['time', *fields])} FROM bars "
+            "WHERE symbol = ? AND interval = ? AND time < ? ORDER BY time DESC LIMIT ?"
+        )
+        if end is None:
+            params = (symbol, interval, _INT64_MAX, count)
+        else:
+            params = (symbol, interval, _to_seconds(end, _INT64_MAX), count)
+        with self._pool.connection() as connection:
+            rows = connection.execute(query, params).fetchall()
+        rows.reverse()
+        return self._slice(symbol, interval, fields, rows)
+
+    def append_trades(self, symbol: str, trades: Sequence[TradeData]) -> int:
+        """Insert trades, replacing trades with the same id.
+
+        Args:
+            symbol: Symbol of the trades.
+            trades: Trades to store.
+
+        Returns:
+            int: Number of trades written.
+        """
+        rows = [
+            (
+                symbol,
+                str(trade.id),
+                _to_seconds(trade.entry_time, 0),
+                float(trade.entry_price),
+                _to_seconds(trade.exit_time, 0),
+                float(trade.exit_price),
+                int(bool(trade.is_profitable)),
+                json.dumps(trade.additional_data) if trade.additional_data else None,
+            )
+            for trade in trades
+        ]
+        with self._pool.connection() as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def read_trades(self, symbol: str, start: Any = None, end: Any = None) -> list[TradeData]:
+        """Return the trades overlapping ``[start, end]``, by entry time.
+
+        Args:
+            symbol: Symbol of the trades.
+            start: Start of the window. Defaults to unbounded.
+            end: End of the window. Defaults to unbounded.
+
+        Returns:
+            list[TradeData]: The trades.
+        """
+        query = (
+            "SELECT id, entry_time, entry_price, exit_time, exit_price, is_profitable, "
+            "additional_data FROM trades WHERE symbol = ? AND entry_time <= ? "
+            "AND exit_time >= ? ORDER BY entry_time"
+        )
+        params = (symbol, _to_seconds(end, _INT64_MAX), _to_seconds(start, _INT64_MIN))
+        with self._pool.connection() as connection:
+            rows = connection.execute(query, params).fetchall()
+        trades = []
+        for trade_id, entry_time, entry_price, exit_time, exit_price, profitable, extra in rows:
+            trades.append(
+                TradeData(
+                    entry_time=entry_time,
+                    entry_price=entry_price,
+                    exit_time=exit_time,
+                    exit_price=exit_price,
+                    is_profitable=bool(profitable),
+                    id=trade_id,
+                    additional_data=json.loads(extra) if extra else None,
+                )
+            )
+        return trades
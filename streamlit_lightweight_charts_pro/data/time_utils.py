@@ -0,0 +1,162 @@
+"""Vectorized time normalization for Streamlit Lightweight Charts Pro.
+
+The core ``normalize_time`` utility converts one value at a time. This module
+converts whole columns of time values to int64 UNIX seconds in a single
+NumPy/pandas pass, which is what the column-backed ingestion path uses.
+
+Supported column types:
+    - datetime64 of any resolution (naive values are treated as UTC)
+    - timezone-aware datetime columns (converted to UTC)
+    - integer or float epochs in seconds, milliseconds, microseconds or
+      nanoseconds (unit auto-detected from magnitude, or given explicitly)
+    - date/time strings and Python datetime/date objects
+
+Optionally the result is shifted into a display timezone, so the chart's
+time axis shows wall-clock time in that zone instead of UTC.
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.exceptions import TimeValidationError, ValueValidationError
+
+# Epoch units and their size in seconds' subdivisions
+_UNIT_DIVISORS = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+# Magnitude thresholds for unit auto-detection. Second timestamps stay below
+# 1e11 until the year 5138; millisecond timestamps exceed it after 1973.
+_UNIT_THRESHOLDS = (("ns", 1e17), ("us", 1e14), ("ms", 1e11))
+
+
+def detect_epoch_unit(values: Any) -> str:
+    """Detect the unit of a numeric epoch column from its magnitude.
+
+    Args:
+        values: Array-like of integer or float epoch values.
+
+    Returns:
+        str: One of "s", "ms", "us" or "ns".
+
+    Example:
+        >>> detect_epoch_unit([1704067200000])
+        'ms'
+    """
+    array = np.asarray(values, dtype=np.float64)
+    if array.size == 0:
+        return "s"
+    magnitude = np.nanmax(np.abs(array)) if not np.isnan(array).all() else 0.0
+    for unit, threshold in _UNIT_THRESHOLDS:
+        if magnitude >= threshold:
+            return unit
+    return "s"
+
+
+def _epoch_to_seconds(array: np.ndarray, unit: str) -> np.ndarray:
+    """Convert a numeric epoch array in the given unit to int64 seconds."""
+    if unit == "auto":
+        unit = detect_epoch_unit(array)
+    if unit not in _UNIT_DIVISORS:
+        raise ValueValidationError("unit", f"must be 'auto' or one of {list(_UNIT_DIVISORS)}")
+    divisor = _UNIT_DIVISORS[unit]
+    if np.issubdtype(array.dtype, np.integer):
+        return array.astype(np.int64, copy=False) // divisor
+    if np.isnan(array).any():
+        raise TimeValidationError("time column contains NaN values")
+    return np.trunc(array / divisor).astype(np.int64)
+
+
+def normalize_time_array(
+    values: Any,
+    unit: str = "auto",
+    display_timezone: Optional[str] = None,
+) -> np.ndarray:
+    """Convert a column of time values to int64 UNIX seconds in one pass.
+
+    Args:
+        values: Array-like of time values: a pandas Series/Index, a NumPy
+            array or a list.
+        unit: Unit of numeric epoch values: "s", "ms", "us", "ns", or
+            "auto" to detect it from the magnitude. Ignored for datetime and
+            string columns. Defaults to "auto".
+        display_timezone: Optional IANA timezone name (e.g.
+            "America/New_York"). When given, timestamps are shifted by the
+            zone's UTC offset at each instant so the chart displays local
+            wall-clock time. Defaults to None (UTC).
+
+    Returns:
+        np.ndarray: int64 array of UNIX timestamps in seconds. Sub-second
+            precision is truncated, matching ``normalize_time``.
+
+    Raises:
+        TimeValidationError: If the values cannot be parsed as times or
+            contain missing values.
+        ValueValidationError: If unit is not a supported unit.
+
+    Example:
+        ```python
+        import pandas as pd
+        from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+
+        normalize_time_array(pd.date_range("2024-01-01", periods=3, tz="UTC"))
+        normalize_time_array([1704067200000, 1704153600000])  # ms detected
+        normalize_time_array(["2024-01-01", "2024-01-02"], display_timezone="Asia/Tokyo")
+        ```
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        raise TimeValidationError("time column must not be boolean")
+
+    if pd.api.types.is_numeric_dtype(dtype):
+        seconds = _epoch_to_seconds(series.to_numpy(), unit)
+    else:
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            numeric = pd.to_numeric(series, errors="coerce")
+            if not numeric.isna().any():
+                # Epoch values stored as strings or Python objects
+                return normalize_time_array(numeric, unit, display_timezone)
+        try:
+            parsed = pd.to_datetime(series, utc=True)
+        except (ValueError, TypeError, OverflowError):
+            # Column mixes formats (e.g. dates and ISO datetimes); parse each
+            # element separately instead of with one inferred format
+            try:
+                parsed = pd.to_datetime(series, utc=True, format="mixed")
+            except (ValueError, TypeError, OverflowError) as exc:
+                raise TimeValidationError(f"Invalid time column: {exc}") from exc
+        if parsed.isna().any():
+            raise TimeValidationError("time column contains missing values")
+        seconds = parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[s]").astype(np.int64)
+
+    if display_timezone is None:
+        return seconds
+    return shift_to_timezone(seconds, display_timezone)
+
+
+def shift_to_timezone(seconds: np.ndarray, display_timezone: str) -> np.ndarray:
+    """Shift UTC epoch seconds so they display as wall-clock time in a timezone.
+
+    lightweight-charts renders every timestamp as UTC. Adding the zone's UTC
+    offset (including daylight saving changes) at each instant makes the time
+    axis read in the given timezone.
+
+    Args:
+        seconds: int64 array of UTC epoch seconds.
+        display_timezone: IANA timezone name.
+
+    Returns:
+        np.ndarray: int64 array of shifted epoch seconds.
+
+    Raises:
+        ValueValidationError: If the timezone name is unknown.
+    """
+    utc = pd.DatetimeIndex(np.asarray(seconds, dtype="datetime64[s]"), tz="UTC")
+    try:
+        local = utc.tz_convert(display_timezone)
+    except (KeyError, ValueError) as exc:
+        raise ValueValidationError(
+            "display_timezone", f"unknown timezone {display_timezone!r}"
+        ) from exc
+    return local.tz_localize(None).to_numpy(dtype="datetime64[s]").astype(np.int64)
@@ -23,11 +23,14 @@ Exception Hierarchy:
     │   └── ExitTimeAfterEntryTimeError (Streamlit-specific)
     ├── RequiredFieldError
     ├── DataFrameValidationError
-    └── BaseValueFormatError (Streamlit-specific)
+    ├── BaseValueFormatError (Streamlit-specific)
+    └── PayloadBudgetExceededError (Streamlit-specific)
     ConfigurationError (base)
     ├── ComponentNotAvailableError (Streamlit-specific)
     ├── NpmNotFoundError (Streamlit-specific)
     └── CliNotFoundError (Streamlit-specific)
+    TimeoutError (built-in)
+    └── DataFetchTimeoutError (Streamlit-specific)
 
 Usage Example:
     ```python
@@ -48,7 +51,7 @@ For more information, see the lightweight_charts_pro.exceptions module.
 """
 
 # Standard Imports
-# (None in this module)
+from typing import Any, Optional
 
 # Third Party Imports
 # Re-export core exceptions from the lightweight_charts_pro package
@@ -446,6 +449,89 @@ class BaseValueFormatError(ValidationError):
         super().__init__("Base value must be a dict with 'type' and 'price' keys")
 
 
+class PayloadBudgetExceededError(ValidationError):
+    """Raised when a render exceeds its payload budget under the "raise" policy.
+
+    Charts and ChartManager pages can be given a PayloadBudget that caps the
+    number of data points and the encoded size sent to the browser. With the
+    "raise" policy, a render that would exceed the budget fails with this
+    exception instead of degrading the data.
+
+    Attributes:
+        points (int): Number of data points in the payload.
+        size (int): Estimated encoded size of the payload in bytes.
+
+    Example:
+        ```python
+        chart = Chart(payload_budget=PayloadBudget(max_points=100_000, policy="raise"))
+        chart.add_series(LineSeries(tick_df, column_mapping))  # 5M rows
+        chart.render()  # Raises PayloadBudgetExceededError
+        ```
+    """
+
+    def __init__(
+        self,
+        points: int,
+        size: int,
+        max_points: Optional[int],
+        max_bytes: Optional[int],
+    ):
+        """Initialize PayloadBudgetExceededError with the payload and budget sizes.
+
+        Args:
+            points (int): Number of data points in the payload.
+            size (int): Estimated encoded size of the payload in bytes.
+            max_points (Optional[int]): Point limit of the budget, if any.
+            max_bytes (Optional[int]): Byte limit of the budget, if any.
+
+        Raises:
+            None
+        """
+        self.points = points
+        self.size = size
+        # Report both limits so the user can see which one was exceeded
+        super().__init__(
+            f"Chart payload of {points:,} points (~{size / 1e6:.1f} MB) exceeds the budget "
+            f"of {max_points if max_points is not None else 'unlimited'} points / "
+            f"{max_bytes if max_bytes is not None else 'unlimited'} bytes. Filter or "
+            "resample the data, or use the 'downsample' or 'truncate' budget policy."
+        )
+
+
+class DataFetchTimeoutError(TimeoutError):
+    """Raised when an async data load takes longer than its timeout.
+
+    Subclasses the built-in TimeoutError, so existing ``except TimeoutError``
+    handlers catch it.
+
+    Attributes:
+        key (Any): Key of the load in the fetch requests.
+        timeout (Optional[float]): Timeout of the load in seconds.
+
+    Example:
+        ```python
+        try:
+            data = manager.fetch_data({"prices": FetchRequest(api, window)}, timeout=2.0)
+        except DataFetchTimeoutError as e:
+            st.warning(f"{e.key} is not available right now")
+        ```
+    """
+
+    def __init__(self, key: Any, timeout: Optional[float]):
+        """Initialize DataFetchTimeoutError with the load key and its timeout.
+
+        Args:
+            key (Any): Key of the load in the fetch requests.
+            timeout (Optional[float]): Timeout of the load in seconds.
+
+        Raises:
+            None
+        """
+        self.key = key
+        self.timeout = timeout
+        super().__init__(f"Data load {key!r} did not complete within {timeout} s")
+
+
 class NpmNotFoundError(ConfigurationError):
     """Raised when NPM is not found in the system PATH.
 
@@ -524,6 +610,7 @@ __all__ = [
     "ComponentNotAvailableError",
     "ConfigurationError",
     "DataFrameValidationError",
+    "DataFetchTimeoutError",
     "DataItemsTypeError",
     "DuplicateError",
     "ExitTimeAfterEntryTimeError",
@@ -531,6 +618,7 @@ __all__ = [
     "InvalidMarkerPositionError",
     "NotFoundError",
     "NpmNotFoundError",
+    "PayloadBudgetExceededError",
     "PriceScaleIdTypeError",
     "PriceScaleOptionsTypeError",
     "RangeValidationError",
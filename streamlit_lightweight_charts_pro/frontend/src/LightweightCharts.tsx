@@ -68,6 +68,7 @@ import {
   UTCTimestamp,
   MouseEventParams as LWCMouseEventParams,
   Time,
+  LogicalRange,
 } from "lightweight-charts";
 import {
   ComponentConfig,
@@ -107,10 +108,24 @@ import {
 } from "@nandkapadia/lightweight-charts-pro-core";
 // Streamlit-specific services
 import { ChartPrimitiveManager } from "./services/ChartPrimitiveManager";
-import { createSeriesWithConfig } from "./series/UnifiedSeriesFactory";
+import {
+  createSeriesWithConfig,
+  reconfigureSeries,
+} from "./series/UnifiedSeriesFactory";
 import { ErrorBoundary } from "./components/ErrorBoundary";
 import { react19Monitor } from "./utils/react19PerformanceMonitor";
 import { dialogConfigToApiOptions } from "./series/UnifiedPropertyMapper";
+import { setupPayloadPaging } from "./utils/payloadPaging";
+import { SharedResizeObserver } from "./utils/sharedResizeObserver";
+import { ChartVirtualizer } from "./utils/chartVirtualizer";
+import { InitScheduler } from "./utils/initScheduler";
+import { ChartSyncBus } from "./services/ChartSyncBus";
+import {
+  planChartReconcile,
+  ReconcilePlan,
+  sameComponentSettings,
+} from "./utils/chartReconciler";
+import { Streamlit } from "streamlit-component-lib";
 
 /**
  * Finds the nearest available time in chart data to a target timestamp.
@@ -316,7 +331,12 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
     const seriesRefs = useRef<{ [key: string]: ExtendedSeriesApi[] }>({});
     const signalPluginRefs = useRef<{ [key: string]: SignalSeries }>({});
     const chartConfigs = useRef<{ [key: string]: ChartConfig }>({});
-    const resizeObserverRef = useRef<ResizeObserver | null>(null);
+    // One observer for every chart container of this component instance,
+    // created on the first render only
+    const resizeObserverRef = useRef<SharedResizeObserver | null>(null);
+    if (resizeObserverRef.current === null) {
+      resizeObserverRef.current = new SharedResizeObserver();
+    }
     const legendResizeObserverRefs = useRef<{ [key: string]: ResizeObserver }>(
       {},
     );
@@ -324,6 +344,17 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
     const isDisposingRef = useRef<boolean>(false);
     const chartContainersRef = useRef<{ [key: string]: HTMLElement }>({});
     const debounceTimersRef = useRef<{ [key: string]: NodeJS.Timeout }>({});
+    // Off-screen chart virtualization (ComponentConfig.virtualize)
+    const virtualizerRef = useRef<ChartVirtualizer | null>(null);
+    const savedRangesRef = useRef<{ [key: string]: LogicalRange | null }>({});
+    // Time-sliced initialization: charts and decorations run as prioritized
+    // tasks; the scheduler is created on the first render only
+    const schedulerRef = useRef<InitScheduler | null>(null);
+    if (schedulerRef.current === null) {
+      schedulerRef.current = new InitScheduler();
+    }
+    // Configuration the mounted charts were built from (reconciliation)
+    const mountedConfigRef = useRef<ComponentConfig | null>(null);
 
     // Store function references to avoid dependency issues
     const functionRefs = useRef<{
@@ -471,22 +502,9 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
         ) {
           const chartId = chart.chartElement().id || "default";
 
-          const resizeObserver =
-            typeof ResizeObserver !== "undefined"
-              ? new ResizeObserver(() => {
-                  debouncedResizeHandler(
-                    chartId,
-                    chart,
-                    container,
-                    chartConfig,
-                  );
-                })
-              : null;
-
-          if (resizeObserver && typeof resizeObserver.observe === "function") {
-            resizeObserver.observe(container);
-          }
-          resizeObserverRef.current = resizeObserver;
+          resizeObserverRef.current?.observe(container, () => {
+            debouncedResizeHandler(chartId, chart, container, chartConfig);
+          });
         }
       },
       [debouncedResizeHandler],
@@ -504,356 +522,64 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
           chartRefs.current[chartId] = chart;
         }
 
-        // Helper function to get crosshair data point from series data
-        const getCrosshairDataPoint = (
-          series: ExtendedSeriesApi,
-          param: LWCMouseEventParams,
-        ) => {
-          if (!param.time) {
-            return null;
-          }
-          const dataPoint = param.seriesData.get(series);
-          return dataPoint || null;
-        };
-
-        // Helper function to sync crosshair between charts (TradingView's official approach)
-        const syncCrosshair = (
-          targetChart: IChartApi,
-          targetSeries: ExtendedSeriesApi,
-          dataPoint: SeriesDataPoint | null,
-        ) => {
-          if (
-            dataPoint &&
-            "value" in dataPoint &&
-            dataPoint.value !== undefined
-          ) {
-            targetChart.setCrosshairPosition(
-              dataPoint.value,
-              dataPoint.time,
-              targetSeries,
-            );
-            return;
-          }
-          targetChart.clearCrosshairPosition();
-        };
-
-        // Setup crosshair synchronization (TradingView's official approach)
-        if (syncConfig.crosshair) {
-          // Add localStorage event listener for cross-component sync (only once per chart)
-          if (!(chart as ExtendedChartApi)._storageListenerAdded) {
-            let lastSyncTimestamp = 0;
-            const SYNC_DEBOUNCE_MS = 50; // Prevent rapid-fire sync events
-
-            const handleStorageChange = (e: StorageEvent) => {
-              if (e.key === "chart_sync_data" && e.newValue) {
-                try {
-                  const syncData = JSON.parse(e.newValue);
-                  if (
-                    syncData.chartId !== chartId &&
-                    syncData.groupId === chartGroupId &&
-                    syncData.type === "crosshair"
-                  ) {
-                    // Debounce to prevent feedback loops
-                    const now = Date.now();
-                    if (now - lastSyncTimestamp < SYNC_DEBOUNCE_MS) {
-                      return;
-                    }
-                    lastSyncTimestamp = now;
-
-                    // Apply crosshair sync from other component
-                    if (syncData.time && syncData.value) {
-                      const targetSeries = seriesRefs.current[chartId]?.[0];
-                      if (targetSeries) {
-                        // Set flag to prevent this update from triggering localStorage storage
-                        (chart as ExtendedChartApi)._isExternalSync = true;
-                        chart.setCrosshairPosition(
-                          syncData.value,
-                          syncData.time,
-                          targetSeries,
-                        );
-                        // Clear flag after a short delay
-                        setTimeout(() => {
-                          (chart as ExtendedChartApi)._isExternalSync = false;
-                        }, 100);
-                      }
-                    }
-                  }
-                } catch (error) {
-                  logger.error(
-                    "Error handling storage change for crosshair sync",
-                    "ChartSync",
-                    error,
-                  );
+        const extendedChart = chart as ExtendedChartApi;
+        extendedChart._syncLeave?.();
+
+        // Charts of the same group, in this component and in other components,
+        // are reached through the sync bus, which coalesces updates per frame
+        const bus = ChartSyncBus.getInstance();
+        extendedChart._syncLeave = bus.join({
+          chartId,
+          groupId: chartGroupId,
+          onCrosshair: syncConfig.crosshair
+            ? ({ time, value }) => {
+                const targetSeries = seriesRefs.current[chartId]?.[0];
+                if (time !== null && value !== null && targetSeries) {
+                  chart.setCrosshairPosition(value, time as Time, targetSeries);
+                } else {
+                  chart.clearCrosshairPosition();
                 }
               }
-            };
-
-            window.addEventListener("storage", handleStorageChange);
-            (chart as ExtendedChartApi)._storageListenerAdded = true;
-            // Store handler reference for cleanup
-            (chart as ExtendedChartApi)._storageHandler = handleStorageChange;
-          }
+            : undefined,
+          onTimeRange: syncConfig.timeRange
+            ? (range) => {
+                chart.timeScale().setVisibleLogicalRange(range);
+              }
+            : undefined,
+        });
 
-          chart.subscribeCrosshairMove((param) => {
-            // Skip if this is an external sync to prevent feedback loops
-            if ((chart as ExtendedChartApi)._isExternalSync) {
-              return;
+        // Setup crosshair synchronization (TradingView's official approach)
+        if (syncConfig.crosshair) {
+          chart.subscribeCrosshairMove((param: LWCMouseEventParams) => {
+            const series = seriesRefs.current[chartId]?.[0];
+            const dataPoint =
+              param.time && series ? param.seriesData.get(series) : undefined;
+
+            // Candlestick and bar points have no value; follow their close
+            let value: number | null = null;
+            if (dataPoint && "value" in dataPoint && dataPoint.value !== undefined) {
+              value = dataPoint.value;
+            } else if (dataPoint && "close" in dataPoint) {
+              value = dataPoint.close;
             }
 
-            // Get all series from the current chart using stored references
-            const currentSeries = seriesRefs.current[chartId] || [];
-
-            // Method 1: Same-component synchronization (direct object references)
-            Object.entries(window.chartApiMap || {}).forEach(
-              ([id, otherChart]) => {
-                if (id !== chartId && otherChart) {
-                  try {
-                    // Get the other chart's group ID from global registry
-                    const otherChartGroupId = window.chartGroupMap?.[id] || 0;
-
-                    // Only sync charts in the same group
-                    if (otherChartGroupId === chartGroupId && param.time) {
-                      const otherSeries = window.seriesRefsMap?.[id] || [];
-
-                      // Sync using TradingView's approach - sync first series to first series
-                      if (currentSeries.length > 0 && otherSeries.length > 0) {
-                        const dataPoint = getCrosshairDataPoint(
-                          currentSeries[0],
-                          param,
-                        );
-
-                        // Set flag to prevent this update from triggering a sync back
-                        (otherChart as ExtendedChartApi)._isExternalSync = true;
-
-                        // Clear any existing timeout to prevent premature flag clearing
-                        if (
-                          (otherChart as ExtendedChartApi)._externalSyncTimeout
-                        ) {
-                          clearTimeout(
-                            (otherChart as ExtendedChartApi)
-                              ._externalSyncTimeout,
-                          );
-                        }
-
-                        syncCrosshair(
-                          otherChart as IChartApi,
-                          otherSeries[0],
-                          dataPoint,
-                        );
-
-                        // Clear flag after a short delay, storing timeout ID
-                        (otherChart as ExtendedChartApi)._externalSyncTimeout =
-                          setTimeout(() => {
-                            (otherChart as ExtendedChartApi)._isExternalSync =
-                              false;
-                            (
-                              otherChart as ExtendedChartApi
-                            )._externalSyncTimeout = undefined;
-                          }, 100);
-                      }
-                    }
-                  } catch (error) {
-                    logger.warn(
-                      "Error syncing crosshair to other chart",
-                      "ChartSync",
-                      error,
-                    );
-                  }
-                }
-              },
-            );
-
-            // Method 2: Cross-component synchronization using localStorage
-            if (param.time && currentSeries.length > 0) {
-              const dataPoint = getCrosshairDataPoint(currentSeries[0], param);
-              const syncData = {
-                time: param.time,
-                value:
-                  dataPoint && "value" in dataPoint ? dataPoint.value : null,
-                chartId: chartId,
-                groupId: chartGroupId,
-                timestamp: Date.now(),
-                type: "crosshair",
-              };
-
-              // Store in localStorage for cross-component communication
-              try {
-                localStorage.setItem(
-                  "chart_sync_data",
-                  JSON.stringify(syncData),
-                );
-              } catch (error) {
-                logger.warn(
-                  "Failed to store crosshair sync data in localStorage",
-                  "ChartSync",
-                  error,
-                );
-              }
-            }
+            bus.publish("crosshair", chartId, chartGroupId, {
+              time: param.time ?? null,
+              value,
+            });
           });
         }
 
         // Setup time range synchronization (TradingView's official approach)
         if (syncConfig.timeRange) {
-          const timeScale = chart.timeScale();
-          if (timeScale) {
-            // Add localStorage event listener for cross-component time range sync
-            // (only once per chart)
-            if (!(chart as ExtendedChartApi)._timeRangeStorageListenerAdded) {
-              let lastTimeRangeSyncTimestamp = 0;
-              const TIME_RANGE_SYNC_DEBOUNCE_MS = 100; // Prevent rapid-fire time range sync events
-
-              const handleTimeRangeStorageChange = (e: StorageEvent) => {
-                if (e.key === "chart_time_range_sync" && e.newValue) {
-                  try {
-                    const syncData = JSON.parse(e.newValue);
-                    if (
-                      syncData.chartId !== chartId &&
-                      syncData.groupId === chartGroupId &&
-                      syncData.type === "timeRange"
-                    ) {
-                      // Debounce to prevent feedback loops
-                      const now = Date.now();
-                      if (
-                        now - lastTimeRangeSyncTimestamp <
-                        TIME_RANGE_SYNC_DEBOUNCE_MS
-                      ) {
-                        return;
-                      }
-                      lastTimeRangeSyncTimestamp = now;
-
-                      // Apply time range sync from other component
-                      if (syncData.timeRange) {
-                        const currentTimeScale = chart.timeScale();
-                        if (currentTimeScale) {
-                          // Set flag to prevent this update from triggering localStorage storage
-                          (chart as ExtendedChartApi)._isExternalTimeRangeSync =
-                            true;
-                          currentTimeScale.setVisibleLogicalRange(
-                            syncData.timeRange,
-                          );
-                          // Clear flag after a short delay
-                          setTimeout(() => {
-                            (
-                              chart as ExtendedChartApi
-                            )._isExternalTimeRangeSync = false;
-                          }, 150);
-                        }
-                      }
-                    }
-                  } catch (error) {
-                    logger.error(
-                      "Error handling storage change for time range sync",
-                      "ChartSync",
-                      error,
-                    );
-                  }
-                }
-              };
-
-              window.addEventListener("storage", handleTimeRangeStorageChange);
-              (chart as ExtendedChartApi)._timeRangeStorageListenerAdded = true;
-              // Store handler reference for cleanup
-              (chart as ExtendedChartApi)._timeRangeStorageHandler =
-                handleTimeRangeStorageChange;
+          chart.timeScale().subscribeVisibleLogicalRangeChange((timeRange) => {
+            if (timeRange) {
+              bus.publish("timeRange", chartId, chartGroupId, {
+                from: timeRange.from,
+                to: timeRange.to,
+              });
             }
-
-            // Throttle timeScale range changes to prevent X-axis lag during pan/zoom
-            let lastTimeRangeSync = 0;
-            const timeRangeSyncThrottle = 16; // ~60fps max for smooth performance
-            timeScale.subscribeVisibleLogicalRangeChange((timeRange) => {
-              // Throttle to prevent performance issues during X-axis interactions
-              const now = Date.now();
-              if (now - lastTimeRangeSync < timeRangeSyncThrottle) {
-                return;
-              }
-              lastTimeRangeSync = now;
-
-              // Skip if this is an external sync to prevent feedback loops
-              if ((chart as ExtendedChartApi)._isExternalTimeRangeSync) {
-                return;
-              }
-
-              // Method 1: Same-component synchronization (direct object references)
-              Object.entries(window.chartApiMap || {}).forEach(
-                ([id, otherChart]) => {
-                  if (id !== chartId && otherChart) {
-                    try {
-                      // Get the other chart's group ID from global registry
-                      const otherChartGroupId = window.chartGroupMap?.[id] || 0;
-
-                      // Only sync charts in the same group
-                      if (otherChartGroupId === chartGroupId) {
-                        const otherTimeScale = otherChart.timeScale();
-                        if (otherTimeScale && timeRange) {
-                          // Set flag to prevent this update from triggering a sync back
-                          (
-                            otherChart as ExtendedChartApi
-                          )._isExternalTimeRangeSync = true;
-
-                          // Clear any existing timeout to prevent premature flag clearing
-                          if (
-                            (otherChart as ExtendedChartApi)
-                              ._externalTimeRangeSyncTimeout
-                          ) {
-                            clearTimeout(
-                              (otherChart as ExtendedChartApi)
-                                ._externalTimeRangeSyncTimeout,
-                            );
-                          }
-
-                          otherTimeScale.setVisibleLogicalRange(timeRange);
-
-                          // Clear flag after a short delay, storing timeout ID
-                          (
-                            otherChart as ExtendedChartApi
-                          )._externalTimeRangeSyncTimeout = setTimeout(() => {
-                            (
-                              otherChart as ExtendedChartApi
-                            )._isExternalTimeRangeSync = false;
-                            (
-                              otherChart as ExtendedChartApi
-                            )._externalTimeRangeSyncTimeout = undefined;
-                          }, 150);
-                        }
-                      }
-                    } catch (error) {
-                      logger.warn(
-                        "Error syncing time range to other chart",
-                        "ChartSync",
-                        error,
-                      );
-                    }
-                  }
-                },
-              );
-
-              // Method 2: Cross-component synchronization using localStorage
-              if (timeRange) {
-                const syncData = {
-                  timeRange: timeRange,
-                  chartId: chartId,
-                  groupId: chartGroupId,
-                  timestamp: Date.now(),
-                  type: "timeRange",
-                };
-
-                // Store in localStorage for cross-component communication
-                try {
-                  localStorage.setItem(
-                    "chart_time_range_sync",
-                    JSON.stringify(syncData),
-                  );
-                } catch (error) {
-                  logger.warn(
-                    "Failed to store time range sync data in localStorage",
-                    "ChartSync",
-                    error,
-                  );
-                }
-              }
-            });
-          }
+          });
         }
       },
       [],
@@ -987,14 +713,17 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       });
       debounceTimersRef.current = {};
 
-      // Disconnect resize observer
-      if (resizeObserverRef.current) {
-        try {
-          resizeObserverRef.current.disconnect();
-        } catch (error) {
-          logger.warn("ResizeObserver already disconnected", "Cleanup", error);
-        }
-        resizeObserverRef.current = null;
+      // Drop queued initialization work and stop virtualized mounting
+      schedulerRef.current?.cancel();
+      virtualizerRef.current?.disconnect();
+      virtualizerRef.current = null;
+      savedRangesRef.current = {};
+
+      // Disconnect the shared resize observer
+      try {
+        resizeObserverRef.current?.disconnect();
+      } catch (error) {
+        logger.warn("ResizeObserver already disconnected", "Cleanup", error);
       }
 
       // Clean up signal series plugins
@@ -1095,41 +824,15 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
         }
       });
 
-      // Clear any pending timeouts and remove storage listeners from chart sync operations
+      // Leave the sync bus
       Object.values(chartRefs.current).forEach((chart) => {
         try {
           const extendedChart = chart as ExtendedChartApi;
-          // Clear crosshair sync timeout
-          if (extendedChart._externalSyncTimeout) {
-            clearTimeout(extendedChart._externalSyncTimeout);
-            extendedChart._externalSyncTimeout = undefined;
-          }
-          // Clear time range sync timeout
-          if (extendedChart._externalTimeRangeSyncTimeout) {
-            clearTimeout(extendedChart._externalTimeRangeSyncTimeout);
-            extendedChart._externalTimeRangeSyncTimeout = undefined;
-          }
-          // Remove crosshair storage event listener
-          if (extendedChart._storageHandler) {
-            window.removeEventListener(
-              "storage",
-              extendedChart._storageHandler,
-            );
-            extendedChart._storageHandler = undefined;
-            extendedChart._storageListenerAdded = false;
-          }
-          // Remove time range storage event listener
-          if (extendedChart._timeRangeStorageHandler) {
-            window.removeEventListener(
-              "storage",
-              extendedChart._timeRangeStorageHandler,
-            );
-            extendedChart._timeRangeStorageHandler = undefined;
-            extendedChart._timeRangeStorageListenerAdded = false;
-          }
+          extendedChart._syncLeave?.();
+          extendedChart._syncLeave = undefined;
         } catch (error) {
           logger.warn(
-            "Error clearing chart timeouts and listeners",
+            "Error leaving chart sync",
             "Cleanup",
             error,
           );
@@ -1164,6 +867,73 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       isDisposingRef.current = false;
     }, []);
 
+    // Remove one chart that scrolled far off-screen (virtualization).
+    // Its configuration and series data stay in processedChartConfigs, so it
+    // can be mounted again without a Streamlit rerun.
+    const disposeChart = useCallback((chartId: string) => {
+      const chart = chartRefs.current[chartId];
+      if (!chart) {
+        return;
+      }
+
+      if (debounceTimersRef.current[chartId]) {
+        clearTimeout(debounceTimersRef.current[chartId]);
+        delete debounceTimersRef.current[chartId];
+      }
+
+      const container = chartContainersRef.current[chartId];
+      if (container) {
+        resizeObserverRef.current?.unobserve(container);
+      }
+      legendResizeObserverRefs.current[chartId]?.disconnect();
+      delete legendResizeObserverRefs.current[chartId];
+
+      const destroyAll = (items: unknown) => {
+        if (Array.isArray(items)) {
+          items.forEach((item: Destroyable) => {
+            try {
+              item?.destroy?.();
+            } catch (error) {
+              logger.warn("Widget already destroyed", "Cleanup", error);
+            }
+          });
+        }
+      };
+      destroyAll(window.paneButtonPanelWidgets?.[chartId]);
+      delete window.paneButtonPanelWidgets?.[chartId];
+      destroyAll(window.chartPlugins?.get(chartId));
+      window.chartPlugins?.delete(chartId);
+
+      try {
+        ChartPrimitiveManager.cleanup(chartId);
+        ChartCoordinateService.getInstance().unregisterChart(chartId);
+        CornerLayoutManager.cleanup(chartId);
+      } catch (error) {
+        logger.warn("Chart services already cleaned up", "Cleanup", error);
+      }
+
+      const extendedChart = chart as ExtendedChartApi;
+      extendedChart._syncLeave?.();
+      extendedChart._syncLeave = undefined;
+
+      try {
+        savedRangesRef.current[chartId] = chart
+          .timeScale()
+          .getVisibleLogicalRange();
+        chart.remove();
+      } catch (error) {
+        logger.warn("Chart already removed or disposed", "Cleanup", error);
+      }
+
+      delete chartRefs.current[chartId];
+      delete seriesRefs.current[chartId];
+      delete signalPluginRefs.current[chartId];
+      delete chartConfigs.current[chartId];
+      delete window.chartApiMap?.[chartId];
+      delete window.seriesRefsMap?.[chartId];
+      delete window.chartGroupMap?.[chartId];
+    }, []);
+
     const addTradeVisualization = useCallback(
       async (
         _chart: IChartApi,
@@ -1611,8 +1381,6 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       [],
     );
 
-    // Store legend element references for dynamic updates
-    const legendElementsRef = useRef<Map<string, HTMLElement>>(new Map());
     const legendSeriesDataRef = useRef<
       Map<
         string,
@@ -2018,7 +1786,7 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
           window.seriesRefsMap = {};
         }
 
-        processedChartConfigs.forEach((chartConfig: ChartConfig) => {
+        const mountChart = (chartConfig: ChartConfig) => {
           const chartId = chartConfig.chartId ?? `chart-${Date.now()}`;
           const containerId =
             chartConfig.containerId || `chart-container-${chartId}`;
@@ -2140,39 +1908,8 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
             }
             window.chartApiMap[chartId] = chart;
 
-            // Add resize observer to reposition legends when container resizes
-            const resizeObserver =
-              typeof ResizeObserver !== "undefined"
-                ? new ResizeObserver((entries) => {
-                    for (const entry of entries) {
-                      if (entry.target === container) {
-                        // Trigger legend repositioning for all panes
-                        setTimeout(() => {
-                          const legendElements = legendElementsRef.current;
-                          if (legendElements) {
-                            // Legend repositioning is now handled by direct DOM manipulation
-                          }
-                        }, 100); // Small delay to ensure resize is complete
-                      }
-                    }
-                  })
-                : null;
-
-            // Start observing the container for size changes
-            if (
-              resizeObserver &&
-              typeof resizeObserver.observe === "function"
-            ) {
-              resizeObserver.observe(container);
-            }
-
-            // Store the observer reference for cleanup
-            if (!window.chartResizeObservers) {
-              window.chartResizeObservers = {};
-            }
-            if (resizeObserver) {
-              window.chartResizeObservers[chartId] = resizeObserver;
-            }
+            // Legend repositioning on resize is handled by the pane primitives;
+            // container resizes go through the shared observer (setupAutoSizing)
 
             // Calculate chart dimensions once
             const containerRect = container.getBoundingClientRect();
@@ -2534,45 +2271,62 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
               );
             }
 
-            // Add modular tooltip system
-            functionRefs.current.addModularTooltip?.(
-              chart,
-              container,
-              seriesList,
-              chartConfig,
-            );
-
             // Store chart config for trade visualization when chart is ready
             chartConfigs.current[chartId] = chartConfig;
 
-            // Add chart-level annotations
-            if (chartConfig.annotations) {
-              functionRefs.current.addAnnotations?.(
-                chart,
-                chartConfig.annotations,
-              );
-            }
+            // Decorations run as background tasks once the series are drawn
+            const chartContainer = container;
+            schedulerRef.current
+              ?.schedule(() => {
+                // Skip if the chart was disposed or re-created meanwhile
+                if (chartRefs.current[chartId] !== chart) {
+                  return;
+                }
 
-            // Add annotation layers
-            if (chartConfig.annotationLayers) {
-              functionRefs.current.addAnnotationLayers?.(
-                chart,
-                chartConfig.annotationLayers,
-              );
-            }
+                // Add modular tooltip system
+                functionRefs.current.addModularTooltip?.(
+                  chart,
+                  chartContainer,
+                  seriesList,
+                  chartConfig,
+                );
 
-            // Add price lines
-            if (chartConfig.priceLines && seriesList.length > 0) {
-              chartConfig.priceLines.forEach(
-                (priceLine: Record<string, unknown>) => {
-                  seriesList[0].createPriceLine(
-                    priceLine as unknown as Parameters<
-                      (typeof seriesList)[0]["createPriceLine"]
-                    >[0],
+                // Add chart-level annotations
+                if (chartConfig.annotations) {
+                  functionRefs.current.addAnnotations?.(
+                    chart,
+                    chartConfig.annotations,
                   );
-                },
-              );
-            }
+                }
+
+                // Add annotation layers
+                if (chartConfig.annotationLayers) {
+                  functionRefs.current.addAnnotationLayers?.(
+                    chart,
+                    chartConfig.annotationLayers,
+                  );
+                }
+
+                // Add price lines
+                if (chartConfig.priceLines && seriesList.length > 0) {
+                  chartConfig.priceLines.forEach(
+                    (priceLine: Record<string, unknown>) => {
+                      seriesList[0].createPriceLine(
+                        priceLine as unknown as Parameters<
+                          (typeof seriesList)[0]["createPriceLine"]
+                        >[0],
+                      );
+                    },
+                  );
+                }
+              }, "background")
+              .catch((error) => {
+                logger.error(
+                  "Failed to add chart decorations",
+                  "LightweightCharts",
+                  error,
+                );
+              });
 
             // Add range switcher if configured
             if (
@@ -2724,6 +2478,17 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
             // Setup fitContent functionality
             functionRefs.current.setupFitContent?.(chart, chartConfig);
 
+            // Page through data windows truncated by a payload budget
+            if (chartConfig.payloadWindow) {
+              setupPayloadPaging(chart, chartConfig.payloadWindow, (page) =>
+                Streamlit.setComponentValue({
+                  type: "payload_page",
+                  chartId,
+                  page,
+                }),
+              );
+            }
+
             // Create individual pane containers and add collapse functionality (synchronous like working version)
             const paneCollapseConfig = chartConfig.paneCollapse || {
               enabled: true,
@@ -2853,17 +2618,80 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
           } catch {
             logger.error("An error occurred", "LightweightCharts");
           }
-        });
+        };
+
+        let mounted: Promise<unknown> = Promise.resolve();
+        const virtualize = config?.virtualize;
+        if (virtualize && typeof IntersectionObserver !== "undefined") {
+          // Mount charts as they approach the viewport, one per frame
+          const configsById = new Map(
+            processedChartConfigs.map((chartConfig) => [
+              chartConfig.chartId as string,
+              chartConfig,
+            ]),
+          );
+          const virtualizer = new ChartVirtualizer({
+            mount: (chartId) => {
+              const chartConfig = configsById.get(chartId);
+              if (!chartConfig) {
+                return;
+              }
+              mountChart(chartConfig);
+              const savedRange = savedRangesRef.current[chartId];
+              if (savedRange) {
+                requestAnimationFrame(() => {
+                  chartRefs.current[chartId]
+                    ?.timeScale()
+                    .setVisibleLogicalRange(savedRange);
+                });
+              }
+            },
+            dispose: disposeChart,
+            mountMargin: virtualize.mountMargin,
+            disposeMargin: virtualize.disposeMargin,
+          });
+          virtualizerRef.current = virtualizer;
+
+          processedChartConfigs.forEach((chartConfig: ChartConfig) => {
+            const container = document.getElementById(
+              chartConfig.containerId as string,
+            );
+            if (container) {
+              virtualizer.observe(chartConfig.chartId as string, container);
+            } else {
+              mountChart(chartConfig);
+            }
+          });
+        } else {
+          // The first (main price) chart is built right away; the others are
+          // queued and built in time slices so the page stays responsive
+          const [firstChart, ...otherCharts] = processedChartConfigs;
+          mountChart(firstChart);
+          mounted = Promise.all(
+            otherCharts.map((chartConfig) =>
+              schedulerRef.current?.schedule(
+                () => mountChart(chartConfig),
+                "user-visible",
+              ),
+            ),
+          );
+        }
 
         isInitializedRef.current = true;
 
-        // Small delay to ensure charts are rendered before any cleanup
-        setTimeout(() => {
-          // Notify parent component that charts are ready
-          if (onChartsReady) {
-            onChartsReady();
-          }
-        }, 50);
+        mounted
+          .then(() => {
+            // Small delay to ensure charts are rendered before any cleanup
+            setTimeout(() => {
+              // Notify parent component that charts are ready
+              if (onChartsReady) {
+                onChartsReady();
+              }
+            }, 50);
+          })
+          .catch((error) => {
+            logger.error("Chart initialization failed", "ChartInit", error);
+          });
       },
       [
         processedChartConfigs,
@@ -2872,6 +2700,7 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
         height,
         onChartsReady,
         addTradeVisualization,
+        disposeChart,
       ],
     );
 
@@ -2906,6 +2735,88 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       cleanupCharts,
     ]);
 
+    // Bring the mounted charts to a new configuration in place, keeping chart
+    // instances, panes and primitives. Returns false, without changing
+    // anything, if some chart cannot be reconciled and has to be rebuilt.
+    const reconcileCharts = useCallback(
+      (nextConfigs: ChartConfig[]): boolean => {
+        if (Object.keys(chartRefs.current).length !== nextConfigs.length) {
+          return false;
+        }
+
+        const plans: Array<{
+          chartId: string;
+          chart: IChartApi;
+          chartConfig: ChartConfig;
+          plan: ReconcilePlan;
+        }> = [];
+        for (const chartConfig of nextConfigs) {
+          const chartId = chartConfig.chartId as string;
+          const chart = chartRefs.current[chartId];
+          const mounted = chartConfigs.current[chartId];
+          if (!chart || !mounted) {
+            return false;
+          }
+          const plan = planChartReconcile(
+            mounted,
+            chartConfig,
+            seriesRefs.current[chartId] ?? [],
+          );
+          if (!plan) {
+            return false;
+          }
+          plans.push({ chartId, chart, chartConfig, plan });
+        }
+
+        plans.forEach(({ chartId, chart, chartConfig, plan }) => {
+          plan.remove.forEach((series) => {
+            try {
+              chart.removeSeries(series);
+            } catch (error) {
+              logger.warn("Series already removed", "Reconcile", error);
+            }
+          });
+
+          plan.update.forEach(
+            ({ series, config, optionsChanged, dataChanged }) => {
+              reconfigureSeries(
+                series,
+                config.type,
+                optionsChanged
+                  ? (config.options as Record<string, unknown>)
+                  : undefined,
+                dataChanged ? config.data : undefined,
+              );
+            },
+          );
+
+          const seriesList: ExtendedSeriesApi[] = [];
+          plan.series.forEach((kept, seriesIndex) => {
+            const seriesConfig = chartConfig.series[seriesIndex];
+            const series =
+              kept ??
+              createSeriesWithConfig(chart, {
+                ...seriesConfig,
+                chartId,
+                seriesId: `${chartId}-series-${seriesIndex}`,
+              });
+            if (!series) {
+              return;
+            }
+            seriesList.push(series);
+          });
+
+          seriesRefs.current[chartId] = seriesList;
+          if (window.seriesRefsMap) {
+            window.seriesRefsMap[chartId] = seriesList;
+          }
+          chartConfigs.current[chartId] = chartConfig;
+        });
+        return true;
+      },
+      [],
+    );
+
     // Python-side change detection: Simply trust the forceReinit flag
     // Python handles ALL change detection - frontend just obeys the flag
     useEffect(() => {
@@ -2919,13 +2830,27 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
 
         if (isFirstRender) {
           initializeCharts(true);
+          mountedConfigRef.current = deferredConfig;
         } else if (forceReinit) {
-          cleanupCharts();
-          isInitializedRef.current = false;
-          initializeCharts(true);
+          // Reconcile in place where possible, rebuild otherwise
+          const reconciled =
+            sameComponentSettings(mountedConfigRef.current, deferredConfig) &&
+            reconcileCharts(processedChartConfigs);
+          if (!reconciled) {
+            cleanupCharts();
+            isInitializedRef.current = false;
+            initializeCharts(true);
+          }
+          mountedConfigRef.current = deferredConfig;
         }
       }
-    }, [deferredConfig, initializeCharts, cleanupCharts]);
+    }, [
+      deferredConfig,
+      processedChartConfigs,
+      initializeCharts,
+      cleanupCharts,
+      reconcileCharts,
+    ]);
 
     // Cleanup on unmount
     useEffect(() => {
@@ -3057,6 +2982,20 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       });
     }, [configChange]);
 
+    // Stack charts vertically, or lay them out in equal-width grid columns
+    const layout = deferredConfig?.layout;
+    const layoutStyle = useMemo<React.CSSProperties>(
+      () =>
+        layout?.type === "grid"
+          ? {
+              display: "grid",
+              gridTemplateColumns: `repeat(${Math.max(layout.cols ?? 1, 1)}, minmax(0, 1fr))`,
+              gap: layout.gap ?? 0,
+            }
+          : { display: "flex", flexDirection: "column" },
+      [layout?.type, layout?.cols, layout?.gap],
+    );
+
     if (!config || !config.charts || config.charts.length === 0) {
       return <div>No charts configured</div>;
     }
@@ -3077,8 +3016,7 @@ const LightweightCharts: React.FC<LightweightChartsProps> = React.memo(
       >
         <div
           style={{
-            display: "flex",
-            flexDirection: "column",
+            ...layoutStyle,
             opacity: isPending ? 0.7 : 1,
             transition: "opacity 0.2s ease",
           }}
@@ -0,0 +1,121 @@
+/**
+ * @fileoverview Chart Sync Bus Test Suite
+ *
+ * Tests for group-indexed, frame-coalesced crosshair and time range sync.
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { ChartSyncBus } from '../../services/ChartSyncBus';
+
+const originalBroadcastChannel = global.BroadcastChannel;
+
+describe('ChartSyncBus', () => {
+  let bus: ChartSyncBus;
+
+  beforeEach(() => {
+    vi.useFakeTimers({ toFake: ['requestAnimationFrame', 'cancelAnimationFrame'] });
+    (global as any).BroadcastChannel = undefined;
+    (ChartSyncBus as any).instance = null;
+    bus = ChartSyncBus.getInstance();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    global.BroadcastChannel = originalBroadcastChannel;
+    (ChartSyncBus as any).instance = null;
+  });
+
+  it('should deliver only to other members of the same group', () => {
+    const source = vi.fn();
+    const peer = vi.fn();
+    const otherGroup = vi.fn();
+    bus.join({ chartId: 'a', groupId: 0, onCrosshair: source });
+    bus.join({ chartId: 'b', groupId: 0, onCrosshair: peer });
+    bus.join({ chartId: 'c', groupId: 1, onCrosshair: otherGroup });
+
+    bus.publish('crosshair', 'a', 0, { time: 10, value: 1 });
+    expect(peer).not.toHaveBeenCalled();
+
+    vi.advanceTimersToNextFrame();
+    expect(peer).toHaveBeenCalledWith({ time: 10, value: 1 });
+    expect(source).not.toHaveBeenCalled();
+    expect(otherGroup).not.toHaveBeenCalled();
+  });
+
+  it('should coalesce updates to one per frame', () => {
+    const peer = vi.fn();
+    bus.join({ chartId: 'a', groupId: 0 });
+    bus.join({ chartId: 'b', groupId: 0, onTimeRange: peer });
+
+    for (let i = 0; i < 10; i++) {
+      bus.publish('timeRange', 'a', 0, { from: i, to: i + 100 });
+    }
+    vi.advanceTimersToNextFrame();
+
+    expect(peer).toHaveBeenCalledTimes(1);
+    expect(peer).toHaveBeenCalledWith({ from: 9, to: 109 });
+  });
+
+  it('should suppress echoes of applied updates', () => {
+    const source = vi.fn();
+    const peer = vi.fn();
+    bus.join({ chartId: 'a', groupId: 0, onCrosshair: source });
+    bus.join({ chartId: 'b', groupId: 0, onCrosshair: peer });
+
+    bus.publish('crosshair', 'a', 0, { time: { year: 2024, month: 1, day: 2 }, value: 1 });
+    vi.advanceTimersToNextFrame();
+
+    // Chart b re-emits the position it was moved to
+    bus.publish('crosshair', 'b', 0, { time: { year: 2024, month: 1, day: 2 }, value: 1 });
+    vi.advanceTimersToNextFrame();
+    expect(source).not.toHaveBeenCalled();
+
+    bus.publish('crosshair', 'b', 0, { time: { year: 2024, month: 1, day: 3 }, value: 2 });
+    vi.advanceTimersToNextFrame();
+    expect(source).toHaveBeenCalledTimes(1);
+  });
+
+  it('should stop delivering after leaving', () => {
+    const peer = vi.fn();
+    bus.join({ chartId: 'a', groupId: 0 });
+    const leave = bus.join({ chartId: 'b', groupId: 0, onCrosshair: peer });
+
+    leave();
+    bus.publish('crosshair', 'a', 0, { time: 10, value: 1 });
+    vi.advanceTimersToNextFrame();
+
+    expect(peer).not.toHaveBeenCalled();
+  });
+
+  it('should broadcast local updates and apply remote ones', () => {
+    const channels: any[] = [];
+    (global as any).BroadcastChannel = vi.fn().mockImplementation(() => {
+      const channel = { postMessage: vi.fn(), onmessage: null as any };
+      channels.push(channel);
+      return channel;
+    });
+    (ChartSyncBus as any).instance = null;
+    bus = ChartSyncBus.getInstance();
+    const peer = vi.fn();
+    bus.join({ chartId: 'a', groupId: 0, onTimeRange: peer });
+
+    bus.publish('timeRange', 'a', 0, { from: 1, to: 2 });
+    vi.advanceTimersToNextFrame();
+    expect(channels[0].postMessage).toHaveBeenCalledTimes(1);
+    expect(peer).not.toHaveBeenCalled();
+
+    // The same chart id in another component is a different chart
+    channels[0].onmessage({
+      data: {
+        origin: 'other',
+        kind: 'timeRange',
+        groupId: 0,
+        chartId: 'a',
+        payload: { from: 5, to: 6 },
+      },
+    });
+    vi.advanceTimersToNextFrame();
+    expect(peer).toHaveBeenCalledWith({ from: 5, to: 6 });
+    expect(channels[0].postMessage).toHaveBeenCalledTimes(1);
+  });
+});
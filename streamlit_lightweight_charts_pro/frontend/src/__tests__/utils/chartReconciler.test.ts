@@ -0,0 +1,101 @@
+/**
+ * @fileoverview Chart Reconciler Test Suite
+ *
+ * Tests for planning in-place updates of mounted charts on forceReinit.
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  planChartReconcile,
+  samePoints,
+  sameComponentSettings,
+} from '../../utils/chartReconciler';
+
+const line = (title: string, data = [{ time: 1, value: 1 }], extra: any = {}) => ({
+  type: 'Line',
+  paneId: 0,
+  options: { title, color: 'red' },
+  data,
+  ...extra,
+});
+
+const chartConfig = (series: any[], extra: any = {}) =>
+  ({ chartId: 'chart-0', chart: { height: 400 }, series, ...extra }) as any;
+
+const seriesApis = (count: number) => Array.from({ length: count }, (_, i) => ({ id: i }) as any);
+
+describe('planChartReconcile', () => {
+  it('should keep unchanged series without updates', () => {
+    const mounted = chartConfig([line('a'), line('b')]);
+    const apis = seriesApis(2);
+
+    const plan = planChartReconcile(mounted, chartConfig([line('a'), line('b')]), apis);
+
+    expect(plan).toEqual({ remove: [], update: [], series: apis });
+  });
+
+  it('should update options and data of matched series', () => {
+    const mounted = chartConfig([line('a'), line('b')]);
+    const apis = seriesApis(2);
+    const changed = {
+      ...line('b', [{ time: 1, value: 2 }]),
+      options: { title: 'b', color: 'blue' },
+    };
+
+    const plan = planChartReconcile(mounted, chartConfig([line('a'), changed]), apis);
+
+    expect(plan?.update).toEqual([
+      { series: apis[1], config: changed, optionsChanged: true, dataChanged: true },
+    ]);
+  });
+
+  it('should add and remove undecorated series', () => {
+    const mounted = chartConfig([line('a'), line('b')]);
+    const apis = seriesApis(2);
+
+    const plan = planChartReconcile(mounted, chartConfig([line('a'), line('c')]), apis);
+
+    expect(plan?.remove).toEqual([apis[1]]);
+    expect(plan?.series).toEqual([apis[0], null]);
+  });
+
+  it('should rebuild when chart settings, panes or decorated series change', () => {
+    const mounted = chartConfig([line('a'), line('b')]);
+    const apis = seriesApis(2);
+
+    const resized = chartConfig([line('a'), line('b')], { chart: { height: 500 } });
+    expect(planChartReconcile(mounted, resized, apis)).toBeNull();
+
+    const movedPane = chartConfig([line('a'), line('b', undefined, { paneId: 1 })]);
+    expect(planChartReconcile(mounted, movedPane, apis)).toBeNull();
+
+    expect(
+      planChartReconcile(
+        mounted,
+        chartConfig([line('a'), line('c', undefined, { legend: { visible: true } })]),
+        apis
+      )
+    ).toBeNull();
+  });
+});
+
+describe('samePoints', () => {
+  it('should compare points field by field', () => {
+    expect(samePoints([{ time: 1, value: 1 }], [{ time: 1, value: 1 }])).toBe(true);
+    expect(samePoints([{ time: 1, value: 1 }], [{ time: 1, value: 2 }])).toBe(false);
+    expect(samePoints([{ time: 1, value: 1 }], [])).toBe(false);
+  });
+});
+
+describe('sameComponentSettings', () => {
+  it('should ignore charts and the reinit flag', () => {
+    const mounted = { charts: [1], syncConfig: { enabled: true } } as any;
+
+    const rerun = { charts: [2], forceReinit: true, syncConfig: { enabled: true } } as any;
+    const unsynced = { charts: [1], syncConfig: { enabled: false } } as any;
+
+    expect(sameComponentSettings(mounted, rerun)).toBe(true);
+    expect(sameComponentSettings(mounted, unsynced)).toBe(false);
+    expect(sameComponentSettings(null, mounted)).toBe(false);
+  });
+});
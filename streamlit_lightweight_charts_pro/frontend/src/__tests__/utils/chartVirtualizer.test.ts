@@ -0,0 +1,115 @@
+/**
+ * @fileoverview Chart Virtualizer Test Suite
+ *
+ * Tests for mounting charts near the viewport and disposing far-away charts.
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { ChartVirtualizer } from '../../utils/chartVirtualizer';
+
+interface MockObserver {
+  callback: IntersectionObserverCallback;
+  options?: IntersectionObserverInit;
+  observe: ReturnType<typeof vi.fn>;
+  disconnect: ReturnType<typeof vi.fn>;
+}
+
+let observers: MockObserver[];
+const originalIntersectionObserver = global.IntersectionObserver;
+
+const fire = (observer: MockObserver, target: Element, isIntersecting: boolean) =>
+  observer.callback(
+    [{ target, isIntersecting } as unknown as IntersectionObserverEntry],
+    observer as unknown as IntersectionObserver
+  );
+
+describe('ChartVirtualizer', () => {
+  beforeEach(() => {
+    vi.useFakeTimers({ toFake: ['requestAnimationFrame', 'cancelAnimationFrame'] });
+    observers = [];
+    global.IntersectionObserver = vi
+      .fn()
+      .mockImplementation(
+        (callback: IntersectionObserverCallback, options?: IntersectionObserverInit) => {
+          const observer = { callback, options, observe: vi.fn(), disconnect: vi.fn() };
+          observers.push(observer);
+          return observer;
+        }
+      ) as any;
+  });
+
+  afterEach(() => {
+    global.IntersectionObserver = originalIntersectionObserver;
+    vi.useRealTimers();
+  });
+
+  it('should use a near and a far observer with the configured margins', () => {
+    new ChartVirtualizer({ mount: vi.fn(), dispose: vi.fn(), mountMargin: '10px' });
+
+    expect(observers).toHaveLength(2);
+    expect(observers[0].options?.rootMargin).toBe('10px');
+    expect(observers[1].options?.rootMargin).toBe('1500px 0px');
+  });
+
+  it('should mount intersecting charts one per animation frame', () => {
+    const mount = vi.fn();
+    const virtualizer = new ChartVirtualizer({ mount, dispose: vi.fn() });
+    const first = document.createElement('div');
+    const second = document.createElement('div');
+    virtualizer.observe('a', first);
+    virtualizer.observe('b', second);
+
+    fire(observers[0], first, true);
+    fire(observers[0], second, true);
+    expect(mount).not.toHaveBeenCalled();
+
+    vi.advanceTimersToNextFrame();
+    expect(mount).toHaveBeenCalledTimes(1);
+    expect(mount).toHaveBeenCalledWith('a');
+
+    vi.advanceTimersToNextFrame();
+    expect(mount).toHaveBeenCalledTimes(2);
+    expect(virtualizer.isMounted('b')).toBe(true);
+  });
+
+  it('should dispose mounted charts that leave the far margin', () => {
+    const dispose = vi.fn();
+    const virtualizer = new ChartVirtualizer({ mount: vi.fn(), dispose });
+    const element = document.createElement('div');
+    virtualizer.observe('a', element);
+
+    fire(observers[0], element, true);
+    vi.advanceTimersToNextFrame();
+    fire(observers[1], element, false);
+
+    expect(dispose).toHaveBeenCalledWith('a');
+    expect(virtualizer.isMounted('a')).toBe(false);
+  });
+
+  it('should cancel a pending mount when the chart leaves before it is mounted', () => {
+    const mount = vi.fn();
+    const dispose = vi.fn();
+    const virtualizer = new ChartVirtualizer({ mount, dispose });
+    const element = document.createElement('div');
+    virtualizer.observe('a', element);
+
+    fire(observers[0], element, true);
+    fire(observers[1], element, false);
+    vi.advanceTimersToNextFrame();
+
+    expect(mount).not.toHaveBeenCalled();
+    expect(dispose).not.toHaveBeenCalled();
+  });
+
+  it('should mount everything without IntersectionObserver support', () => {
+    (global as any).IntersectionObserver = undefined;
+    const mount = vi.fn();
+    const virtualizer = new ChartVirtualizer({ mount, dispose: vi.fn() });
+    virtualizer.observe('a', document.createElement('div'));
+    virtualizer.observe('b', document.createElement('div'));
+    vi.advanceTimersToNextFrame();
+    vi.advanceTimersToNextFrame();
+
+    expect(mount).toHaveBeenCalledTimes(2);
+  });
+});
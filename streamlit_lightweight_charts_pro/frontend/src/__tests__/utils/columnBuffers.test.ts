@@ -0,0 +1,76 @@
+/**
+ * @fileoverview Column Buffer Decoding Test Suite
+ *
+ * Tests for rebuilding series data from binary float64 column buffers.
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  decodeColumnBuffers,
+  extractColumns,
+  materializePoints,
+} from '../../utils/columnBuffers';
+
+/** Pack columns like the Python encoder: consecutive little-endian float64 */
+const pack = (...columns: number[][]) => {
+  const values = new Float64Array(columns.flat());
+  const specs = [];
+  let offset = 0;
+  for (const column of columns) {
+    specs.push({ offset, length: column.length });
+    offset += column.length * 8;
+  }
+  return { buffers: new Uint8Array(values.buffer), specs };
+};
+
+describe('column buffer decoding', () => {
+  it('should extract each column into its own buffer', () => {
+    const { buffers, specs } = pack([1, 2], [3, 4, 5]);
+    const [result] = extractColumns(buffers.buffer as ArrayBuffer, [
+      { id: 0, columns: { a: specs[0], b: specs[1] } },
+    ]);
+
+    expect(Array.from(result.columns.a)).toEqual([1, 2]);
+    expect(Array.from(result.columns.b)).toEqual([3, 4, 5]);
+    expect(result.columns.a.buffer).not.toBe(result.columns.b.buffer);
+  });
+
+  it('should leave NaN fields out of the points', () => {
+    const points = materializePoints(
+      { time: new Float64Array([1, 2]), value: new Float64Array([10, NaN]) },
+      2
+    );
+
+    expect(points).toEqual([{ time: 1, value: 10 }, { time: 2 }]);
+  });
+
+  it('should rebuild series data and shared time axes without changing the input', async () => {
+    const { buffers, specs } = pack([100, 200, 300], [1, NaN, 3]);
+    const config = {
+      charts: [
+        {
+          timeAxisColumns: { t0: specs[0] },
+          series: [{ type: 'Line', timeAxis: 't0', columns: { value: specs[1] }, length: 3 }],
+        },
+      ],
+    } as any;
+
+    const decoded = await decodeColumnBuffers(config, buffers);
+
+    expect(decoded.charts[0].timeAxes).toEqual({ t0: [100, 200, 300] });
+    expect(decoded.charts[0].timeAxisColumns).toBeUndefined();
+    expect(decoded.charts[0].series[0].data).toEqual([{ value: 1 }, {}, { value: 3 }]);
+    expect(decoded.charts[0].series[0].columns).toBeUndefined();
+    expect(config.charts[0].timeAxisColumns).toEqual({ t0: specs[0] });
+    expect(config.charts[0].series[0].columns).toEqual({ value: specs[1] });
+
+    // Decoding twice (React StrictMode effects) gives the same result
+    expect(await decodeColumnBuffers(config, buffers)).toEqual(decoded);
+  });
+
+  it('should return configs without buffers unchanged', async () => {
+    const config = { charts: [{ series: [{ type: 'Line', data: [] }] }] } as any;
+
+    expect(await decodeColumnBuffers(config, undefined)).toBe(config);
+  });
+});
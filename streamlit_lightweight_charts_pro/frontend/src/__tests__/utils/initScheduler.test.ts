@@ -0,0 +1,84 @@
+/**
+ * @fileoverview Initialization Scheduler Test Suite
+ *
+ * Tests for prioritized, time-sliced chart initialization tasks.
+ */
+
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { InitScheduler } from '../../utils/initScheduler';
+
+const flush = () => new Promise(resolve => setTimeout(resolve, 20));
+
+describe('InitScheduler', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it('should run tasks asynchronously in priority order', async () => {
+    const scheduler = new InitScheduler();
+    const order: string[] = [];
+
+    const done = Promise.all([
+      scheduler.schedule(() => order.push('decoration'), 'background'),
+      scheduler.schedule(() => order.push('indicator'), 'user-visible'),
+      scheduler.schedule(() => order.push('price'), 'user-blocking'),
+    ]);
+    expect(order).toEqual([]);
+
+    await done;
+    expect(order).toEqual(['price', 'indicator', 'decoration']);
+  });
+
+  it('should keep submission order within one priority', async () => {
+    const scheduler = new InitScheduler();
+    const order: number[] = [];
+
+    await Promise.all([1, 2, 3].map(n => scheduler.schedule(() => order.push(n))));
+
+    expect(order).toEqual([1, 2, 3]);
+  });
+
+  it('should yield between slices once the time budget is used', async () => {
+    let now = 0;
+    vi.spyOn(performance, 'now').mockImplementation(() => now);
+    const scheduler = new InitScheduler(8);
+    const slow = () => {
+      now += 10;
+    };
+
+    const first = scheduler.schedule(slow);
+    scheduler.schedule(slow);
+    await first;
+
+    // The second task runs in a later slice
+    expect(scheduler.pending).toBe(1);
+    await flush();
+    expect(scheduler.pending).toBe(0);
+  });
+
+  it('should reject the promise of a failing task and continue', async () => {
+    const scheduler = new InitScheduler();
+    const after = vi.fn();
+
+    const failing = scheduler.schedule(() => {
+      throw new Error('boom');
+    });
+    const next = scheduler.schedule(after);
+
+    await expect(failing).rejects.toThrow('boom');
+    await next;
+    expect(after).toHaveBeenCalled();
+  });
+
+  it('should drop queued tasks on cancel', async () => {
+    const scheduler = new InitScheduler();
+    const task = vi.fn();
+
+    void scheduler.schedule(task);
+    scheduler.cancel();
+    await flush();
+
+    expect(task).not.toHaveBeenCalled();
+    expect(scheduler.pending).toBe(0);
+  });
+});
@@ -0,0 +1,53 @@
+/**
+ * @fileoverview Interval Index Test Suite
+ *
+ * Tests for querying spans overlapping a range.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { IntervalIndex } from '../../utils/intervalIndex';
+
+const build = (spans: Array<[number, number]>) => {
+  const index = new IntervalIndex();
+  index.build(
+    spans.length,
+    i => spans[i][0],
+    i => spans[i][1]
+  );
+  return index;
+};
+
+describe('IntervalIndex', () => {
+  it('should return overlapping spans in ascending position order', () => {
+    const index = build([
+      [50, 60],
+      [0, 10],
+      [5, 100],
+      [20, 30],
+    ]);
+
+    expect(index.query(8, 25)).toEqual([1, 2, 3]);
+    expect(index.query(101, 200)).toEqual([]);
+    expect(index.query(60, 60)).toEqual([0, 2]);
+  });
+
+  it('should accept reversed spans', () => {
+    const index = build([[30, 10]]);
+
+    expect(index.query(15, 20)).toEqual([0]);
+  });
+
+  it('should match a linear scan over many spans', () => {
+    const spans: Array<[number, number]> = Array.from({ length: 1000 }, (_, i) => [
+      i * 10,
+      i * 10 + (i % 7) * 25,
+    ]);
+    const index = build(spans);
+
+    const expected = spans
+      .map((span, i) => (span[1] >= 2000 && span[0] <= 2600 ? i : -1))
+      .filter(i => i >= 0);
+    expect(index.query(2000, 2600)).toEqual(expected);
+    expect(index.size).toBe(1000);
+  });
+});
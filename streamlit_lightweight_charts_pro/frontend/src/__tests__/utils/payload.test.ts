@@ -0,0 +1,103 @@
+/**
+ * @fileoverview Payload Decoding Test Suite
+ *
+ * Tests for restoring compact payload encodings sent by the Python renderer.
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  decodePayload,
+  expandColorPalettes,
+  rehydrateTimeAxes,
+} from '../../utils/payload';
+
+const sharedAxisChart = () =>
+  ({
+    chart: {},
+    timeAxes: { t0: [100, 200, 300] },
+    series: [
+      { type: 'Candlestick', timeAxis: 't0', data: [{ open: 1 }, { open: 2 }, { open: 3 }] },
+      { type: 'Line', timeAxis: 't0', data: [{ value: 1 }, {}, { value: 3 }] },
+      { type: 'Line', data: [{ time: 50, value: 9 }] },
+    ],
+  }) as any;
+
+describe('payload decoding', () => {
+  describe('rehydrateTimeAxes', () => {
+    it('should restore time on every point of series referencing an axis', () => {
+      const chart = sharedAxisChart();
+      rehydrateTimeAxes(chart);
+
+      expect(chart.series[0].data).toEqual([
+        { open: 1, time: 100 },
+        { open: 2, time: 200 },
+        { open: 3, time: 300 },
+      ]);
+      // Whitespace points become time-only points
+      expect(chart.series[1].data[1]).toEqual({ time: 200 });
+    });
+
+    it('should leave series without an axis untouched', () => {
+      const chart = sharedAxisChart();
+      rehydrateTimeAxes(chart);
+
+      expect(chart.series[2].data).toEqual([{ time: 50, value: 9 }]);
+    });
+
+    it('should remove the encoding markers so decoding is idempotent', () => {
+      const chart = sharedAxisChart();
+      rehydrateTimeAxes(chart);
+      rehydrateTimeAxes(chart);
+
+      expect(chart.timeAxes).toBeUndefined();
+      expect(chart.series[0].timeAxis).toBeUndefined();
+      expect(chart.series[0].data[2].time).toBe(300);
+    });
+  });
+
+  describe('expandColorPalettes', () => {
+    it('should expand per-point palette indices and skip -1', () => {
+      const series = {
+        data: [{ value: 1 }, { value: 2 }, { value: 3 }],
+        colorPalettes: { color: { colors: ['#26a69a', '#ef5350'], index: [1, -1, 0] } },
+      } as any;
+      expandColorPalettes(series);
+
+      expect(series.data).toEqual([
+        { value: 1, color: '#ef5350' },
+        { value: 2 },
+        { value: 3, color: '#26a69a' },
+      ]);
+      expect(series.colorPalettes).toBeUndefined();
+    });
+
+    it('should expand run-length segments up to the end of the data', () => {
+      const series = {
+        data: [{}, {}, {}, {}, {}],
+        colorPalettes: { fill: { colors: ['red', 'blue'], runs: [[0, 0], [2, -1], [3, 1]] } },
+      } as any;
+      expandColorPalettes(series);
+
+      expect(series.data.map((point: any) => point.fill)).toEqual([
+        'red',
+        'red',
+        undefined,
+        'blue',
+        'blue',
+      ]);
+    });
+  });
+
+  describe('decodePayload', () => {
+    it('should decode every chart and return the same object', () => {
+      const config = { charts: [sharedAxisChart(), sharedAxisChart()] } as any;
+
+      expect(decodePayload(config)).toBe(config);
+      expect(config.charts[1].series[1].data[0]).toEqual({ value: 1, time: 100 });
+    });
+
+    it('should accept a missing config', () => {
+      expect(decodePayload(undefined)).toBeUndefined();
+    });
+  });
+});
@@ -0,0 +1,81 @@
+/**
+ * @fileoverview Shared Resize Observer Test Suite
+ *
+ * Tests for dispatching one ResizeObserver to per-element callbacks.
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { SharedResizeObserver } from '../../utils/sharedResizeObserver';
+
+let instances: Array<{
+  callback: ResizeObserverCallback;
+  observe: ReturnType<typeof vi.fn>;
+  unobserve: ReturnType<typeof vi.fn>;
+  disconnect: ReturnType<typeof vi.fn>;
+}>;
+const originalResizeObserver = global.ResizeObserver;
+
+describe('SharedResizeObserver', () => {
+  beforeEach(() => {
+    instances = [];
+    global.ResizeObserver = vi.fn().mockImplementation((callback: ResizeObserverCallback) => {
+      const instance = { callback, observe: vi.fn(), unobserve: vi.fn(), disconnect: vi.fn() };
+      instances.push(instance);
+      return instance;
+    }) as any;
+  });
+
+  afterEach(() => {
+    global.ResizeObserver = originalResizeObserver;
+  });
+
+  it('should create a single observer for many elements', () => {
+    const shared = new SharedResizeObserver();
+    const elements = [1, 2, 3].map(() => document.createElement('div'));
+    elements.forEach(element => shared.observe(element, vi.fn()));
+
+    expect(instances).toHaveLength(1);
+    expect(instances[0].observe).toHaveBeenCalledTimes(3);
+    expect(shared.size).toBe(3);
+  });
+
+  it('should dispatch each entry to the callback of its element', () => {
+    const shared = new SharedResizeObserver();
+    const first = document.createElement('div');
+    const second = document.createElement('div');
+    const onFirst = vi.fn();
+    const onSecond = vi.fn();
+    shared.observe(first, onFirst);
+    shared.observe(second, onSecond);
+
+    const entry = { target: second } as unknown as ResizeObserverEntry;
+    instances[0].callback([entry], instances[0] as any);
+
+    expect(onFirst).not.toHaveBeenCalled();
+    expect(onSecond).toHaveBeenCalledWith(entry);
+  });
+
+  it('should stop dispatching after unobserve and disconnect', () => {
+    const shared = new SharedResizeObserver();
+    const element = document.createElement('div');
+    const callback = vi.fn();
+    shared.observe(element, callback);
+    shared.unobserve(element);
+
+    instances[0].callback([{ target: element } as any], instances[0] as any);
+    expect(callback).not.toHaveBeenCalled();
+    expect(instances[0].unobserve).toHaveBeenCalledWith(element);
+
+    shared.disconnect();
+    expect(instances[0].disconnect).toHaveBeenCalled();
+    expect(shared.size).toBe(0);
+  });
+
+  it('should do nothing without ResizeObserver support', () => {
+    (global as any).ResizeObserver = undefined;
+    const shared = new SharedResizeObserver();
+
+    expect(() => shared.observe(document.createElement('div'), vi.fn())).not.toThrow();
+    expect(shared.size).toBe(0);
+  });
+});
@@ -0,0 +1,57 @@
+/**
+ * Decoded component configuration hook
+ *
+ * Restores the compact payload encodings of the Python renderer. Plain JSON
+ * configurations are decoded synchronously; configurations with binary
+ * column buffers are decoded off the main thread and returned once ready.
+ */
+
+import { useEffect, useMemo, useState } from 'react';
+import { logger } from '@nandkapadia/lightweight-charts-pro-core';
+import { ComponentConfig } from '../types';
+import { decodePayload } from '../utils/payload';
+import { decodeColumnBuffers } from '../utils/columnBuffers';
+
+/**
+ * Return the decoded configuration for the current render.
+ *
+ * @param config - Configuration received from Streamlit
+ * @param buffers - Optional binary column buffers received from Streamlit
+ * @returns The decoded configuration, or undefined while the first
+ *   buffer-backed configuration is still being decoded
+ */
+export function useDecodedConfig(
+  config: ComponentConfig | undefined,
+  buffers: Uint8Array | undefined
+): ComponentConfig | undefined {
+  const hasBuffers = buffers instanceof Uint8Array && buffers.byteLength > 0;
+
+  // Restore shared time axes before any chart reads the series data
+  const decoded = useMemo(
+    () => (hasBuffers ? undefined : decodePayload(config)),
+    [config, hasBuffers]
+  );
+
+  const [bufferDecoded, setBufferDecoded] = useState<ComponentConfig | undefined>();
+
+  useEffect(() => {
+    if (!hasBuffers) {
+      return undefined;
+    }
+    let cancelled = false;
+    decodeColumnBuffers(config, buffers)
+      .then(result => {
+        if (!cancelled) {
+          setBufferDecoded(decodePayload(result));
+        }
+      })
+      .catch(error => {
+        logger.error('Failed to decode column buffers', 'StreamlitComponent', error);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [config, buffers, hasBuffers]);
+
+  return hasBuffers ? bufferDecoded : decoded;
+}
@@ -26,6 +26,7 @@ import { Streamlit } from "streamlit-component-lib";
 // Local Imports
 import LightweightCharts from "./LightweightCharts";
 import { ComponentConfig } from "./types";
+import { useDecodedConfig } from "./hooks/useDecodedConfig";
 import { ResizeObserverManager } from "@nandkapadia/lightweight-charts-pro-core";
 import {
   useStreamlitRenderData,
@@ -391,12 +392,17 @@ const App: React.FC = () => {
     }
   }, [renderData, debouncedReportHeight]);
 
-  if (!renderData) {
+  // Restore compact encodings (shared time axes, palettes, column buffers)
+  const config = useDecodedConfig(
+    renderData?.args?.config as ComponentConfig | undefined,
+    renderData?.args?.buffers as Uint8Array | undefined,
+  );
+
+  // Buffer-backed configs are decoded asynchronously on the first render
+  if (!renderData || (!config && renderData.args?.buffers)) {
     return <div>Loading...</div>;
   }
 
-  const config = renderData.args?.config as ComponentConfig;
-
   // Extract height and width from JSON config instead of separate parameters
   const height =
     (renderData.args?.height as number) ||
@@ -410,7 +416,7 @@ const App: React.FC = () => {
   return (
     <div ref={containerRef} style={{ width: "100%", minHeight: height }}>
       <LightweightCharts
-        config={config}
+        config={config as ComponentConfig}
         height={height}
         width={width}
         onChartsReady={handleChartsReady}
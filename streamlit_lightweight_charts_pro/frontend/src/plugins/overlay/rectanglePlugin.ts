@@ -15,7 +15,10 @@
  * - Fill and border styling
  * - Label support with background
  * - Automatic cleanup and memory management
- * - Performance optimized with debounced rendering
+ * - Only rectangles inside the canvas are drawn (interval index over x spans)
+ * - Consecutive non-overlapping rectangles sharing a style are drawn as one
+ *   path per canvas call
+ * - Redraws are coalesced to one per animation frame
  *
  * @example
  * ```typescript
@@ -44,6 +47,10 @@ import {
   UniversalSpacing,
   logger,
 } from "@nandkapadia/lightweight-charts-pro-core";
+import { IntervalIndex } from "../../utils/intervalIndex";
+
+/** Largest number of cached label widths */
+const LABEL_WIDTH_CACHE_SIZE = 512;
 
 /**
  * Configuration for a rectangle overlay.
@@ -76,8 +83,11 @@ export class RectangleOverlayPlugin {
   private isDisposed: boolean = false;
   private isInitialized: boolean = false;
   private resizeObserverManager: ResizeObserverManager;
-  private redrawTimeout: NodeJS.Timeout | null = null;
+  private redrawFrame: number | null = null;
   private lastCanvasSize = { width: 0, height: 0 };
+  private index = new IntervalIndex();
+  // Label text widths by font and text, cleared beyond LABEL_WIDTH_CACHE_SIZE
+  private labelWidths = new Map<string, number>();
 
   constructor() {
     this.resizeObserverManager = new ResizeObserverManager();
@@ -105,34 +115,21 @@ export class RectangleOverlayPlugin {
 
   public setRectangles(rectangles: RectangleConfig[]): void {
     this.rectangles = rectangles;
+    this.rebuildIndex();
     if (this.isInitialized) {
-      this.render();
+      this.redraw();
     } else {
       // Store rectangles and they will be rendered once the plugin is initialized
     }
   }
 
-  private render(): void {
-    if (!this.canvas || !this.ctx) {
-      return;
-    }
-
-    // Clear canvas
-    this.ctx.clearRect(0, 0, this.canvas.width, this.canvas.height);
-
-    // Draw rectangles
-    const ctx = this.ctx; // We already checked ctx exists above
-    this.rectangles.forEach((rect, _index) => {
-      ctx.fillStyle = rect.color || "#000000";
-
-      // Ensure proper rectangle dimensions (handle inverted Y coordinates)
-      const x = Math.min(rect.x1, rect.x2);
-      const y = Math.min(rect.y1, rect.y2);
-      const width = Math.abs(rect.x2 - rect.x1);
-      const height = Math.abs(rect.y2 - rect.y1);
-
-      ctx.fillRect(x, y, width, height);
-    });
+  private rebuildIndex(): void {
+    const rectangles = this.rectangles;
+    this.index.build(
+      rectangles.length,
+      (i) => rectangles[i].x1,
+      (i) => rectangles[i].x2,
+    );
   }
 
   private async init() {
@@ -167,7 +164,7 @@ export class RectangleOverlayPlugin {
 
       // Render any rectangles that were set before initialization
       if (this.rectangles.length > 0) {
-        this.render();
+        this.redraw();
       }
     } catch (error) {
       logger.error(
@@ -244,16 +241,11 @@ export class RectangleOverlayPlugin {
     if (!this.chart) return;
 
     try {
-      // Listen for chart updates (time scale changes, panning, zooming) with throttling
-      let lastRedrawSchedule = 0;
-      const redrawThrottleDelay = 16; // ~60fps max
+      // Listen for chart updates (time scale changes, panning, zooming);
+      // redraws are coalesced per animation frame
       this.chart.timeScale().subscribeVisibleTimeRangeChange(() => {
         if (!this.isDisposed) {
-          const now = Date.now();
-          if (now - lastRedrawSchedule >= redrawThrottleDelay) {
-            lastRedrawSchedule = now;
-            this.scheduleRedraw();
-          }
+          this.scheduleRedraw();
         }
       });
 
@@ -387,98 +379,146 @@ export class RectangleOverlayPlugin {
   }
 
   private scheduleRedraw() {
-    if (this.redrawTimeout) {
-      clearTimeout(this.redrawTimeout);
+    if (this.redrawFrame !== null) {
+      return;
     }
 
-    this.redrawTimeout = setTimeout(() => {
+    const run = () => {
+      this.redrawFrame = null;
       if (!this.isDisposed) {
         this.redraw();
       }
-    }, 16); // ~60fps
+    };
+    this.redrawFrame =
+      typeof requestAnimationFrame === "function"
+        ? requestAnimationFrame(run)
+        : (setTimeout(run, 16) as unknown as number);
   }
 
   private redraw() {
     if (!this.ctx || !this.canvas || this.isDisposed) return;
 
+    const ctx = this.ctx;
+    const { width, height } = this.canvas;
+
     try {
       // Clear canvas
-      this.ctx.clearRect(0, 0, this.canvas.width, this.canvas.height);
-
-      // Draw all rectangles
-      this.rectangles.forEach((rect) => {
-        this.drawRectangle(rect);
-      });
-    } catch (error) {
-      logger.error(
-        "Rectangle overlay operation failed",
-        "RectangleOverlayPlugin",
-        error,
-      );
-    }
-  }
+      ctx.clearRect(0, 0, width, height);
+
+      // Rectangles overlapping the canvas, in z-order then insertion order
+      const visible: Array<{
+        rect: RectangleConfig;
+        x: number;
+        y: number;
+        w: number;
+        h: number;
+      }> = [];
+      for (const i of this.index.query(0, width)) {
+        const rect = this.rectangles[i];
+        const coords = this.calculateActualCoordinates(
+          rect.x1,
+          rect.y1,
+          rect.x2,
+          rect.y2,
+        );
+        if (!coords) continue;
 
-  private drawRectangle(rect: RectangleConfig) {
-    if (!this.ctx || !this.canvas) return;
+        // Ensure proper rectangle dimensions (handle inverted Y coordinates)
+        const y = Math.min(coords.ay1, coords.ay2);
+        const h = Math.abs(coords.ay2 - coords.ay1);
+        if (y > height || y + h < 0) continue;
 
-    try {
-      const {
-        x1,
-        y1,
-        x2,
-        y2,
-        color,
-        borderColor,
-        borderWidth,
-        fillOpacity,
-        borderOpacity,
-      } = rect;
-
-      // Calculate actual coordinates based on chart scale
-      const actualCoords = this.calculateActualCoordinates(x1, y1, x2, y2);
-      if (!actualCoords) return;
-
-      const { ax1, ay1, ax2, ay2 } = actualCoords;
-
-      // Ensure proper rectangle dimensions (handle inverted Y coordinates)
-      const rectX = Math.min(ax1, ax2);
-      const rectY = Math.min(ay1, ay2);
-      const rectWidth = Math.abs(ax2 - ax1);
-      const rectHeight = Math.abs(ay2 - ay1);
-
-      // Set fill style
-      this.ctx.fillStyle = color;
-      if (fillOpacity !== undefined) {
-        this.ctx.globalAlpha = fillOpacity;
+        visible.push({
+          rect,
+          x: Math.min(coords.ax1, coords.ax2),
+          y,
+          w: Math.abs(coords.ax2 - coords.ax1),
+          h,
+        });
       }
+      visible.sort((a, b) => (a.rect.zIndex ?? 0) - (b.rect.zIndex ?? 0));
+
+      // Consecutive rectangles of one style that do not overlap (borders
+      // included) are drawn as one fill path and one border path. A run ends
+      // at a style change, an overlap or a label, so the result is the same
+      // as drawing each rectangle, its border and its label in turn.
+      type Item = (typeof visible)[number];
+      let run: Item[] = [];
+      let runStyle = "";
+      const runBox = { left: 0, top: 0, right: 0, bottom: 0 };
+      const flush = () => {
+        if (run.length === 0) return;
+        const { rect } = run[0];
+        ctx.fillStyle = rect.color;
+        ctx.globalAlpha = rect.fillOpacity ?? 1;
+        ctx.beginPath();
+        for (const { x, y, w, h } of run) {
+          ctx.rect(x, y, w, h);
+        }
+        ctx.fill();
+        ctx.globalAlpha = 1.0;
+
+        if (rect.borderColor && rect.borderWidth) {
+          ctx.strokeStyle = rect.borderColor;
+          ctx.lineWidth = rect.borderWidth;
+          ctx.globalAlpha = rect.borderOpacity ?? 1;
+          ctx.beginPath();
+          for (const { x, y, w, h } of run) {
+            ctx.rect(x, y, w, h);
+          }
+          ctx.stroke();
+          ctx.globalAlpha = 1.0;
+        }
 
-      // Draw filled rectangle
-      this.ctx.fillRect(rectX, rectY, rectWidth, rectHeight);
-
-      // Reset alpha for border
-      this.ctx.globalAlpha = 1.0;
-
-      // Draw border if specified
-      if (borderColor && borderWidth) {
-        this.ctx.strokeStyle = borderColor;
-        this.ctx.lineWidth = borderWidth;
-        if (borderOpacity !== undefined) {
-          this.ctx.globalAlpha = borderOpacity;
+        const last = run[run.length - 1];
+        if (last.rect.label) {
+          this.drawLabel(last.rect, last.x, last.y, last.x + last.w, last.y + last.h);
         }
-        this.ctx.strokeRect(rectX, rectY, rectWidth, rectHeight);
-        this.ctx.globalAlpha = 1.0;
-      }
+        run = [];
+      };
 
-      // Draw label if specified
-      if (rect.label) {
-        this.drawLabel(
-          rect,
-          rectX,
-          rectY,
-          rectX + rectWidth,
-          rectY + rectHeight,
-        );
+      for (const item of visible) {
+        const { rect, x, y, w, h } = item;
+        const hasBorder = Boolean(rect.borderColor && rect.borderWidth);
+        const fillStyle = `${rect.color}|${rect.fillOpacity ?? 1}`;
+        const style = hasBorder
+          ? `${fillStyle}|${rect.borderColor}|${rect.borderWidth}|${rect.borderOpacity ?? 1}`
+          : fillStyle;
+        // Borders are centred on the edges
+        const halfBorder = hasBorder ? (rect.borderWidth as number) / 2 : 0;
+        const left = x - halfBorder;
+        const top = y - halfBorder;
+        const right = x + w + halfBorder;
+        const bottom = y + h + halfBorder;
+
+        if (
+          run.length > 0 &&
+          (style !== runStyle ||
+            (left <= runBox.right &&
+              right >= runBox.left &&
+              top <= runBox.bottom &&
+              bottom >= runBox.top))
+        ) {
+          flush();
+        }
+        if (run.length === 0) {
+          runStyle = style;
+          runBox.left = left;
+          runBox.top = top;
+          runBox.right = right;
+          runBox.bottom = bottom;
+        } else {
+          runBox.left = Math.min(runBox.left, left);
+          runBox.top = Math.min(runBox.top, top);
+          runBox.right = Math.max(runBox.right, right);
+          runBox.bottom = Math.max(runBox.bottom, bottom);
+        }
+        run.push(item);
+        if (rect.label) {
+          flush();
+        }
       }
+      flush();
     } catch (error) {
       logger.error(
         "Rectangle overlay operation failed",
@@ -541,9 +581,8 @@ export class RectangleOverlayPlugin {
 
       // Draw label background if specified
       if (rect.labelBackground) {
-        const textMetrics = this.ctx.measureText(rect.label);
         const padding = rect.labelPadding || UniversalSpacing.DEFAULT_PADDING;
-        const bgWidth = textMetrics.width + padding * 2;
+        const bgWidth = this.measureLabel(rect.label) + padding * 2;
         const bgHeight = (rect.labelFontSize || 12) + padding * 2;
 
         this.ctx.fillStyle = rect.labelBackground;
@@ -569,6 +608,24 @@ export class RectangleOverlayPlugin {
     }
   }
 
+  /**
+   * Width of a label in the current font, measured once per font and text
+   */
+  private measureLabel(label: string): number {
+    if (!this.ctx) return 0;
+
+    const key = `${this.ctx.font}|${label}`;
+    let width = this.labelWidths.get(key);
+    if (width === undefined) {
+      width = this.ctx.measureText(label).width;
+      if (this.labelWidths.size >= LABEL_WIDTH_CACHE_SIZE) {
+        this.labelWidths.clear();
+      }
+      this.labelWidths.set(key, width);
+    }
+    return width;
+  }
+
   /**
    * Update canvas Z-index based on the highest Z-index of all rectangles
    * Default Z-index is 20 if no rectangles have Z-index specified
@@ -596,6 +653,7 @@ export class RectangleOverlayPlugin {
 
   addRectangle(rect: RectangleConfig) {
     this.rectangles.push(rect);
+    this.rebuildIndex();
     this.updateCanvasZIndex();
     this.scheduleRedraw();
   }
@@ -604,6 +662,7 @@ export class RectangleOverlayPlugin {
     const index = this.rectangles.findIndex((r) => r.id === id);
     if (index !== -1) {
       this.rectangles.splice(index, 1);
+      this.rebuildIndex();
       this.updateCanvasZIndex();
       this.scheduleRedraw();
     }
@@ -613,6 +672,7 @@ export class RectangleOverlayPlugin {
     const rect = this.rectangles.find((r) => r.id === id);
     if (rect) {
       Object.assign(rect, updates);
+      this.rebuildIndex();
       this.updateCanvasZIndex();
       this.scheduleRedraw();
     }
@@ -620,6 +680,7 @@ export class RectangleOverlayPlugin {
 
   clearRectangles() {
     this.rectangles = [];
+    this.rebuildIndex();
     this.updateCanvasZIndex();
     this.scheduleRedraw();
   }
@@ -634,10 +695,14 @@ export class RectangleOverlayPlugin {
     // Cleanup resize observers
     this.resizeObserverManager.cleanup();
 
-    // Clear timeout
-    if (this.redrawTimeout) {
-      clearTimeout(this.redrawTimeout);
-      this.redrawTimeout = null;
+    // Cancel pending redraw
+    if (this.redrawFrame !== null) {
+      if (typeof cancelAnimationFrame === "function") {
+        cancelAnimationFrame(this.redrawFrame);
+      } else {
+        clearTimeout(this.redrawFrame);
+      }
+      this.redrawFrame = null;
     }
 
     // Remove canvas
@@ -651,5 +716,7 @@ export class RectangleOverlayPlugin {
     this.canvas = null;
     this.ctx = null;
     this.rectangles = [];
+    this.rebuildIndex();
+    this.labelWidths.clear();
   }
 }
@@ -27,7 +27,10 @@ import {
   UnifiedSeriesDescriptor,
   extractDefaultOptions,
 } from "./core/UnifiedSeriesDescriptor";
-import { BUILTIN_SERIES_DESCRIPTORS } from "./descriptors/builtinSeriesDescriptors";
+import {
+  BUILTIN_SERIES_DESCRIPTORS,
+  sortDataByTime,
+} from "./descriptors/builtinSeriesDescriptors";
 import { CUSTOM_SERIES_DESCRIPTORS } from "./descriptors/customSeriesDescriptors";
 import { cleanLineStyleOptions } from "@nandkapadia/lightweight-charts-pro-core";
 import { logger } from "@nandkapadia/lightweight-charts-pro-core";
@@ -295,6 +298,41 @@ function flattenLineOptions(
   return flattened;
 }
 
+/**
+ * Merge user options with descriptor defaults, as passed to the series
+ *
+ * @param descriptor - Series descriptor
+ * @param mappedType - Normalized series type
+ * @param userOptions - User-provided options
+ * @returns API options with `_seriesType` metadata
+ */
+function resolveSeriesOptions(
+  descriptor: UnifiedSeriesDescriptor,
+  mappedType: string,
+  userOptions: Record<string, unknown> | Partial<SeriesOptionsCommon>,
+): Record<string, unknown> {
+  // Extract default options from descriptor
+  const defaultOptions = extractDefaultOptions(descriptor);
+
+  // Flatten nested line objects from Python (if any)
+  const flattenedUserOptions = flattenLineOptions(
+    userOptions as Record<string, unknown>,
+    descriptor,
+  );
+
+  // Extract custom properties that are NOT part of the official Lightweight Charts API
+  // These properties are used for UI/metadata purposes only
+  const { displayName, ...apiOptions } = flattenedUserOptions as any;
+
+  // Merge user options with defaults and add _seriesType metadata
+  return {
+    ...defaultOptions,
+    ...apiOptions, // Use apiOptions (with custom properties filtered out)
+    // Add _seriesType property so we can identify series type later via series.options()
+    _seriesType: mappedType,
+  };
+}
+
 /**
  * Create a series using the unified descriptor system
  *
@@ -338,23 +376,7 @@ export function createSeries(
       );
     }
 
-    // Extract default options from descriptor
-    const defaultOptions = extractDefaultOptions(descriptor);
-
-    // Flatten nested line objects from Python (if any)
-    const flattenedUserOptions = flattenLineOptions(userOptions, descriptor);
-
-    // Extract custom properties that are NOT part of the official Lightweight Charts API
-    // These properties are used for UI/metadata purposes only
-    const { displayName, ...apiOptions } = flattenedUserOptions as any;
-
-    // Merge user options with defaults and add _seriesType metadata
-    const options = {
-      ...defaultOptions,
-      ...apiOptions, // Use apiOptions (with custom properties filtered out)
-      // Add _seriesType property so we can identify series type later via series.options()
-      _seriesType: mappedType,
-    };
+    const options = resolveSeriesOptions(descriptor, mappedType, userOptions);
 
     // Create series using descriptor's creator function
     return descriptor.create(chart, data, options, paneId);
@@ -807,6 +829,41 @@ export function updateSeriesOptions(
   }
 }
 
+/**
+ * Reconfigure a built-in series in place, as if it had been created with the
+ * given options and data
+ *
+ * Custom series render through primitives created with the series and are
+ * not reconfigured; callers recreate them instead.
+ *
+ * @param series - Series created by createSeries
+ * @param seriesType - Series type
+ * @param options - New user options, or undefined to keep the current ones
+ * @param data - New data, or undefined to keep the current data
+ * @returns Whether the series could be reconfigured in place
+ */
+export function reconfigureSeries(
+  series: ISeriesApi<any>,
+  seriesType: string,
+  options?: Record<string, unknown> | SeriesOptionsCommon,
+  data?: unknown[],
+): boolean {
+  const mappedType = normalizeSeriesType(seriesType);
+  const descriptor = SERIES_REGISTRY.get(mappedType);
+  if (!descriptor || descriptor.isCustom) {
+    return false;
+  }
+  if (options) {
+    series.applyOptions(
+      resolveSeriesOptions(descriptor, mappedType, options as Record<string, unknown>),
+    );
+  }
+  if (data) {
+    series.setData(sortDataByTime(data) as never[]);
+  }
+  return true;
+}
+
 /**
  * Legacy compatibility layer for existing code
  * This allows gradual migration from old factory to new factory
@@ -821,6 +878,7 @@ export const SeriesFactory = {
   updateSeriesData,
   updateSeriesMarkers,
   updateSeriesOptions,
+  reconfigureSeries,
 };
 
 export default SeriesFactory;
@@ -42,7 +42,7 @@ import {
  * @param data - Array of data points with time property
  * @returns Sorted, deduplicated, and validated array of data points
  */
-function sortDataByTime(data: any[]): any[] {
+export function sortDataByTime(data: any[]): any[] {
   // Helper to validate and parse time
   const parseTime = (item: any): number | null => {
     if (typeof item.time === 'number') {
@@ -0,0 +1,217 @@
+/**
+ * @fileoverview Chart synchronization bus.
+ *
+ * Carries crosshair and visible-range updates between charts of the same
+ * sync group:
+ * - Within one document, members are called directly through a group index
+ *   (groupId → members), so a move only touches charts of its own group.
+ * - Across documents (other Streamlit component iframes of the same origin),
+ *   updates are posted on a BroadcastChannel.
+ *
+ * Updates are coalesced: however many events a chart emits within one
+ * animation frame, each group receives only the latest update of each kind,
+ * once per frame.
+ *
+ * Echoes are suppressed by value: a member remembers the last update applied
+ * to it, and charts skip publishing an event that merely reflects it.
+ */
+
+import { logger } from "@nandkapadia/lightweight-charts-pro-core";
+
+export type SyncKind = "crosshair" | "timeRange";
+
+/** Crosshair position shared between charts (time null clears it) */
+export interface CrosshairSync {
+  time: unknown;
+  value: number | null;
+}
+
+/** Visible logical range shared between charts */
+export interface TimeRangeSync {
+  from: number;
+  to: number;
+}
+
+export type SyncPayload = CrosshairSync | TimeRangeSync;
+
+/** A chart taking part in synchronization */
+export interface SyncMember {
+  chartId: string;
+  groupId: number;
+  onCrosshair?: (payload: CrosshairSync) => void;
+  onTimeRange?: (payload: TimeRangeSync) => void;
+}
+
+interface SyncMessage {
+  origin: string;
+  kind: SyncKind;
+  groupId: number;
+  chartId: string;
+  payload: SyncPayload;
+}
+
+const CHANNEL_NAME = "lightweight-charts-pro-sync";
+
+/** Compare times by value; business days arrive as fresh objects. */
+function sameTime(a: unknown, b: unknown): boolean {
+  if (a === b) {
+    return true;
+  }
+  return typeof a === "object" && typeof b === "object" && JSON.stringify(a) === JSON.stringify(b);
+}
+
+/**
+ * Process-wide bus shared by all chart components of a document.
+ */
+export class ChartSyncBus {
+  private static instance: ChartSyncBus | null = null;
+
+  /** Return the shared bus of this document. */
+  static getInstance(): ChartSyncBus {
+    if (!ChartSyncBus.instance) {
+      ChartSyncBus.instance = new ChartSyncBus();
+    }
+    return ChartSyncBus.instance;
+  }
+
+  private readonly origin = `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+
+  private readonly groups = new Map<number, Map<string, SyncMember>>();
+
+  private readonly lastApplied = new Map<string, SyncPayload>();
+
+  // Latest pending update per "kind:groupId"
+  private readonly pending = new Map<string, SyncMessage>();
+
+  private frame: number | null = null;
+
+  private channel: BroadcastChannel | null = null;
+
+  private constructor() {
+    if (typeof BroadcastChannel !== "undefined") {
+      try {
+        this.channel = new BroadcastChannel(CHANNEL_NAME);
+        this.channel.onmessage = (event: MessageEvent<SyncMessage>) => {
+          if (event.data && event.data.origin !== this.origin) {
+            this.enqueue(event.data);
+          }
+        };
+      } catch (error) {
+        logger.warn("BroadcastChannel unavailable for chart sync", "ChartSync", error);
+      }
+    }
+  }
+
+  /**
+   * Register a chart in its sync group.
+   *
+   * @param member - Chart and its update handlers
+   * @returns Function removing the chart from the bus
+   */
+  join(member: SyncMember): () => void {
+    let group = this.groups.get(member.groupId);
+    if (!group) {
+      group = new Map();
+      this.groups.set(member.groupId, group);
+    }
+    group.set(member.chartId, member);
+
+    return () => {
+      const current = this.groups.get(member.groupId);
+      if (current?.get(member.chartId) === member) {
+        current.delete(member.chartId);
+        if (current.size === 0) {
+          this.groups.delete(member.groupId);
+        }
+      }
+      this.lastApplied.delete(`crosshair:${member.chartId}`);
+      this.lastApplied.delete(`timeRange:${member.chartId}`);
+    };
+  }
+
+  /**
+   * Whether an event of a chart only reflects the last update applied to it.
+   *
+   * @param kind - Update kind
+   * @param chartId - Chart that emitted the event
+   * @param payload - Event value
+   */
+  isEcho(kind: SyncKind, chartId: string, payload: SyncPayload): boolean {
+    const applied = this.lastApplied.get(`${kind}:${chartId}`);
+    if (!applied) {
+      return false;
+    }
+    if (kind === "crosshair") {
+      return sameTime((applied as CrosshairSync).time, (payload as CrosshairSync).time);
+    }
+    const a = applied as TimeRangeSync;
+    const b = payload as TimeRangeSync;
+    return Math.abs(a.from - b.from) < 1e-6 && Math.abs(a.to - b.to) < 1e-6;
+  }
+
+  /**
+   * Publish an update of a chart to the other members of its group.
+   *
+   * @param kind - Update kind
+   * @param chartId - Source chart
+   * @param groupId - Sync group of the source chart
+   * @param payload - Crosshair position or visible logical range
+   */
+  publish(kind: SyncKind, chartId: string, groupId: number, payload: SyncPayload): void {
+    if (this.isEcho(kind, chartId, payload)) {
+      return;
+    }
+    this.lastApplied.delete(`${kind}:${chartId}`);
+    this.enqueue({ origin: this.origin, kind, groupId, chartId, payload });
+  }
+
+  private enqueue(message: SyncMessage): void {
+    this.pending.set(`${message.kind}:${message.groupId}`, message);
+    if (this.frame !== null) {
+      return;
+    }
+    if (typeof requestAnimationFrame === "undefined") {
+      this.flush();
+      return;
+    }
+    this.frame = requestAnimationFrame(() => {
+      this.frame = null;
+      this.flush();
+    });
+  }
+
+  private flush(): void {
+    const messages = Array.from(this.pending.values());
+    this.pending.clear();
+
+    for (const message of messages) {
+      this.group(message).forEach((member) => {
+        if (member.chartId === message.chartId && message.origin === this.origin) {
+          return;
+        }
+        this.lastApplied.set(`${message.kind}:${member.chartId}`, message.payload);
+        try {
+          if (message.kind === "crosshair") {
+            member.onCrosshair?.(message.payload as CrosshairSync);
+          } else {
+            member.onTimeRange?.(message.payload as TimeRangeSync);
+          }
+        } catch (error) {
+          logger.warn("Error applying chart sync update", "ChartSync", error);
+        }
+      });
+
+      if (message.origin === this.origin && this.channel) {
+        try {
+          this.channel.postMessage(message);
+        } catch (error) {
+          logger.warn("Failed to broadcast chart sync update", "ChartSync", error);
+        }
+      }
+    }
+  }
+
+  private group(message: SyncMessage): SyncMember[] {
+    return Array.from(this.groups.get(message.groupId)?.values() ?? []);
+  }
+}
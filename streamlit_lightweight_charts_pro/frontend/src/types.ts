@@ -284,6 +284,27 @@ export interface LineOptions {
 }
 
 // Enhanced Series Configuration
+/**
+ * Palette-encoded per-point color field.
+ *
+ * `index` holds one palette index per data point; `runs` holds
+ * `[start, index]` pairs that last until the next run. -1 means no color.
+ */
+export interface ColorPalette {
+  colors: string[];
+  index?: number[];
+  runs?: Array<[number, number]>;
+}
+
+/**
+ * Location of a little-endian float64 column in the binary `buffers`
+ * component argument. NaN marks a point without the field.
+ */
+export interface ColumnSpec {
+  offset: number; // Byte offset
+  length: number; // Number of values
+}
+
 export interface SeriesConfig {
   type:
     | "Area"
@@ -325,6 +346,10 @@ export interface SeriesConfig {
   tooltip?: TooltipConfig; // Add tooltip configuration
   legend?: LegendData | null; // Add series-level legend support
   paneId?: number; // Add support for multi-pane charts
+  timeAxis?: string; // Id of a shared time vector in ChartConfig.timeAxes
+  colorPalettes?: Record<string, ColorPalette>; // Palette-encoded per-point colors
+  columns?: Record<string, ColumnSpec>; // Data sent as binary columns instead of points
+  length?: number; // Number of points encoded in `columns`
   // Signal series support
   signalData?: SignalData[];
 
@@ -353,6 +378,19 @@ export interface SeriesConfig {
   priceLineStyle?: number;
 }
 
+/**
+ * Window of data sent when a payload budget truncated the chart.
+ *
+ * Page 0 is the most recent window; higher pages are further back in time.
+ */
+export interface PayloadWindow {
+  page: number;
+  pages: number;
+  from: Time;
+  to: Time;
+  totalPoints: number;
+}
+
 // Chart Position Configuration
 export interface ChartPosition {
   x?: number | string; // CSS position: left value (px or %)
@@ -456,6 +494,9 @@ export interface ChartConfig {
     rangeSwitcher?: RangeSwitcherConfig;
   };
   series: SeriesConfig[];
+  timeAxes?: Record<string, Time[]>; // Time vectors shared by several series
+  timeAxisColumns?: Record<string, ColumnSpec>; // Shared time vectors sent as binary columns
+  payloadWindow?: PayloadWindow; // Set when a payload budget truncated the data
   priceLines?: Array<{
     price: number;
     color?: string;
@@ -529,11 +570,36 @@ export interface SyncConfig {
 }
 
 // Component Configuration
+/**
+ * Arrangement of the charts of one component instance.
+ *
+ * Charts are stacked vertically by default; "grid" lays them out in `cols`
+ * equal-width columns so many small charts share one component instance.
+ */
+export interface LayoutConfig {
+  type: "column" | "grid";
+  cols?: number;
+  gap?: number;
+}
+
+/**
+ * Off-screen chart virtualization.
+ *
+ * Charts are mounted when their container comes within `mountMargin` of the
+ * viewport and disposed beyond `disposeMargin` (CSS margin syntax).
+ */
+export interface VirtualizeConfig {
+  mountMargin?: string;
+  disposeMargin?: string;
+}
+
 export interface ComponentConfig {
   charts: ChartConfig[];
   syncConfig?: SyncConfig;
   sync?: SyncConfig; // Allow sync as alias for syncConfig in tests
   callbacks?: string[];
+  layout?: LayoutConfig;
+  virtualize?: VirtualizeConfig;
 }
 
 // Modular Tooltip System
@@ -68,14 +68,8 @@ export interface PendingRectangleBatch {
  * Extended chart API with commonly used properties
  */
 export interface ExtendedChartApi extends IChartApi {
-  _storageListenerAdded?: boolean;
-  _timeRangeStorageListenerAdded?: boolean;
-  _storageHandler?: (e: StorageEvent) => void;
-  _timeRangeStorageHandler?: (e: StorageEvent) => void;
-  _isExternalSync?: boolean;
-  _isExternalTimeRangeSync?: boolean;
-  _externalSyncTimeout?: NodeJS.Timeout;
-  _externalTimeRangeSyncTimeout?: NodeJS.Timeout;
+  /** Removes the chart from the sync bus */
+  _syncLeave?: () => void;
   _pendingTradeRectangles?: Array<PendingTradeRectangle | PendingRectangleBatch>;
   _userHasInteracted?: boolean;
   _model?: {
@@ -668,7 +662,6 @@ declare global {
     seriesRefsMap?: Record<string, ExtendedSeriesApi[]>;
     paneWrappers?: Record<string, Record<string, unknown>>;
     paneButtonPanelWidgets?: Record<string, unknown[]>;
-    chartResizeObservers?: Record<string, ResizeObserver>;
     paneLegendManagers?: Record<string, Record<number, unknown>>;
     chartPlugins?: Map<string, unknown>;
   }
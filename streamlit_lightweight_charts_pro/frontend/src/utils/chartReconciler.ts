@@ -0,0 +1,225 @@
+/**
+ * @fileoverview Chart Reconciler
+ *
+ * Plans how a mounted chart can be brought to a new configuration without
+ * tearing it down. When Python sends `forceReinit`, the new configuration is
+ * diffed against the mounted one:
+ *
+ * - Chart-level settings (options, panes, legends, tooltips, trades, ...)
+ *   must be unchanged; the chart instance, its panes and its primitives are
+ *   kept as they are.
+ * - Series are matched by type, pane and title. Matched series keep their
+ *   instance and only receive changed options and data.
+ * - Undecorated built-in series (no legend, markers, price lines, ...) can be
+ *   added to or removed from existing panes.
+ *
+ * Anything else (custom series changes, decorated series added or removed,
+ * panes appearing or disappearing) returns no plan, and the caller falls back
+ * to rebuilding the chart.
+ *
+ * @example
+ * ```typescript
+ * const plan = planChartReconcile(mountedConfig, nextConfig, mountedSeries);
+ * if (!plan) {
+ *   rebuildChart();
+ * }
+ * ```
+ */
+
+import { ChartConfig, ComponentConfig, SeriesConfig } from "../types";
+import { ExtendedSeriesApi } from "../types/ChartInterfaces";
+import { isCustomSeries } from "../series/UnifiedSeriesFactory";
+import { normalizeSeriesType } from "../series/utils/seriesTypeNormalizer";
+
+/** Series fields that are updated in place */
+const UPDATABLE_FIELDS = ["data", "options"];
+
+/** Chart trades the frontend copies onto the first series while mounting */
+const TRADE_FIELDS = ["trades", "tradeVisualizationOptions"];
+
+/** Series fields whose objects are created together with the series */
+const DECORATION_FIELDS = [
+  "legend",
+  "markers",
+  "priceLines",
+  "priceScale",
+  "trades",
+  "annotations",
+  "shapes",
+  "tooltip",
+] as const;
+
+/** Change to one mounted series */
+export interface SeriesUpdate {
+  series: ExtendedSeriesApi;
+  config: SeriesConfig;
+  optionsChanged: boolean;
+  dataChanged: boolean;
+}
+
+/** Steps bringing a mounted chart to a new configuration */
+export interface ReconcilePlan {
+  /** Mounted series to remove */
+  remove: ExtendedSeriesApi[];
+  /** Kept series with changed options or data */
+  update: SeriesUpdate[];
+  /** Series of the new configuration: kept instances, or null where one is created */
+  series: Array<ExtendedSeriesApi | null>;
+}
+
+/** Whether two point lists hold the same points. */
+export function samePoints(a: unknown[] | undefined, b: unknown[] | undefined): boolean {
+  if (a === b) {
+    return true;
+  }
+  if (!a || !b || a.length !== b.length) {
+    return false;
+  }
+  for (let i = 0; i < a.length; i++) {
+    const p = a[i] as Record<string, unknown>;
+    const q = b[i] as Record<string, unknown>;
+    if (p === q) {
+      continue;
+    }
+    const keys = Object.keys(p);
+    if (keys.length !== Object.keys(q).length) {
+      return false;
+    }
+    for (const key of keys) {
+      if (p[key] !== q[key]) {
+        return false;
+      }
+    }
+  }
+  return true;
+}
+
+/** JSON signature of an object without the given keys. */
+function signature(value: object, omit: string[]): string {
+  return JSON.stringify(value, (key, field) =>
+    key !== "" && omit.includes(key) ? undefined : field,
+  );
+}
+
+/** Signature of the series fields that are not updated in place */
+function seriesSignature(config: SeriesConfig, chart: ChartConfig): string {
+  const injected = chart.trades !== undefined && config.trades === chart.trades;
+  return signature(config, injected ? [...UPDATABLE_FIELDS, ...TRADE_FIELDS] : UPDATABLE_FIELDS);
+}
+
+/** Key matching a series across configurations */
+function seriesKey(config: SeriesConfig): string {
+  const options = (config.options ?? {}) as { title?: string };
+  return `${config.type}|${config.paneId ?? 0}|${options.title ?? config.name ?? ""}`;
+}
+
+/** Whether a series can be added or removed on its own */
+function isStandalone(config: SeriesConfig): boolean {
+  if (isCustomSeries(normalizeSeriesType(config.type))) {
+    return false;
+  }
+  return DECORATION_FIELDS.every((field) => {
+    const value = config[field];
+    return Array.isArray(value) ? value.length === 0 : value === undefined || value === null;
+  });
+}
+
+/** Sorted pane ids used by the series of a chart */
+function paneIds(config: ChartConfig): string {
+  const ids = new Set((config.series ?? []).map((series) => series.paneId ?? 0));
+  return Array.from(ids)
+    .sort((a, b) => a - b)
+    .join(",");
+}
+
+/**
+ * Whether two component configurations share all settings besides their charts.
+ *
+ * @param mounted - Configuration the component was built from
+ * @param next - New component configuration
+ */
+export function sameComponentSettings(
+  mounted: ComponentConfig | null,
+  next: ComponentConfig,
+): boolean {
+  const omit = ["charts", "forceReinit"];
+  return mounted !== null && signature(mounted, omit) === signature(next, omit);
+}
+
+/**
+ * Plan the reconciliation of a mounted chart.
+ *
+ * @param mounted - Configuration the chart was built from
+ * @param next - New configuration of the chart
+ * @param mountedSeries - Series instances, in the order of `mounted.series`
+ * @returns The plan, or null if the chart has to be rebuilt
+ */
+export function planChartReconcile(
+  mounted: ChartConfig,
+  next: ChartConfig,
+  mountedSeries: ExtendedSeriesApi[],
+): ReconcilePlan | null {
+  const mountedConfigs = mounted.series ?? [];
+  const nextConfigs = next.series ?? [];
+  if (mountedSeries.length !== mountedConfigs.length) {
+    return null;
+  }
+
+  if (signature(mounted, ["series"]) !== signature(next, ["series"])) {
+    return null;
+  }
+  if (paneIds(mounted) !== paneIds(next)) {
+    return null;
+  }
+
+  // Mounted series by key, in order
+  const available = new Map<string, number[]>();
+  mountedConfigs.forEach((config, index) => {
+    const key = seriesKey(config);
+    available.set(key, [...(available.get(key) ?? []), index]);
+  });
+
+  const plan: ReconcilePlan = { remove: [], update: [], series: [] };
+  for (const config of nextConfigs) {
+    const index = available.get(seriesKey(config))?.shift();
+    if (index === undefined) {
+      if (!isStandalone(config)) {
+        return null;
+      }
+      plan.series.push(null);
+      continue;
+    }
+
+    const previous = mountedConfigs[index];
+    if (seriesSignature(previous, mounted) !== seriesSignature(config, next)) {
+      return null;
+    }
+    const optionsChanged =
+      JSON.stringify(previous.options ?? {}) !== JSON.stringify(config.options ?? {});
+    const dataChanged = !samePoints(previous.data, config.data);
+    if ((optionsChanged || dataChanged) && isCustomSeries(normalizeSeriesType(config.type))) {
+      return null;
+    }
+
+    plan.series.push(mountedSeries[index]);
+    if (optionsChanged || dataChanged) {
+      plan.update.push({ series: mountedSeries[index], config, optionsChanged, dataChanged });
+    }
+  }
+
+  for (const indexes of available.values()) {
+    for (const index of indexes) {
+      if (!isStandalone(mountedConfigs[index])) {
+        return null;
+      }
+      plan.remove.push(mountedSeries[index]);
+    }
+  }
+
+  // Chart trades are drawn on the first series
+  if (next.trades?.length && plan.series[0] !== mountedSeries[0]) {
+    return null;
+  }
+
+  return plan;
+}
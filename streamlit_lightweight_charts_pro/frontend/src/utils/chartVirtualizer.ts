@@ -0,0 +1,175 @@
+/**
+ * @fileoverview Chart Virtualizer
+ *
+ * Mounts the charts of a multi-chart component only when their containers
+ * approach the viewport, and disposes charts that scroll far away. Mounts are
+ * spread over animation frames (one chart per frame), so the time to the
+ * first interactive chart does not grow with the number of charts.
+ *
+ * Two IntersectionObservers with different margins give hysteresis: a chart
+ * is mounted when it comes within `mountMargin` of the viewport and disposed
+ * only once it is farther than `disposeMargin`, so scrolling back and forth
+ * near the edge does not thrash.
+ *
+ * Inside the Streamlit iframe the observers use the implicit root, which is
+ * the top-level page viewport, so off-screen detection follows page scrolling.
+ *
+ * @example
+ * ```typescript
+ * const virtualizer = new ChartVirtualizer({
+ *   mount: (chartId) => mountChart(configs[chartId]),
+ *   dispose: (chartId) => disposeChart(chartId),
+ * });
+ * virtualizer.observe('chart-1', container);
+ * ```
+ */
+
+/** Options for ChartVirtualizer */
+export interface ChartVirtualizerOptions {
+  /** Create the chart for a chart id */
+  mount: (chartId: string) => void;
+  /** Remove the chart for a chart id */
+  dispose: (chartId: string) => void;
+  /** Distance from the viewport at which charts are mounted */
+  mountMargin?: string;
+  /** Distance from the viewport beyond which charts are disposed */
+  disposeMargin?: string;
+}
+
+/**
+ * Mounts and disposes charts as their containers enter and leave the viewport.
+ *
+ * Without IntersectionObserver support every observed chart is mounted
+ * immediately.
+ */
+export class ChartVirtualizer {
+  private readonly options: Required<ChartVirtualizerOptions>;
+
+  private readonly elements = new Map<Element, string>();
+
+  private readonly mounted = new Set<string>();
+
+  private readonly queue: string[] = [];
+
+  private nearObserver: IntersectionObserver | null = null;
+
+  private farObserver: IntersectionObserver | null = null;
+
+  private frame: number | null = null;
+
+  constructor(options: ChartVirtualizerOptions) {
+    this.options = {
+      mountMargin: "200px 0px",
+      disposeMargin: "1500px 0px",
+      ...options,
+    };
+
+    if (typeof IntersectionObserver !== "undefined") {
+      this.nearObserver = new IntersectionObserver(
+        (entries) => this.handleNear(entries),
+        { rootMargin: this.options.mountMargin },
+      );
+      this.farObserver = new IntersectionObserver(
+        (entries) => this.handleFar(entries),
+        { rootMargin: this.options.disposeMargin },
+      );
+    }
+  }
+
+  /**
+   * Start tracking the container of a chart.
+   *
+   * @param chartId - Chart identifier passed to mount/dispose
+   * @param element - Chart container element
+   */
+  observe(chartId: string, element: Element): void {
+    this.elements.set(element, chartId);
+    if (!this.nearObserver || !this.farObserver) {
+      this.enqueue(chartId);
+      return;
+    }
+    this.nearObserver.observe(element);
+    this.farObserver.observe(element);
+  }
+
+  /** Whether a chart is currently mounted */
+  isMounted(chartId: string): boolean {
+    return this.mounted.has(chartId);
+  }
+
+  /** Stop observing and cancel pending mounts; mounted charts are kept. */
+  disconnect(): void {
+    this.nearObserver?.disconnect();
+    this.farObserver?.disconnect();
+    this.nearObserver = null;
+    this.farObserver = null;
+    if (this.frame !== null) {
+      cancelAnimationFrame(this.frame);
+      this.frame = null;
+    }
+    this.queue.length = 0;
+    this.elements.clear();
+    this.mounted.clear();
+  }
+
+  private handleNear(entries: IntersectionObserverEntry[]): void {
+    for (const entry of entries) {
+      const chartId = this.elements.get(entry.target);
+      if (chartId !== undefined && entry.isIntersecting) {
+        this.enqueue(chartId);
+      }
+    }
+  }
+
+  private handleFar(entries: IntersectionObserverEntry[]): void {
+    for (const entry of entries) {
+      const chartId = this.elements.get(entry.target);
+      if (chartId === undefined || entry.isIntersecting) {
+        continue;
+      }
+      const queued = this.queue.indexOf(chartId);
+      if (queued >= 0) {
+        this.queue.splice(queued, 1);
+      }
+      if (this.mounted.delete(chartId)) {
+        this.options.dispose(chartId);
+      }
+    }
+  }
+
+  private enqueue(chartId: string): void {
+    if (this.mounted.has(chartId) || this.queue.includes(chartId)) {
+      return;
+    }
+    this.queue.push(chartId);
+    this.scheduleFlush();
+  }
+
+  private scheduleFlush(): void {
+    if (this.frame !== null) {
+      return;
+    }
+    if (typeof requestAnimationFrame === "undefined") {
+      while (this.queue.length > 0) {
+        this.mountNext();
+      }
+      return;
+    }
+    this.frame = requestAnimationFrame(() => {
+      this.frame = null;
+      this.mountNext();
+      if (this.queue.length > 0) {
+        this.scheduleFlush();
+      }
+    });
+  }
+
+  private mountNext(): void {
+    const chartId = this.queue.shift();
+    if (chartId === undefined) {
+      return;
+    }
+    this.mounted.add(chartId);
+    this.options.mount(chartId);
+  }
+}
@@ -0,0 +1,232 @@
+/**
+ * @fileoverview Binary Column Buffer Decoding
+ *
+ * Large numeric series arrive as float64 columns in the binary `buffers`
+ * component argument instead of JSON point lists (see `ColumnSpec`). This
+ * module extracts the columns in a Web Worker, receives them back as
+ * transferred ArrayBuffers (no copy), and rebuilds the point objects that
+ * lightweight-charts' `setData` expects in a single pass.
+ *
+ * Where Web Workers are unavailable (tests, restrictive sandboxes) the same
+ * extraction runs on the main thread.
+ *
+ * @example
+ * ```typescript
+ * const decoded = await decodeColumnBuffers(config, renderData.args.buffers);
+ * ```
+ */
+
+import { Time } from "lightweight-charts";
+import { logger } from "@nandkapadia/lightweight-charts-pro-core";
+import { ChartConfig, ColumnSpec, ComponentConfig, SeriesConfig } from "../types";
+
+/** One group of columns to extract from the buffer */
+export interface ColumnJob {
+  id: number;
+  columns: Record<string, ColumnSpec>;
+}
+
+/** Extracted columns of one job, each backed by its own ArrayBuffer */
+export interface ColumnResult {
+  id: number;
+  columns: Record<string, Float64Array>;
+}
+
+/**
+ * Copy each column of each job into its own Float64Array.
+ *
+ * Runs inside the worker, so it must not reference anything outside its own
+ * body (it is serialized with Function.prototype.toString).
+ *
+ * @param buffer - Binary column buffer
+ * @param jobs - Columns to extract
+ * @returns Extracted columns per job
+ */
+export function extractColumns(buffer: ArrayBuffer, jobs: ColumnJob[]): ColumnResult[] {
+  return jobs.map((job) => {
+    const columns: Record<string, Float64Array> = {};
+    for (const field of Object.keys(job.columns)) {
+      const spec = job.columns[field];
+      const end = spec.offset + spec.length * Float64Array.BYTES_PER_ELEMENT;
+      columns[field] = new Float64Array(buffer.slice(spec.offset, end));
+    }
+    return { id: job.id, columns };
+  });
+}
+
+const WORKER_SOURCE = `
+const extractColumns = ${extractColumns.toString()};
+self.onmessage = (event) => {
+  const { requestId, buffer, jobs } = event.data;
+  const results = extractColumns(buffer, jobs);
+  const transfer = [];
+  for (const result of results) {
+    for (const column of Object.values(result.columns)) {
+      transfer.push(column.buffer);
+    }
+  }
+  self.postMessage({ requestId, results }, transfer);
+};
+`;
+
+let worker: Worker | null | undefined;
+let nextRequestId = 0;
+const pendingRequests = new Map<
+  number,
+  { resolve: (results: ColumnResult[]) => void; reject: (error: unknown) => void }
+>();
+
+/** Return the shared decoder worker, or null if workers are unavailable. */
+function getWorker(): Worker | null {
+  if (worker !== undefined) {
+    return worker;
+  }
+  worker = null;
+  if (
+    typeof Worker === "undefined" ||
+    typeof Blob === "undefined" ||
+    typeof URL === "undefined" ||
+    typeof URL.createObjectURL !== "function"
+  ) {
+    return null;
+  }
+  try {
+    const url = URL.createObjectURL(
+      new Blob([WORKER_SOURCE], { type: "text/javascript" }),
+    );
+    const created = new Worker(url);
+    created.onmessage = (event: MessageEvent) => {
+      const { requestId, results } = event.data;
+      pendingRequests.get(requestId)?.resolve(results);
+      pendingRequests.delete(requestId);
+    };
+    created.onerror = (event: ErrorEvent) => {
+      // Fail pending requests; they fall back to main-thread decoding
+      pendingRequests.forEach(({ reject }) => reject(event));
+      pendingRequests.clear();
+      worker = null;
+      created.terminate();
+    };
+    worker = created;
+  } catch (error) {
+    logger.warn("Column decoder worker unavailable", "ColumnBuffers", error);
+  }
+  return worker;
+}
+
+/** Extract the columns in the worker, falling back to the main thread. */
+async function extract(buffers: Uint8Array, jobs: ColumnJob[]): Promise<ColumnResult[]> {
+  // Copy into a fresh, 8-byte aligned buffer that can be transferred
+  const buffer = buffers.slice().buffer as ArrayBuffer;
+  const decoder = getWorker();
+  if (decoder) {
+    try {
+      return await new Promise<ColumnResult[]>((resolve, reject) => {
+        const requestId = nextRequestId++;
+        pendingRequests.set(requestId, { resolve, reject });
+        decoder.postMessage({ requestId, buffer, jobs }, [buffer]);
+      });
+    } catch (error) {
+      logger.warn("Column decoding failed in worker", "ColumnBuffers", error);
+      return extractColumns(buffers.slice().buffer as ArrayBuffer, jobs);
+    }
+  }
+  return extractColumns(buffer, jobs);
+}
+
+/**
+ * Build point objects from columns; NaN values are left out of the point.
+ *
+ * @param columns - One column per field
+ * @param length - Number of points
+ * @returns Points ready for `setData`
+ */
+export function materializePoints(
+  columns: Record<string, Float64Array>,
+  length: number,
+): Array<Record<string, number>> {
+  const fields = Object.keys(columns);
+  const values = fields.map((field) => columns[field]);
+  const points: Array<Record<string, number>> = new Array(length);
+  for (let i = 0; i < length; i++) {
+    const point: Record<string, number> = {};
+    for (let f = 0; f < fields.length; f++) {
+      const value = values[f][i];
+      if (value === value) {
+        point[fields[f]] = value;
+      }
+    }
+    points[i] = point;
+  }
+  return points;
+}
+
+/**
+ * Replace binary column references of a configuration with decoded data.
+ *
+ * Returns a decoded copy: `timeAxisColumns` become `timeAxes` entries and
+ * series `columns` become `data` on shallow copies of the charts and series,
+ * so the received configuration is left untouched and decoding it again
+ * (e.g. when React runs an effect twice) gives the same result. Shared time
+ * axes and color palettes are restored afterwards by `decodePayload`.
+ *
+ * @param config - Component configuration received from Streamlit
+ * @param buffers - Binary `buffers` component argument
+ * @returns The decoded configuration, or `config` itself if it references
+ *   no buffers
+ */
+export async function decodeColumnBuffers<T extends ComponentConfig | undefined>(
+  config: T,
+  buffers: Uint8Array | undefined,
+): Promise<T> {
+  if (!config || !Array.isArray(config.charts) || !buffers) {
+    return config;
+  }
+
+  const jobs: ColumnJob[] = [];
+  const apply: Array<(columns: Record<string, Float64Array>) => void> = [];
+  const addJob = (
+    columns: Record<string, ColumnSpec>,
+    onDecoded: (decoded: Record<string, Float64Array>) => void,
+  ) => {
+    jobs.push({ id: jobs.length, columns });
+    apply.push(onDecoded);
+  };
+
+  const charts = config.charts.map((source: ChartConfig) => {
+    const { timeAxisColumns, ...chart }: ChartConfig = source;
+    Object.entries(timeAxisColumns ?? {}).forEach(([axisId, spec]) => {
+      addJob({ time: spec }, (decoded) => {
+        chart.timeAxes = {
+          ...chart.timeAxes,
+          [axisId]: Array.from(decoded.time) as Time[],
+        };
+      });
+    });
+
+    if (Array.isArray(source.series)) {
+      // Copy every series: decodePayload then edits the copies, not the input
+      chart.series = source.series.map((sourceSeries: SeriesConfig) => {
+        const { columns, length, ...series }: SeriesConfig = sourceSeries;
+        if (columns) {
+          addJob(columns, (decoded) => {
+            series.data = materializePoints(
+              decoded,
+              length ?? 0,
+            ) as unknown as SeriesConfig["data"];
+          });
+        }
+        return series;
+      });
+    }
+    return chart;
+  });
+
+  if (jobs.length === 0) {
+    return config;
+  }
+
+  const results = await extract(buffers, jobs);
+  results.forEach((result) => apply[result.id](result.columns));
+  return { ...config, charts } as T;
+}
@@ -0,0 +1,157 @@
+/**
+ * @fileoverview Chart Initialization Scheduler
+ *
+ * Cooperative scheduler that splits chart initialization into prioritized
+ * tasks and yields to the browser between short time slices, so building a
+ * large configuration does not block input and painting for seconds.
+ *
+ * Priorities follow the Prioritized Task Scheduling API:
+ * - "user-blocking": the main price chart
+ * - "user-visible": further charts and their series
+ * - "background": decorations (tooltips, annotations, price lines)
+ *
+ * Slices are scheduled with `scheduler.postTask` where available, otherwise
+ * with a MessageChannel (or `requestIdleCallback` for background work), with
+ * `setTimeout` as the last resort.
+ *
+ * @example
+ * ```typescript
+ * const scheduler = new InitScheduler();
+ * scheduler.schedule(() => mountChart(config), 'user-visible');
+ * scheduler.schedule(() => addAnnotations(chart), 'background');
+ * ```
+ */
+
+export type TaskPriority = "user-blocking" | "user-visible" | "background";
+
+/** Priorities from most to least urgent */
+const PRIORITIES: TaskPriority[] = ["user-blocking", "user-visible", "background"];
+
+/** Longest wait for an idle period before background work runs anyway */
+const IDLE_TIMEOUT_MS = 500;
+
+interface QueuedTask {
+  run: () => void;
+  resolve: () => void;
+  reject: (error: unknown) => void;
+}
+
+interface PostTaskScheduler {
+  postTask: (
+    callback: () => void,
+    options?: { priority?: TaskPriority },
+  ) => Promise<unknown>;
+}
+
+/**
+ * Runs queued tasks in priority order, in slices of at most `sliceMs`.
+ */
+export class InitScheduler {
+  private readonly queues: Record<TaskPriority, QueuedTask[]> = {
+    "user-blocking": [],
+    "user-visible": [],
+    background: [],
+  };
+
+  // Priority of the pending slice request, if any
+  private requestedPriority: TaskPriority | null = null;
+
+  // Invalidates pending slice requests after cancel() or re-prioritization
+  private sliceToken = 0;
+
+  /**
+   * @param sliceMs - Time budget of one slice before yielding to the browser
+   */
+  constructor(private readonly sliceMs = 8) {}
+
+  /**
+   * Queue a task.
+   *
+   * @param task - Work to run
+   * @param priority - Task priority
+   * @returns Promise resolved when the task has run (never, if cancelled)
+   */
+  schedule(task: () => void, priority: TaskPriority = "user-visible"): Promise<void> {
+    return new Promise<void>((resolve, reject) => {
+      this.queues[priority].push({ run: task, resolve, reject });
+      this.requestSlice();
+    });
+  }
+
+  /** Number of queued tasks */
+  get pending(): number {
+    return PRIORITIES.reduce((total, priority) => total + this.queues[priority].length, 0);
+  }
+
+  /** Drop all queued tasks, e.g. when the charts are torn down. */
+  cancel(): void {
+    PRIORITIES.forEach((priority) => {
+      this.queues[priority] = [];
+    });
+    this.sliceToken++;
+    this.requestedPriority = null;
+  }
+
+  private nextPriority(): TaskPriority | undefined {
+    return PRIORITIES.find((priority) => this.queues[priority].length > 0);
+  }
+
+  private requestSlice(): void {
+    const priority = this.nextPriority();
+    if (priority === undefined) {
+      return;
+    }
+    // A pending request at the same or higher priority will pick the task up;
+    // more urgent work replaces a pending lower-priority (e.g. idle) request
+    if (
+      this.requestedPriority !== null &&
+      PRIORITIES.indexOf(this.requestedPriority) <= PRIORITIES.indexOf(priority)
+    ) {
+      return;
+    }
+    this.requestedPriority = priority;
+
+    const token = ++this.sliceToken;
+    const run = () => {
+      if (token === this.sliceToken) {
+        this.requestedPriority = null;
+        this.runSlice();
+      }
+    };
+
+    const postTaskScheduler = (globalThis as { scheduler?: PostTaskScheduler }).scheduler;
+    if (postTaskScheduler && typeof postTaskScheduler.postTask === "function") {
+      void postTaskScheduler.postTask(run, { priority });
+    } else if (priority === "background" && typeof requestIdleCallback === "function") {
+      requestIdleCallback(run, { timeout: IDLE_TIMEOUT_MS });
+    } else if (typeof MessageChannel !== "undefined") {
+      const channel = new MessageChannel();
+      channel.port1.onmessage = () => {
+        channel.port1.close();
+        run();
+      };
+      channel.port2.postMessage(null);
+    } else {
+      setTimeout(run, 0);
+    }
+  }
+
+  private runSlice(): void {
+    const start = performance.now();
+    let priority = this.nextPriority();
+    while (priority !== undefined) {
+      const task = this.queues[priority].shift() as QueuedTask;
+      try {
+        task.run();
+        task.resolve();
+      } catch (error) {
+        task.reject(error);
+      }
+      if (performance.now() - start >= this.sliceMs) {
+        break;
+      }
+      priority = this.nextPriority();
+    }
+    this.requestSlice();
+  }
+}
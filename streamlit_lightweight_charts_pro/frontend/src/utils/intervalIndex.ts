@@ -0,0 +1,106 @@
+/**
+ * @fileoverview Interval Index
+ *
+ * Static index over [start, end] spans answering "which spans overlap this
+ * range" without visiting every span. Spans are sorted by start and grouped
+ * in fixed-size blocks that record their largest end: a query only scans
+ * spans starting before the range end, and skips whole blocks ending before
+ * the range start. Overlays whose spans advance with time (sessions, zones)
+ * touch little more than the visible spans.
+ *
+ * @example
+ * ```typescript
+ * const index = new IntervalIndex();
+ * index.build(rectangles.length, (i) => rectangles[i].x1, (i) => rectangles[i].x2);
+ * const visible = index.query(0, canvas.width);
+ * ```
+ */
+
+/** Spans per block */
+const BLOCK_SIZE = 64;
+
+/**
+ * Index over spans, returning the positions of spans overlapping a range.
+ */
+export class IntervalIndex {
+  private order = new Int32Array(0);
+
+  private starts = new Float64Array(0);
+
+  private ends = new Float64Array(0);
+
+  private blockMaxEnd = new Float64Array(0);
+
+  /** Number of indexed spans */
+  get size(): number {
+    return this.order.length;
+  }
+
+  /**
+   * Index spans; start and end may be given in either order.
+   *
+   * @param count - Number of spans
+   * @param startOf - Start of the span at a position
+   * @param endOf - End of the span at a position
+   */
+  build(count: number, startOf: (i: number) => number, endOf: (i: number) => number): void {
+    const lows = new Float64Array(count);
+    const highs = new Float64Array(count);
+    for (let i = 0; i < count; i++) {
+      const a = startOf(i);
+      const b = endOf(i);
+      lows[i] = Math.min(a, b);
+      highs[i] = Math.max(a, b);
+    }
+
+    const order = Int32Array.from({ length: count }, (_, i) => i);
+    order.sort((a, b) => lows[a] - lows[b] || a - b);
+
+    this.order = order;
+    this.starts = new Float64Array(count);
+    this.ends = new Float64Array(count);
+    this.blockMaxEnd = new Float64Array(Math.ceil(count / BLOCK_SIZE)).fill(-Infinity);
+    for (let i = 0; i < count; i++) {
+      this.starts[i] = lows[order[i]];
+      this.ends[i] = highs[order[i]];
+      const block = (i / BLOCK_SIZE) | 0;
+      if (this.ends[i] > this.blockMaxEnd[block]) {
+        this.blockMaxEnd[block] = this.ends[i];
+      }
+    }
+  }
+
+  /**
+   * Positions of the spans overlapping [from, to], in ascending order.
+   *
+   * @param from - Range start
+   * @param to - Range end
+   */
+  query(from: number, to: number): number[] {
+    // Spans starting at or before `to`
+    let low = 0;
+    let high = this.starts.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.starts[mid] <= to) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+
+    const result: number[] = [];
+    for (let blockStart = 0; blockStart < low; blockStart += BLOCK_SIZE) {
+      if (this.blockMaxEnd[blockStart / BLOCK_SIZE] < from) {
+        continue;
+      }
+      const blockEnd = Math.min(blockStart + BLOCK_SIZE, low);
+      for (let i = blockStart; i < blockEnd; i++) {
+        if (this.ends[i] >= from) {
+          result.push(this.order[i]);
+        }
+      }
+    }
+    return result.sort((a, b) => a - b);
+  }
+}
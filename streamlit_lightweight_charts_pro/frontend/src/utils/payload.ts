@@ -0,0 +1,128 @@
+/**
+ * @fileoverview Payload Decoding
+ *
+ * Restores compact encodings produced by the Python ChartRenderer before the
+ * configuration reaches the chart components.
+ *
+ * This module provides:
+ * - Shared time axis rehydration (ChartConfig.timeAxes / SeriesConfig.timeAxis)
+ * - Palette-encoded per-point colors (SeriesConfig.colorPalettes)
+ *
+ * Decoding works in place on the parsed configuration and removes the
+ * encoding markers, so calling it again on the same object is a no-op.
+ *
+ * @example
+ * ```typescript
+ * import { decodePayload } from './utils/payload';
+ *
+ * const config = decodePayload(renderData.args.config as ComponentConfig);
+ * ```
+ */
+
+import {
+  ComponentConfig,
+  ChartConfig,
+  ColorPalette,
+  SeriesConfig,
+} from "../types";
+
+/**
+ * Write one palette-encoded color field onto the data points.
+ *
+ * Points with index -1 are left without the field, and the palette strings
+ * are shared between points rather than copied.
+ */
+function expandPalette(
+  data: Array<Record<string, unknown>>,
+  key: string,
+  palette: ColorPalette,
+): void {
+  const { colors } = palette;
+  if (palette.index) {
+    const length = Math.min(palette.index.length, data.length);
+    for (let i = 0; i < length; i++) {
+      const code = palette.index[i];
+      if (code >= 0) {
+        data[i][key] = colors[code];
+      }
+    }
+    return;
+  }
+
+  const runs = palette.runs ?? [];
+  for (let r = 0; r < runs.length; r++) {
+    const [start, code] = runs[r];
+    if (code < 0) {
+      continue;
+    }
+    const end = r + 1 < runs.length ? runs[r + 1][0] : data.length;
+    const color = colors[code];
+    for (let i = start; i < Math.min(end, data.length); i++) {
+      data[i][key] = color;
+    }
+  }
+}
+
+/**
+ * Expand the palette-encoded color fields of a series onto its data points.
+ *
+ * @param series - Series configuration, modified in place
+ */
+export function expandColorPalettes(series: SeriesConfig): void {
+  const palettes = series.colorPalettes;
+  if (!palettes) {
+    return;
+  }
+  const data = series.data as unknown as Array<Record<string, unknown>>;
+  if (Array.isArray(data)) {
+    for (const [key, palette] of Object.entries(palettes)) {
+      expandPalette(data, key, palette);
+    }
+  }
+  delete series.colorPalettes;
+}
+
+/**
+ * Restore the `time` field of series that reference a shared time axis.
+ *
+ * @param chart - Chart configuration, modified in place
+ */
+export function rehydrateTimeAxes(chart: ChartConfig): void {
+  const timeAxes = chart.timeAxes;
+  if (!timeAxes) {
+    return;
+  }
+
+  for (const series of chart.series ?? []) {
+    if (!series.timeAxis) {
+      continue;
+    }
+    const times = timeAxes[series.timeAxis];
+    const data = series.data as unknown as Array<Record<string, unknown>>;
+    if (times && Array.isArray(data)) {
+      const length = Math.min(times.length, data.length);
+      for (let i = 0; i < length; i++) {
+        data[i].time = times[i];
+      }
+    }
+    delete series.timeAxis;
+  }
+
+  delete chart.timeAxes;
+}
+
+/**
+ * Decode all compact encodings of a component configuration in place.
+ *
+ * @param config - Component configuration received from Streamlit
+ * @returns The same configuration object, decoded
+ */
+export function decodePayload<T extends ComponentConfig | undefined>(config: T): T {
+  if (config && Array.isArray(config.charts)) {
+    for (const chart of config.charts) {
+      rehydrateTimeAxes(chart);
+      (chart.series ?? []).forEach(expandColorPalettes);
+    }
+  }
+  return config;
+}
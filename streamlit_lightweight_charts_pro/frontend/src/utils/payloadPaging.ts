@@ -0,0 +1,64 @@
+/**
+ * @fileoverview Payload Window Paging
+ *
+ * When a chart payload exceeds its PayloadBudget with the "truncate" policy,
+ * Python sends only a window of the data and describes it in
+ * `ChartConfig.payloadWindow`. This module watches the visible range and asks
+ * Streamlit for the neighbouring window when the user scrolls past either
+ * edge of the loaded data.
+ *
+ * @example
+ * ```typescript
+ * setupPayloadPaging(chart, chartConfig.payloadWindow, (page) =>
+ *   Streamlit.setComponentValue({ type: 'payload_page', page }),
+ * );
+ * ```
+ */
+
+import { IChartApi, LogicalRange } from "lightweight-charts";
+import { PayloadWindow } from "../types";
+
+/** Bars scrolled past an edge before the next window is requested */
+const PAGE_TRIGGER_BARS = 5;
+
+/**
+ * Request older or newer payload windows from the visible logical range.
+ *
+ * At most one page request is sent per chart; the rerun it triggers
+ * recreates the chart with the new window.
+ *
+ * @param chart - Chart displaying a truncated payload
+ * @param payloadWindow - Window metadata sent by Python
+ * @param requestPage - Callback sending the requested page to Python
+ */
+export function setupPayloadPaging(
+  chart: IChartApi,
+  payloadWindow: PayloadWindow,
+  requestPage: (page: number) => void,
+): void {
+  const { page, pages } = payloadWindow;
+  if (pages <= 1) {
+    return;
+  }
+
+  let requested = false;
+  chart
+    .timeScale()
+    .subscribeVisibleLogicalRangeChange((range: LogicalRange | null) => {
+      if (!range || requested) {
+        return;
+      }
+      const loadedBars = chart.panes()[0]?.getSeries()[0]?.data().length ?? 0;
+      if (range.from < -PAGE_TRIGGER_BARS && page < pages - 1) {
+        requested = true;
+        requestPage(page + 1);
+      } else if (
+        loadedBars > 0 &&
+        range.to > loadedBars - 1 + PAGE_TRIGGER_BARS &&
+        page > 0
+      ) {
+        requested = true;
+        requestPage(page - 1);
+      }
+    });
+}
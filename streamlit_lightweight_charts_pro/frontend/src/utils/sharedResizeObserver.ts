@@ -0,0 +1,74 @@
+/**
+ * @fileoverview Shared Resize Observer
+ *
+ * One ResizeObserver per component instance, dispatching size changes to a
+ * callback registered per observed element. A grid of many charts then costs
+ * a single observer (and a single batch of resize callbacks per frame)
+ * instead of one observer per chart.
+ *
+ * @example
+ * ```typescript
+ * const observer = new SharedResizeObserver();
+ * observer.observe(container, () => chart.resize(...));
+ * // ...
+ * observer.disconnect();
+ * ```
+ */
+
+/** Callback invoked with the latest entry of an observed element */
+export type ResizeCallback = (entry: ResizeObserverEntry) => void;
+
+/**
+ * Dispatches entries of one ResizeObserver to per-element callbacks.
+ *
+ * Does nothing where ResizeObserver is unavailable (e.g. old test DOMs).
+ */
+export class SharedResizeObserver {
+  private readonly callbacks = new Map<Element, ResizeCallback>();
+
+  private observer: ResizeObserver | null = null;
+
+  /**
+   * Start observing an element, replacing any previous callback for it.
+   *
+   * @param target - Element to observe
+   * @param callback - Called when the element is resized
+   */
+  observe(target: Element, callback: ResizeCallback): void {
+    if (!this.observer) {
+      if (typeof ResizeObserver === "undefined") {
+        return;
+      }
+      this.observer = new ResizeObserver((entries) => {
+        for (const entry of entries) {
+          this.callbacks.get(entry.target)?.(entry);
+        }
+      });
+    }
+    this.callbacks.set(target, callback);
+    this.observer.observe(target);
+  }
+
+  /**
+   * Stop observing an element.
+   *
+   * @param target - Element previously passed to observe()
+   */
+  unobserve(target: Element): void {
+    if (this.callbacks.delete(target)) {
+      this.observer?.unobserve(target);
+    }
+  }
+
+  /** Number of observed elements */
+  get size(): number {
+    return this.callbacks.size;
+  }
+
+  /** Stop observing all elements and release the underlying observer. */
+  disconnect(): void {
+    this.observer?.disconnect();
+    this.observer = null;
+    this.callbacks.clear();
+  }
+}
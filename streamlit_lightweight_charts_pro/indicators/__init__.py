@@ -0,0 +1,49 @@
+"""Vectorized technical indicators for Streamlit Lightweight Charts Pro.
+
+Indicators compute over whole columns with NumPy, cache their results by
+input content and parameters, return styled series ready to add to a chart,
+and fold in appended bars in constant time. The cache is shared by all
+sessions of the process and also serves user functions through
+``cached_indicator``.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.indicators import SMA, BollingerBands
+
+    chart.add_series(SMA(50).series(df))
+    chart.add_series(BollingerBands(20, 2.0).series(df))
+    ```
+"""
+
+from streamlit_lightweight_charts_pro.indicators.base import Indicator, IndicatorResult
+from streamlit_lightweight_charts_pro.indicators.builtin import (
+    ATR,
+    EMA,
+    RSI,
+    SMA,
+    BollingerBands,
+)
+from streamlit_lightweight_charts_pro.indicators.cache import (
+    CacheStats,
+    IndicatorCache,
+    cached_indicator,
+    configure_cache,
+    fingerprint,
+    get_cache,
+)
+
+__all__ = [
+    "ATR",
+    "EMA",
+    "RSI",
+    "SMA",
+    "BollingerBands",
+    "CacheStats",
+    "Indicator",
+    "IndicatorCache",
+    "IndicatorResult",
+    "cached_indicator",
+    "configure_cache",
+    "fingerprint",
+    "get_cache",
+]
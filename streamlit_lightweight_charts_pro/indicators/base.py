@@ -0,0 +1,372 @@
+"""Indicator base class and results.
+
+An indicator reads its input columns (close, high, low) from a table,
+computes its outputs with the vectorized kernels and returns them as an
+``IndicatorResult``. Outputs are stored in the process-wide
+``IndicatorCache``, keyed by a fingerprint of the input columns, the
+indicator and its parameters, so a Streamlit rerun over unchanged data does
+not recompute anything.
+
+After ``compute`` an indicator also holds its running state, so a bar
+appended later is folded in with ``update`` in constant time instead of a
+full recomputation.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, ClassVar, Optional
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.charts.series import Series
+from lightweight_charts_pro.exceptions import ValueValidationError
+
+from streamlit_lightweight_charts_pro.data.interop import column_names, get_column, is_table
+from streamlit_lightweight_charts_pro.data.time_utils import normalize_time_array
+from streamlit_lightweight_charts_pro.indicators.cache import fingerprint, get_cache
+
+
+@dataclass(frozen=True)
+class IndicatorResult:
+    """Computed indicator outputs aligned with the input bars.
+
+    Output arrays are read-only, since they are shared through the cache.
+
+    Attributes:
+        time: int64 UNIX seconds of each bar.
+        values: Output arrays by name; NaN during the warm-up.
+    """
+
+    time: np.ndarray
+    values: dict[str, np.ndarray]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return one output array."""
+        return self.values[name]
+
+    def __len__(self) -> int:
+        """Return the number of bars."""
+        return self.time.shape[0]
+
+    @property
+    def first_valid(self) -> int:
+        """Position of the first bar with all outputs defined (len if none)."""
+        defined = np.ones(len(self), dtype=bool)
+        for array in self.values.values():
+            defined &= ~np.isnan(array)
+        positions = np.flatnonzero(defined)
+        return int(positions[0]) if positions.size else len(self)
+
+    def to_dataframe(self, dropna: bool = True) -> pd.DataFrame:
+        """Return the outputs as a DataFrame with a ``time`` column.
+
+        Args:
+            dropna: Drop the warm-up bars. Defaults to True.
+
+        Returns:
+            pd.DataFrame: One column per output.
+        """
+        start = self.first_valid if dropna else 0
+        frame = {"time": self.time[start:]}
+        frame.update({name: array[start:] for name, array in self.values.items()})
+        return pd.DataFrame(frame)
+
+
+class SmoothingState:
+    """Running state of ``kernels.smooth`` for constant-time updates."""
+
+    def __init__(self, period: int, alpha: float):
+        """Initialize an empty smoother.
+
+        Args:
+            period: Length of the seeding window.
+            alpha: Smoothing factor.
+        """
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.total = 0.0
+        self.value = np.nan
+
+    def prime(self, count: int, head: np.ndarray, last: float) -> "SmoothingState":
+        """Set the state reached after smoothing a column.
+
+        Args:
+            count: Number of valid input values (no leading NaN).
+            head: The first valid input values; only summed while fewer
+                than ``period`` values were seen.
+            last: Last smoothed value (NaN while seeding).
+
+        Returns:
+            SmoothingState: Self.
+        """
+        self.count = count
+        if count < self.period:
+            self.total = float(head[:count].sum())
+        else:
+            self.value = float(last)
+        return self
+
+    def step(self, value: float) -> float:
+        """Fold in one value and return the smoothed value (NaN while seeding)."""
+        self.count += 1
+        if self.count < self.period:
+            self.total += value
+            return np.nan
+        if self.count == self.period:
+            self.value = (self.total + value) / self.period
+        else:
+            self.value = self.alpha * value + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class WindowState:
+    """Running sum and sum of squares over the last ``period`` values.
+
+    Sums are taken relative to the first value seen, which keeps the
+    variance accurate for large price levels.
+    """
+
+    def __init__(self, period: int):
+        """Initialize an empty window.
+
+        Args:
+            period: Window length.
+        """
+        self.period = period
+        self.window: list[float] = []
+        self.head = 0
+        self.offset = np.nan
+        self.total = 0.0
+        self.squares = 0.0
+
+    def prime(self, values: np.ndarray) -> "WindowState":
+        """Fill the window with the tail of a column.
+
+        Args:
+            values: Input values.
+
+        Returns:
+            WindowState: Self.
+        """
+        for value in values[-self.period :].tolist():
+            self.step(value)
+        return self
+
+    def step(self, value: float) -> tuple[float, float]:
+        """Push one value and return the window mean and standard deviation.
+
+        Returns:
+            tuple[float, float]: Mean and population standard deviation, or
+                NaN while the window is not full.
+        """
+        if np.isnan(self.offset):
+            self.offset = value
+        shifted = value - self.offset
+        if len(self.window) == self.period:
+            dropped = self.window[self.head]
+            self.total -= dropped
+            self.squares -= dropped * dropped
+            self.window[self.head] = shifted
+            self.head = (self.head + 1) % self.period
+        else:
+            self.window.append(shifted)
+        self.total += shifted
+        self.squares += shifted * shifted
+        if len(self.window) < self.period:
+            return np.nan, np.nan
+        mean = self.total / self.period
+        variance = max(self.squares / self.period - mean * mean, 0.0)
+        return self.offset + mean, float(np.sqrt(variance))
+
+
+class Indicator(ABC):
+    """Base class of vectorized indicators.
+
+    Subclasses declare their input fields, implement the vectorized
+    ``_compute``, the state setup ``_prime`` and the single-bar ``_step``,
+    and build the styled series in ``_build_series``.
+
+    Attributes:
+        short_name: Name used in series titles.
+        input_fields: Input fields read from the data.
+        default_pane_id: Pane the series is added to by default.
+    """
+
+    short_name: ClassVar[str] = ""
+    input_fields: ClassVar[tuple[str, ...]] = ("close",)
+    default_pane_id: ClassVar[int] = 0
+
+    def __init__(self, column_mapping: Optional[Mapping[str, str]] = None):
+        """Initialize the indicator.
+
+        Args:
+            column_mapping: Maps the input fields ("time", "close", "high",
+                "low") to column names. Unmapped fields use their own name;
+                without a time column the DataFrame index is used.
+        """
+        self.column_mapping = dict(column_mapping or {})
+        self._state: Any = None
+        self._last_time: Optional[int] = None
+
+    @property
+    @abstractmethod
+    def params(self) -> tuple:
+        """Parameters identifying the indicator's output."""
+
+    @property
+    def label(self) -> str:
+        """Title of the indicator's series, e.g. "SMA 20"."""
+        return " ".join([self.short_name, *(f"{param:g}" for param in self.params)])
+
+    @staticmethod
+    def _check_period(period: int) -> int:
+        """Validate a lookback period and return it as an int."""
+        if not isinstance(period, (int, np.integer)) or isinstance(period, bool):
+            raise ValueValidationError("period", f"must be an integer, got {period!r}")
+        if period <= 0:
+            raise ValueValidationError.positive_value("period", period)
+        return int(period)
+
+    def _read(self, data: Any) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """Read the time and input columns of a table or pandas Series."""
+        if isinstance(data, pd.Series):
+            if self.input_fields != ("close",):
+                raise ValueValidationError(
+                    "data",
+                    f"must be a table with columns {list(self.input_fields)} for {self.short_name}",
+                )
+            times = normalize_time_array(pd.Series(data.index))
+            columns = {"close": data.to_numpy(dtype=np.float64)}
+        elif is_table(data):
+            names = column_names(data)
+            time_column = self.column_mapping.get("time", "time")
+            if time_column in names:
+                times = normalize_time_array(get_column(data, time_column))
+            elif isinstance(data, pd.DataFrame):
+                times = normalize_time_array(pd.Series(data.index))
+            else:
+                raise ValueValidationError("data", f"has no '{time_column}' column")
+            columns = {}
+            for field in self.input_fields:
+                column = self.column_mapping.get(field, field)
+                if column not in names:
+                    raise ValueValidationError("data", f"has no '{column}' column for {field}")
+                columns[field] = np.asarray(get_column(data, column), dtype=np.float64)
+        else:
+            raise ValueValidationError(
+                "data", f"must be a DataFrame, Arrow table or pandas Series, got {type(data)}"
+            )
+
+        for field, values in columns.items():
+            if np.isnan(values).any():
+                raise ValueValidationError(field, "contains NaN values; drop or fill them first")
+        return times, columns
+
+    def compute(self, data: Any) -> IndicatorResult:
+        """Compute the indicator over all bars of a table.
+
+        Outputs are cached by input content, indicator and parameters. The
+        running state is reset to the last bar, ready for ``update``.
+
+        Args:
+            data: pandas DataFrame, Arrow table or Polars DataFrame with the
+                input columns, or a pandas Series of closes indexed by time.
+
+        Returns:
+            IndicatorResult: Outputs aligned with the input bars.
+
+        Raises:
+            ValueValidationError: If a column is missing or contains NaN.
+        """
+        times, columns = self._read(data)
+        cache = get_cache()
+        key = cache.make_key(fingerprint(times, columns), type(self).__qualname__, self.params)
+        values = cache.get(key)
+        if values is None:
+            values = cache.put(key, self._compute(columns))
+
+        self._state = self._prime(columns, values)
+        self._last_time = int(times[-1]) if times.shape[0] else None
+        public = {name: array for name, array in values.items() if not name.startswith("_")}
+        return IndicatorResult(times, public)
+
+    def update(
+        self,
+        time: Any,
+        close: float,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+    ) -> dict[str, float]:
+        """Fold in one appended bar in constant time.
+
+        Starts from an empty state when ``compute`` has not been called.
+
+        Args:
+            time: Time of the new bar; must be after the last bar.
+            close: Close of the new bar.
+            high: High of the new bar, required by range-based indicators.
+            low: Low of the new bar, required by range-based indicators.
+
+        Returns:
+            dict[str, float]: ``time`` (UNIX seconds) and the outputs for the
+                new bar; outputs are NaN during the warm-up.
+
+        Raises:
+            ValueValidationError: If the bar is not after the last one or a
+                required price is missing.
+        """
+        seconds = int(normalize_time_array([time])[0])
+        if self._last_time is not None and seconds <= self._last_time:
+            raise ValueValidationError("time", "must be after the last bar")
+        bar = {"close": close, "high": high, "low": low}
+        for field in self.input_fields:
+            if bar[field] is None:
+                raise ValueValidationError(field, f"is required by {self.short_name}")
+
+        if self._state is None:
+            self._state = self._empty_state()
+        values = self._step(self._state, {field: float(bar[field]) for field in self.input_fields})
+        self._last_time = seconds
+        return {"time": seconds, **values}
+
+    def series(self, data: Any, pane_id: Optional[int] = None) -> Series:
+        """Compute the indicator and return it as a styled series.
+
+        Warm-up bars are left out of the series.
+
+        Args:
+            data: Input data, as for ``compute``.
+            pane_id: Pane to draw in. Defaults to the price pane for overlays
+                and to pane 1 for oscillators.
+
+        Returns:
+            Series: Series ready to add to a chart.
+        """
+        frame = self.compute(data).to_dataframe()
+        return self._build_series(frame, self.default_pane_id if pane_id is None else pane_id)
+
+    @abstractmethod
+    def _compute(self, columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Compute the outputs.
+
+        Names starting with an underscore hold extra state for ``_prime``
+        and are left out of the result.
+        """
+
+    @abstractmethod
+    def _prime(self, columns: dict[str, np.ndarray], values: dict[str, np.ndarray]) -> Any:
+        """Return the running state after the last bar."""
+
+    @abstractmethod
+    def _empty_state(self) -> Any:
+        """Return the running state before any bar."""
+
+    @abstractmethod
+    def _step(self, state: Any, bar: dict[str, float]) -> dict[str, float]:
+        """Fold one bar into the state and return its outputs."""
+
+    @abstractmethod
+    def _build_series(self, frame: pd.DataFrame, pane_id: int) -> Series:
+        """Build the styled series from the output DataFrame."""
@@ -0,0 +1,318 @@
+"""Built-in indicators: SMA, EMA, Bollinger Bands, ATR and RSI.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro import Chart, CandlestickSeries
+    from streamlit_lightweight_charts_pro.indicators import RSI, SMA, BollingerBands
+
+    chart = Chart(series=CandlestickSeries(df))
+    chart.add_series(SMA(20).series(df))
+    chart.add_series(BollingerBands(20, 2).series(df))
+    chart.add_series(RSI(14).series(df))  # pane 1, with 30/70 levels
+
+    rsi = RSI(14)
+    rsi.compute(df)
+    rsi.update("2024-06-03", close=187.2)  # {"time": ..., "value": ...}
+    ```
+"""
+
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.charts.options.line_options import LineOptions
+from lightweight_charts_pro.charts.options.price_line_options import PriceLineOptions
+from lightweight_charts_pro.type_definitions.enums import LineStyle
+
+from streamlit_lightweight_charts_pro.charts.series import BandSeries, LineSeries
+from streamlit_lightweight_charts_pro.indicators import kernels
+from streamlit_lightweight_charts_pro.indicators.base import (
+    Indicator,
+    SmoothingState,
+    WindowState,
+)
+
+# Default indicator colors
+SMA_COLOR = "#2962FF"
+EMA_COLOR = "#FF6D00"
+BOLLINGER_COLOR = "#2196F3"
+BOLLINGER_FILL_COLOR = "rgba(33, 150, 243, 0.08)"
+ATR_COLOR = "#AB47BC"
+RSI_COLOR = "#7E57C2"
+RSI_OVERBOUGHT_COLOR = "#EF5350"
+RSI_OVERSOLD_COLOR = "#26A69A"
+
+
+def _line_series(frame: pd.DataFrame, pane_id: int, title: str, color: str) -> LineSeries:
+    """Build a titled line series from a frame with time and value columns."""
+    series = LineSeries(frame, column_mapping={"time": "time", "value": "value"}, pane_id=pane_id)
+    series.line_options = LineOptions(color=color, line_width=2)
+    series.title = title
+    return series
+
+
+class SMA(Indicator):
+    """Simple moving average of closes."""
+
+    short_name = "SMA"
+
+    def __init__(self, period: int = 20, column_mapping: Optional[Mapping[str, str]] = None):
+        """Initialize the indicator.
+
+        Args:
+            period: Window length. Defaults to 20.
+            column_mapping: Input column names, see ``Indicator``.
+        """
+        super().__init__(column_mapping)
+        self.period = self._check_period(period)
+
+    @property
+    def params(self) -> tuple:
+        return (self.period,)
+
+    def _compute(self, columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        return {"value": kernels.sma(columns["close"], self.period)}
+
+    def _prime(self, columns: dict[str, np.ndarray], values: dict[str, np.ndarray]) -> Any:
+        return WindowState(self.period).prime(columns["close"])
+
+    def _empty_state(self) -> WindowState:
+        return WindowState(self.period)
+
+    def _step(self, state: WindowState, bar: dict[str, float]) -> dict[str, float]:
+        mean, _ = state.step(bar["close"])
+        return {"value": mean}
+
+    def _build_series(self, frame: pd.DataFrame, pane_id: int) -> LineSeries:
+        return _line_series(frame, pane_id, self.label, SMA_COLOR)
+
+
+class EMA(Indicator):
+    """Exponential moving average of closes, seeded with the first SMA."""
+
+    short_name = "EMA"
+
+    def __init__(self, period: int = 20, column_mapping: Optional[Mapping[str, str]] = None):
+        """Initialize the indicator.
+
+        Args:
+            period: Span; the smoothing factor is 2 / (period + 1). Defaults to 20.
+            column_mapping: Input column names, see ``Indicator``.
+        """
+        super().__init__(column_mapping)
+        self.period = self._check_period(period)
+
+    @property
+    def params(self) -> tuple:
+        return (self.period,)
+
+    def _compute(self, columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        return {"value": kernels.ema(columns["close"], self.period)}
+
+    def _prime(self, columns: dict[str, np.ndarray], values: dict[str, np.ndarray]) -> Any:
+        close, value = columns["close"], values["value"]
+        last = value[-1] if value.size else np.nan
+        return self._empty_state().prime(close.shape[0], close, last)
+
+    def _empty_state(self) -> SmoothingState:
+        return SmoothingState(self.period, 2.0 / (self.period + 1))
+
+    def _step(self, state: SmoothingState, bar: dict[str, float]) -> dict[str, float]:
+        return {"value": state.step(bar["close"])}
+
+    def _build_series(self, frame: pd.DataFrame, pane_id: int) -> LineSeries:
+        return _line_series(frame, pane_id, self.label, EMA_COLOR)
+
+
+class BollingerBands(Indicator):
+    """Bollinger Bands: SMA of closes plus/minus a multiple of their deviation."""
+
+    short_name = "BB"
+
+    def __init__(
+        self,
+        period: int = 20,
+        multiplier: float = 2.0,
+        column_mapping: Optional[Mapping[str, str]] = None,
+    ):
+        """Initialize the indicator.
+
+        Args:
+            period: Window length. Defaults to 20.
+            multiplier: Number of standard deviations of the bands. Defaults to 2.
+            column_mapping: Input column names, see ``Indicator``.
+        """
+        super().__init__(column_mapping)
+        self.period = self._check_period(period)
+        self.multiplier = float(multiplier)
+
+    @property
+    def params(self) -> tuple:
+        return (self.period, self.multiplier)
+
+    def _compute(self, columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        close = columns["close"]
+        middle = kernels.sma(close, self.period)
+        width = self.multiplier * kernels.rolling_std(close, self.period)
+        return {"upper": middle + width, "middle": middle, "lower": middle - width}
+
+    def _prime(self, columns: dict[str, np.ndarray], values: dict[str, np.ndarray]) -> Any:
+        return WindowState(self.period).prime(columns["close"])
+
+    def _empty_state(self) -> WindowState:
+        return WindowState(self.period)
+
+    def _step(self, state: WindowState, bar: dict[str, float]) -> dict[str, float]:
+        mean, deviation = state.step(bar["close"])
+        width = self.multiplier * deviation
+        return {"upper": mean + width, "middle": mean, "lower": mean - width}
+
+    def _build_series(self, frame: pd.DataFrame, pane_id: int) -> BandSeries:
+        series = BandSeries(
+            frame,
+            column_mapping={name: name for name in ("time", "upper", "middle", "lower")},
+            price_scale_id="right",
+            pane_id=pane_id,
+        )
+        series.upper_line = LineOptions(color=BOLLINGER_COLOR, line_width=1)
+        series.middle_line = LineOptions(
+            color=BOLLINGER_COLOR, line_width=1, line_style=LineStyle.DASHED
+        )
+        series.lower_line = LineOptions(color=BOLLINGER_COLOR, line_width=1)
+        series.upper_fill_color = BOLLINGER_FILL_COLOR
+        series.lower_fill_color = BOLLINGER_FILL_COLOR
+        series.title = self.label
+        return series
+
+
+class ATR(Indicator):
+    """Average true range with Wilder's smoothing."""
+
+    short_name = "ATR"
+    input_fields = ("high", "low", "close")
+    default_pane_id = 1
+
+    def __init__(self, period: int = 14, column_mapping: Optional[Mapping[str, str]] = None):
+        """Initialize the indicator.
+
+        Args:
+            period: Smoothing period. Defaults to 14.
+            column_mapping: Input column names, see ``Indicator``.
+        """
+        super().__init__(column_mapping)
+        self.period = self._check_period(period)
+
+    @property
+    def params(self) -> tuple:
+        return (self.period,)
+
+    def _compute(self, columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        high, low, close = columns["high"], columns["low"], columns["close"]
+        return {"value": kernels.atr(high, low, close, self.period)}
+
+    def _prime(self, columns: dict[str, np.ndarray], values: dict[str, np.ndarray]) -> Any:
+        close = columns["close"]
+        state = self._empty_state()
+        if close.shape[0]:
+            head = slice(0, self.period)
+            ranges = kernels.true_range(columns["high"][head], columns["low"][head], close[head])
+            state["range"].prime(close.shape[0], ranges, values["value"][-1])
+            state["close"] = float(close[-1])
+        return state
+
+    def _empty_state(self) -> dict[str, Any]:
+        return {"range": SmoothingState(self.period, 1.0 / self.period), "close": np.nan}
+
+    def _step(self, state: dict[str, Any], bar: dict[str, float]) -> dict[str, float]:
+        high, low, previous = bar["high"], bar["low"], state["close"]
+        true_range = high - low
+        if not np.isnan(previous):
+            true_range = max(true_range, abs(high - previous), abs(low - previous))
+        state["close"] = bar["close"]
+        return {"value": state["range"].step(true_range)}
+
+    def _build_series(self, frame: pd.DataFrame, pane_id: int) -> LineSeries:
+        return _line_series(frame, pane_id, self.label, ATR_COLOR)
+
+
+class RSI(Indicator):
+    """Relative strength index with Wilder's smoothing."""
+
+    short_name = "RSI"
+    default_pane_id = 1
+
+    def __init__(
+        self,
+        period: int = 14,
+        overbought: float = 70.0,
+        oversold: float = 30.0,
+        column_mapping: Optional[Mapping[str, str]] = None,
+    ):
+        """Initialize the indicator.
+
+        Args:
+            period: Smoothing period. Defaults to 14.
+            overbought: Level of the upper reference line. Defaults to 70.
+            oversold: Level of the lower reference line. Defaults to 30.
+            column_mapping: Input column names, see ``Indicator``.
+        """
+        super().__init__(column_mapping)
+        self.period = self._check_period(period)
+        self.overbought = overbought
+        self.oversold = oversold
+
+    @property
+    def params(self) -> tuple:
+        return (self.period,)
+
+    def _compute(self, columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        gain, loss = kernels.rsi_averages(columns["close"], self.period)
+        # Final averages, the state behind constant-time updates
+        value = kernels.rsi_from_averages(gain, loss)
+        return {"value": value, "_gain": gain[-1:], "_loss": loss[-1:]}
+
+    def _prime(self, columns: dict[str, np.ndarray], values: dict[str, np.ndarray]) -> Any:
+        close = columns["close"]
+        state = self._empty_state()
+        if close.shape[0]:
+            changes = np.diff(close[: self.period + 1])
+            count = close.shape[0] - 1
+            state["gain"].prime(count, np.maximum(changes, 0.0), values["_gain"][0])
+            state["loss"].prime(count, np.maximum(-changes, 0.0), values["_loss"][0])
+            state["close"] = float(close[-1])
+        return state
+
+    def _empty_state(self) -> dict[str, Any]:
+        alpha = 1.0 / self.period
+        return {
+            "gain": SmoothingState(self.period, alpha),
+            "loss": SmoothingState(self.period, alpha),
+            "close": np.nan,
+        }
+
+    def _step(self, state: dict[str, Any], bar: dict[str, float]) -> dict[str, float]:
+        previous = state["close"]
+        state["close"] = bar["close"]
+        if np.isnan(previous):
+            return {"value": np.nan}
+        change = bar["close"] - previous
+        gain = state["gain"].step(max(change, 0.0))
+        loss = state["loss"].step(max(-change, 0.0))
+        value = kernels.rsi_from_averages(np.array([gain]), np.array([loss]))[0]
+        return {"value": float(value)}
+
+    def _build_series(self, frame: pd.DataFrame, pane_id: int) -> LineSeries:
+        series = _line_series(frame, pane_id, self.label, RSI_COLOR)
+        levels = ((self.overbought, RSI_OVERBOUGHT_COLOR), (self.oversold, RSI_OVERSOLD_COLOR))
+        for level, color in levels:
+            series.add_price_line(
+                PriceLineOptions(
+                    price=level,
+                    color=color,
+                    line_style=LineStyle.DASHED,
+                    axis_label_visible=True,
+                    title=f"{level:g}",
+                )
+            )
+        return series
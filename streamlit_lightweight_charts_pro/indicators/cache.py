@@ -0,0 +1,380 @@
+"""Process-wide cache of computed indicator arrays.
+
+Entries are keyed by ``(input fingerprint, indicator name, params)`` and hold
+a dict of NumPy arrays. All Streamlit sessions of a server share one process,
+so they share the default cache: the same indicator over the same data is
+computed once, whichever session asks first.
+
+Eviction is least-recently-used under two limits, an entry count and a byte
+budget. With a spill directory, evicted entries are written as ``.npy``
+files instead of being dropped, and later hits map them back with
+``np.load(mmap_mode="r")`` so only the pages actually read are loaded. Since
+spill files are named by key digest, processes pointing at the same
+directory also share them.
+
+Example:
+    ```python
+    from streamlit_lightweight_charts_pro.indicators import cached_indicator, configure_cache
+
+    configure_cache(max_bytes=512 * 2**20, spill_dir="/tmp/indicator-cache")
+
+    @cached_indicator()
+    def vwap(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        return np.cumsum(close * volume) / np.cumsum(volume)
+    ```
+"""
+
+import functools
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+from lightweight_charts_pro.exceptions import ValueValidationError
+from lightweight_charts_pro.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default limits of the process-wide cache
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# Array name used for functions returning a single array
+_SINGLE = "__value__"
+
+
+def _update_digest(digest: Any, value: Any) -> None:
+    """Feed one value (array, pandas object or scalar) into a digest."""
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(f"nd{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).view(np.uint8))
+    elif isinstance(value, (pd.Series, pd.DataFrame, pd.Index)):
+        digest.update(f"pd{type(value).__name__}".encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().view(np.uint8))
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(value.columns.tolist()).encode())
+    elif isinstance(value, Mapping):
+        digest.update(b"map")
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"seq{len(value)}".encode())
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+def fingerprint(*values: Any) -> str:
+    """Return a digest identifying the content of arrays and other values.
+
+    NumPy arrays are hashed by dtype, shape and raw bytes, pandas objects by
+    their values and index; other values by ``repr``.
+
+    Args:
+        *values: Values to identify.
+
+    Returns:
+        str: 32-character hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters of an ``IndicatorCache``.
+
+    Attributes:
+        hits: Lookups served from memory.
+        disk_hits: Lookups served from spill files.
+        misses: Lookups not found.
+        evictions: Entries removed from memory.
+        entries: Entries held in memory.
+        bytes: Bytes held in memory.
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class IndicatorCache:
+    """LRU cache of indicator arrays with a byte budget and optional disk spill.
+
+    Cached arrays are read-only, since every caller receives the same
+    objects. The cache is thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        spill_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Largest number of entries held in memory.
+            max_bytes: Largest total size of the arrays held in memory.
+            spill_dir: Directory receiving evicted entries as ``.npy`` files.
+                Defaults to None (evicted entries are dropped).
+
+        Raises:
+            ValueValidationError: If a limit is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueValidationError.positive_value("max_entries", max_entries)
+        if max_bytes <= 0:
+            raise ValueValidationError.positive_value("max_bytes", max_bytes)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._entries: OrderedDict[str, dict[str, np.ndarray]] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.RLock()
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(input_fingerprint: str, name: str, params: Any = ()) -> str:
+        """Build the key of an indicator result.
+
+        Args:
+            input_fingerprint: Fingerprint of the input data.
+            name: Indicator name.
+            params: Indicator parameters.
+
+        Returns:
+            str: Key digest, also used as the spill file name.
+        """
+        return fingerprint(input_fingerprint, name, params)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                **{**vars(self._stats), "entries": len(self._entries), "bytes": self._bytes}
+            )
+
+    def get(self, key: str) -> Optional[dict[str, np.ndarray]]:
+        """Return the arrays stored under a key, or None.
+
+        Args:
+            key: Key from ``make_key``.
+
+        Returns:
+            Optional[dict[str, np.ndarray]]: Read-only arrays; memory-mapped
+                when served from a spill file.
+        """
+        with self._lock:
+            arrays = self._entries.get(key)
+            if arrays is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return arrays
+
+            arrays = self._load_spilled(key)
+            if arrays is not None:
+                self._stats.disk_hits += 1
+            else:
+                self._stats.misses += 1
+            return arrays
+
+    def put(self, key: str, arrays: Mapping[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Store arrays under a key, evicting older entries as needed.
+
+        The arrays are copied and the copies marked read-only, so the
+        caller's arrays stay writeable and later changes to them do not reach
+        the cache. An entry larger than the byte budget is spilled (or
+        dropped) right away.
+
+        Args:
+            key: Key from ``make_key``.
+            arrays: Arrays by name.
+
+        Returns:
+            dict[str, np.ndarray]: The stored arrays.
+        """
+        stored = {}
+        for name, array in arrays.items():
+            array = np.array(array, copy=True)
+            array.setflags(write=False)
+            stored[name] = array
+        size = sum(array.nbytes for array in stored.values())
+
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                self._stats.evictions += 1
+                if self.spill_dir is not None:
+                    self._spill(key, stored)
+                return stored
+            self._entries[key] = stored
+            self._sizes[key] = size
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._evict()
+        return stored
+
+    def clear(self, spilled: bool = False) -> None:
+        """Drop all entries held in memory.
+
+        Args:
+            spilled: Also delete the spill files. Defaults to False.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self._stats = CacheStats()
+            if spilled and self.spill_dir is not None:
+                for path in self.spill_dir.iterdir():
+                    shutil.rmtree(path, ignore_errors=True)
+
+    def _discard(self, key: str) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._bytes -= self._sizes.pop(key)
+
+    def _evict(self) -> None:
+        key, arrays = self._entries.popitem(last=False)
+        self._bytes -= self._sizes.pop(key)
+        self._stats.evictions += 1
+        if self.spill_dir is not None:
+            self._spill(key, arrays)
+
+    def _spill(self, key: str, arrays: Mapping[str, np.ndarray]) -> None:
+        """Write an entry as one ``.npy`` file per array, atomically."""
+        target = self.spill_dir / key
+        if target.exists() or any(array.dtype == object for array in arrays.values()):
+            return
+        staging = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=self.spill_dir))
+        try:
+            for index, array in enumerate(arrays.values()):
+                np.save(staging / f"{index}.npy", array, allow_pickle=False)
+            (staging / "names").write_text("\n".join(arrays), encoding="utf-8")
+            os.replace(staging, target)
+        except OSError as exc:
+            logger.warning("Could not spill indicator cache entry %s: %s", key, exc)
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _load_spilled(self, key: str) -> Optional[dict[str, np.ndarray]]:
+        if self.spill_dir is None:
+            return None
+        entry = self.spill_dir / key
+        try:
+            names = (entry / "names").read_text(encoding="utf-8").split("\n")
+            return {
+                name: np.load(entry / f"{index}.npy", mmap_mode="r", allow_pickle=False)
+                for index, name in enumerate(names)
+            }
+        except (OSError, ValueError):
+            return None
+
+
+_default_cache = IndicatorCache()
+_default_lock = threading.Lock()
+
+
+def get_cache() -> IndicatorCache:
+    """Return the process-wide indicator cache."""
+    return _default_cache
+
+
+def configure_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    spill_dir: Optional[Union[str, Path]] = None,
+) -> IndicatorCache:
+    """Replace the process-wide indicator cache.
+
+    Args:
+        max_entries: Largest number of entries held in memory.
+        max_bytes: Largest total size of the arrays held in memory.
+        spill_dir: Directory receiving evicted entries as ``.npy`` files.
+
+    Returns:
+        IndicatorCache: The new process-wide cache.
+    """
+    global _default_cache
+    with _default_lock:
+        _default_cache = IndicatorCache(max_entries, max_bytes, spill_dir)
+    return _default_cache
+
+
+def _pack(result: Any) -> dict[str, np.ndarray]:
+    """Convert a function result to named arrays."""
+    if isinstance(result, Mapping):
+        return {str(name): np.asarray(array) for name, array in result.items()}
+    if isinstance(result, tuple):
+        return {f"{_SINGLE}{index}": np.asarray(array) for index, array in enumerate(result)}
+    if isinstance(result, np.ndarray):
+        return {_SINGLE: result}
+    raise ValueValidationError(
+        "cached_indicator",
+        f"function must return an array, a tuple or a dict of arrays, got {type(result)}",
+    )
+
+
+def _unpack(arrays: dict[str, np.ndarray]) -> Any:
+    """Convert named arrays back to the shape returned by the function."""
+    if _SINGLE in arrays:
+        return arrays[_SINGLE]
+    if arrays and all(name.startswith(_SINGLE) for name in arrays):
+        return tuple(arrays[f"{_SINGLE}{index}"] for index in range(len(arrays)))
+    return dict(arrays)
+
+
+def cached_indicator(
+    name: Optional[str] = None,
+    cache: Optional[IndicatorCache] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache the results of an indicator function.
+
+    The decorated function must return a NumPy array, a tuple of arrays or
+    a dict of arrays. Array and pandas arguments are fingerprinted by
+    content, other arguments by ``repr``. Results are returned read-only.
+
+    Args:
+        name: Name in the cache key. Defaults to the function's qualified name.
+        cache: Cache to use. Defaults to the process-wide cache at call time.
+
+    Returns:
+        Callable: Decorator.
+    """
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        key_name = name or f"{function.__module__}.{function.__qualname__}"
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            target = cache or get_cache()
+            key = target.make_key(fingerprint(args, kwargs), key_name)
+            arrays = target.get(key)
+            if arrays is None:
+                arrays = target.put(key, _pack(function(*args, **kwargs)))
+            return _unpack(arrays)
+
+        return wrapper
+
+    return decorator
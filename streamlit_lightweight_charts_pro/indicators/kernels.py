@@ -0,0 +1,135 @@
+"""Vectorized indicator kernels.
+
+Each kernel takes float64 NumPy arrays and returns an array of the same
+length. Positions before the first complete window (the warm-up) are NaN.
+
+Window statistics are computed from cumulative sums, so a rolling mean or
+deviation costs O(n) regardless of the period. Recursive smoothing (EMA and
+Wilder's moving average) is delegated to pandas' compiled ``ewm`` with
+``adjust=False``, seeded with the simple average of the first window, which
+is the conventional definition used by charting platforms.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _window_sums(values: np.ndarray, period: int) -> np.ndarray:
+    """Return the sums of all complete windows (length n - period + 1)."""
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    return cumulative[period:] - cumulative[:-period]
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average.
+
+    Args:
+        values: Input values.
+        period: Window length.
+
+    Returns:
+        np.ndarray: Average of the last ``period`` values at each position.
+    """
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= period:
+        out[period - 1 :] = _window_sums(values, period) / period
+    return out
+
+
+def rolling_std(values: np.ndarray, period: int) -> np.ndarray:
+    """Rolling population standard deviation.
+
+    Values are centered on their overall mean before squaring, which keeps
+    the sum-of-squares formula accurate for large price levels.
+
+    Args:
+        values: Input values.
+        period: Window length.
+
+    Returns:
+        np.ndarray: Standard deviation of the last ``period`` values.
+    """
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= period:
+        centered = values - values.mean()
+        sums = _window_sums(centered, period)
+        squares = _window_sums(centered * centered, period)
+        variance = (squares - sums * sums / period) / period
+        out[period - 1 :] = np.sqrt(np.maximum(variance, 0.0))
+    return out
+
+
+def smooth(values: np.ndarray, period: int, alpha: float, start: int = 0) -> np.ndarray:
+    """Exponential smoothing seeded with a simple average.
+
+    The first output, at ``start + period - 1``, is the mean of the first
+    ``period`` values from ``start``; after that
+    ``out[i] = alpha * values[i] + (1 - alpha) * out[i - 1]``.
+
+    Args:
+        values: Input values.
+        period: Length of the seeding window.
+        alpha: Smoothing factor in (0, 1].
+        start: Position of the first valid input value.
+
+    Returns:
+        np.ndarray: Smoothed values.
+    """
+    out = np.full(values.shape[0], np.nan)
+    first = start + period - 1
+    if values.shape[0] <= first:
+        return out
+    seeded = values[first:].copy()
+    seeded[0] = values[start : first + 1].mean()
+    out[first:] = pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average with smoothing factor 2 / (period + 1)."""
+    return smooth(values, period, 2.0 / (period + 1))
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range; the first bar, having no previous close, uses high - low."""
+    ranges = high - low
+    if close.shape[0] > 1:
+        previous = close[:-1]
+        ranges[1:] = np.maximum(
+            ranges[1:],
+            np.maximum(np.abs(high[1:] - previous), np.abs(low[1:] - previous)),
+        )
+    return ranges
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Average true range using Wilder's smoothing (alpha = 1 / period)."""
+    return smooth(true_range(high, low, close), period, 1.0 / period)
+
+
+def rsi_from_averages(gain: np.ndarray, loss: np.ndarray) -> np.ndarray:
+    """Relative strength index from average gains and losses (0 to 100)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + gain / loss)
+    # No losses in the window: fully overbought
+    out[(loss == 0) & ~np.isnan(gain)] = 100.0
+    return out
+
+
+def rsi_averages(close: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray]:
+    """Wilder-smoothed average gains and losses of close-to-close changes.
+
+    The first values are at position ``period``, the first bar with
+    ``period`` price changes behind it.
+    """
+    changes = np.diff(close, prepend=np.nan)
+    alpha = 1.0 / period
+    return (
+        smooth(np.maximum(changes, 0.0), period, alpha, start=1),
+        smooth(np.maximum(-changes, 0.0), period, alpha, start=1),
+    )
+
+
+def rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """Relative strength index using Wilder's smoothing."""
+    return rsi_from_averages(*rsi_averages(close, period))
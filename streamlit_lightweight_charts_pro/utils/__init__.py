@@ -33,6 +33,9 @@ Available Utilities:
 
     Time Utilities:
         - normalize_time: Normalize various time formats
+        - normalize_time_array: Normalize whole time columns to epoch seconds
+        - detect_epoch_unit: Detect s/ms/us/ns epoch units from magnitude
+        - shift_to_timezone: Shift epoch seconds to a display timezone
 
     Performance Profiling:
         - Profiler: Performance profiling class
@@ -67,9 +70,10 @@ Example:
                 pass
 
 Note:
-    All utilities in this module are imported from the lightweight_charts_pro
-    core package. This ensures consistent behavior and maintains a single
-    source of truth for utility implementations.
+    Apart from the vectorized time utilities, all utilities in this module are
+    imported from the lightweight_charts_pro core package. This ensures
+    consistent behavior and maintains a single source of truth for utility
+    implementations.
 
 For detailed documentation on each utility, refer to the lightweight_charts_pro
 package documentation.
@@ -107,7 +111,13 @@ from lightweight_charts_pro.utils.profiler import (
 )
 
 # Local Imports
-# (None - this module only re-exports utilities from core)
+# Vectorized time normalization (defined in the data package, next to the
+# column-backed ingestion that uses it)
+from streamlit_lightweight_charts_pro.data.time_utils import (
+    detect_epoch_unit,  # Detect the unit of numeric epoch columns
+    normalize_time_array,  # Normalize whole time columns to int64 epoch seconds
+    shift_to_timezone,  # Shift epoch seconds to display wall-clock time
+)
 
 # Export all public utilities
 # Organized alphabetically for easy reference
@@ -132,7 +142,10 @@ __all__ = [
     "chainable_property",
     "validated_field",
     # Time utilities
+    "detect_epoch_unit",
     "normalize_time",
+    "normalize_time_array",
+    "shift_to_timezone",
     # Profiling
     "Profiler",
     "profile_method",